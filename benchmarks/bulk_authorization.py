@@ -0,0 +1,161 @@
+"""
+Batch authorization throughput of the role × permission matrix.
+
+Generates a synthetic graph in a temporary SQLite database, loads it once
+through the repositories and compiles it with each available engine (NumPy
+and pure Python), then checks `--pairs` random (role, permission) pairs with
+`check_batch` (given as arrays to the NumPy engine). The one-pair-at-a-time
+authorization engine is measured on the same pairs as a baseline, and every
+engine must agree with it.
+
+Usage:
+	python benchmarks/bulk_authorization.py
+	python benchmarks/bulk_authorization.py --scale large --pairs 1000000 --json bulk.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from dataset import SCALES, DatasetSpec, generate  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from vexen_rbac.application.service.authorization_engine import (  # noqa: E402
+	CompiledPermissions,
+)
+from vexen_rbac.application.service.bulk_authorizer import (  # noqa: E402
+	PermissionMatrix,
+	numpy_available,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories import (  # noqa: E402
+	PermissionGroupRepository,
+	PermissionRepository,
+	RoleRepository,
+)
+
+
+@dataclass
+class EngineResult:
+	"""Cost of one engine over the same batch."""
+
+	engine: str
+	compile_ms: float
+	check_ms: float
+	pairs_per_second: float
+	granted: int
+
+
+def timed(function, repeat: int) -> tuple[float, object]:
+	"""Best wall time in milliseconds over `repeat` calls, and the last result."""
+	best = float("inf")
+	for _ in range(repeat):
+		start = time.perf_counter()
+		result = function()
+		best = min(best, time.perf_counter() - start)
+	return best * 1000, result
+
+
+async def run(spec: DatasetSpec, pairs: int, repeat: int) -> list[EngineResult]:
+	with tempfile.TemporaryDirectory() as tmp:
+		url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+		engine = create_async_engine(url)
+		await generate(engine, spec)
+		try:
+			async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+				roles = await RoleRepository(session).list()
+				permission_groups = await PermissionGroupRepository(session).list()
+				permissions = await PermissionRepository(session).list()
+		finally:
+			await engine.dispose()
+
+	rng = random.Random(spec.seed)
+	role_ids = [rng.choice(roles).id for _ in range(pairs)]
+	permission_ids = [rng.choice(permissions).id for _ in range(pairs)]
+	names = {p.id: p.name for p in permissions}
+
+	results = []
+	compile_ms, compiled = timed(
+		lambda: CompiledPermissions.compile(roles, permission_groups, permissions), repeat
+	)
+	check_ms, expected = timed(
+		lambda: [
+			compiled.check(role_id, names[permission_id])
+			for role_id, permission_id in zip(role_ids, permission_ids, strict=True)
+		],
+		repeat,
+	)
+	results.append(
+		EngineResult(
+			"authorization engine", compile_ms, check_ms, pairs / check_ms * 1000, sum(expected)
+		)
+	)
+
+	engines = [("matrix (numpy)", True)] if numpy_available() else []
+	engines.append(("matrix (python)", False))
+	for label, use_numpy in engines:
+		compile_ms, matrix = timed(
+			lambda use_numpy=use_numpy: PermissionMatrix.compile(
+				roles, permission_groups, permissions, use_numpy=use_numpy
+			),
+			repeat,
+		)
+		batch = (role_ids, permission_ids)
+		if use_numpy:
+			import numpy
+
+			batch = (numpy.asarray(role_ids), numpy.asarray(permission_ids))
+		check_ms, decisions = timed(
+			lambda matrix=matrix, batch=batch: matrix.check_batch(*batch), repeat
+		)
+		if [bool(decision) for decision in decisions] != expected:
+			raise AssertionError(f"{label} disagrees with the authorization engine")
+		results.append(
+			EngineResult(label, compile_ms, check_ms, pairs / check_ms * 1000, int(sum(decisions)))
+		)
+	return results
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--scale", choices=sorted(SCALES), default="default")
+	parser.add_argument(
+		"--pairs", type=int, default=200_000, help="(role, permission) pairs per batch"
+	)
+	parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+	parser.add_argument("--json", help="Write results as JSON to this path")
+	args = parser.parse_args()
+
+	spec = SCALES[args.scale]
+	results = asyncio.run(run(spec, args.pairs, args.repeat))
+
+	print(f"{'engine':<24} {'compile ms':>12} {'check ms':>12} {'pairs/s':>14} {'granted':>10}")
+	for r in results:
+		print(
+			f"{r.engine:<24} {r.compile_ms:>12.1f} {r.check_ms:>12.1f}"
+			f" {r.pairs_per_second:>14.0f} {r.granted:>10}"
+		)
+
+	if args.json:
+		with open(args.json, "w") as f:
+			json.dump(
+				{
+					"spec": vars(spec),
+					"pairs": args.pairs,
+					"numpy": numpy_available(),
+					"results": [vars(r) for r in results],
+				},
+				f,
+				indent=2,
+			)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,144 @@
+"""
+Synthetic RBAC dataset generator shared by the benchmarks.
+
+Rows are inserted with Core multi-row INSERTs straight into the tables so
+seeding large graphs stays fast and independent of the code being measured.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models import (
+	Base,
+	PermissionGroupModel,
+	PermissionGroupPermissionAssociation,
+	PermissionModel,
+	RoleModel,
+	RolePermissionAssociation,
+	RolePermissionGroupAssociation,
+	UserRoleAssociation,
+)
+
+CATEGORIES = ["users", "tickets", "roles", "reports", "settings", "dashboard"]
+BATCH_SIZE = 5_000
+
+
+@dataclass
+class DatasetSpec:
+	"""Size of the generated graph."""
+
+	permissions: int = 2_000
+	roles: int = 200
+	groups: int = 50
+	permissions_per_role: int = 40
+	groups_per_role: int = 3
+	permissions_per_group: int = 60
+	users: int = 2_000
+	roles_per_user: int = 2
+	seed: int = 42
+
+
+# Named sizes selectable with --scale; "large" has dense role and group associations
+SCALES = {
+	"default": DatasetSpec(),
+	"large": DatasetSpec(
+		permissions=50_000,
+		roles=5_000,
+		groups=500,
+		permissions_per_role=200,
+		groups_per_role=10,
+		permissions_per_group=400,
+		users=100_000,
+		roles_per_user=3,
+	),
+}
+
+
+async def generate(engine: AsyncEngine, spec: DatasetSpec) -> None:
+	"""
+	Create the schema and fill it with a synthetic graph.
+
+	Args:
+		engine: Engine of an empty database
+		spec: Size of the graph to generate
+	"""
+	rng = random.Random(spec.seed)
+	base_time = datetime(2024, 1, 1)
+
+	permissions = [
+		{
+			"id": i,
+			"name": f"{CATEGORIES[i % len(CATEGORIES)]}.action_{i}",
+			"display_name": f"Permission {i}",
+			"category": CATEGORIES[i % len(CATEGORIES)],
+			"created_at": base_time + timedelta(seconds=i),
+		}
+		for i in range(1, spec.permissions + 1)
+	]
+	groups = [
+		{
+			"id": i,
+			"name": f"group_{i}",
+			"display_name": f"Group {i}",
+			"order": i,
+			"created_at": base_time + timedelta(seconds=i),
+		}
+		for i in range(1, spec.groups + 1)
+	]
+	roles = [
+		{
+			"id": i,
+			"name": f"role_{i}",
+			"display_name": f"Role {i}",
+			"created_at": base_time + timedelta(seconds=i),
+			"updated_at": base_time + timedelta(seconds=i),
+		}
+		for i in range(1, spec.roles + 1)
+	]
+
+	permission_ids = range(1, spec.permissions + 1)
+	group_ids = range(1, spec.groups + 1)
+	role_permissions = [
+		{"role_id": role["id"], "permission_id": permission_id}
+		for role in roles
+		for permission_id in rng.sample(
+			permission_ids, min(spec.permissions_per_role, spec.permissions)
+		)
+	]
+	role_groups = [
+		{"role_id": role["id"], "permission_group_id": group_id}
+		for role in roles
+		for group_id in rng.sample(group_ids, min(spec.groups_per_role, spec.groups))
+	]
+	group_permissions = [
+		{"permission_group_id": group["id"], "permission_id": permission_id}
+		for group in groups
+		for permission_id in rng.sample(
+			permission_ids, min(spec.permissions_per_group, spec.permissions)
+		)
+	]
+
+	role_ids = range(1, spec.roles + 1)
+	user_roles = [
+		{"user_id": f"user_{user}", "role_id": role_id, "assigned_at": base_time}
+		for user in range(1, spec.users + 1)
+		for role_id in rng.sample(role_ids, min(spec.roles_per_user, spec.roles))
+	]
+
+	async with engine.begin() as conn:
+		await conn.run_sync(Base.metadata.create_all)
+		for model, rows in (
+			(PermissionModel, permissions),
+			(PermissionGroupModel, groups),
+			(RoleModel, roles),
+			(RolePermissionAssociation, role_permissions),
+			(RolePermissionGroupAssociation, role_groups),
+			(PermissionGroupPermissionAssociation, group_permissions),
+			(UserRoleAssociation, user_roles),
+		):
+			for start in range(0, len(rows), BATCH_SIZE):
+				await conn.execute(insert(model.__table__), rows[start : start + BATCH_SIZE])
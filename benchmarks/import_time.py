@@ -0,0 +1,123 @@
+"""
+Import-time cost of the package entry points, from `python -X importtime`.
+
+Each statement runs in a fresh interpreter `--repeat` times. Modules that the
+interpreter loads at startup (site, encodings, ...) are excluded, so the
+total is what the statement itself adds. The run with the median total is
+kept, including its per-module self and cumulative times.
+
+Usage:
+	python benchmarks/import_time.py
+	python benchmarks/import_time.py --repeat 10 --json imports.json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+STATEMENTS = [
+	"import vexen_rbac",
+	"from vexen_rbac import RBAC",
+	"from vexen_rbac import RBAC; RBAC(database_url='sqlite+aiosqlite://')",
+	"from vexen_rbac.application.dto import CreateRoleRequest",
+	"from vexen_rbac.application.service.rbac_service import RBACService; "
+	"RBACService(None, None, None).roles.get_role",
+	"from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models import Base",
+	"import vexen_rbac.infraestructure.output.persistence.sqlalchemy.maintenance",
+]
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+@dataclass
+class ModuleTime:
+	"""Import time of one module, in microseconds."""
+
+	module: str
+	self_us: int
+	cumulative_us: int
+
+
+@dataclass
+class ImportResult:
+	"""Cost of one statement (median run)."""
+
+	statement: str
+	total_ms: float
+	modules: int
+	package_modules: int
+	slowest: list[ModuleTime] = field(default_factory=list)
+
+
+def importtime(statement: str) -> list[ModuleTime]:
+	"""Run a statement in a fresh interpreter and parse its -X importtime report."""
+	completed = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", statement],
+		capture_output=True,
+		text=True,
+		cwd=ROOT,
+		check=True,
+	)
+	times = []
+	for line in completed.stderr.splitlines():
+		match = LINE.match(line)
+		if match:
+			times.append(ModuleTime(match[4], int(match[1]), int(match[2])))
+	return times
+
+
+def measure(statement: str, startup: set[str], repeat: int, top: int) -> ImportResult:
+	"""Import cost of a statement, excluding the interpreter's startup modules."""
+	runs = []
+	for _ in range(repeat):
+		times = [t for t in importtime(statement) if t.module not in startup]
+		runs.append((sum(t.self_us for t in times), times))
+	runs.sort(key=lambda run: run[0])
+	total_us, times = runs[len(runs) // 2]
+
+	return ImportResult(
+		statement=statement,
+		total_ms=total_us / 1000,
+		modules=len(times),
+		package_modules=sum(1 for t in times if t.module.split(".")[0] == "vexen_rbac"),
+		slowest=sorted(times, key=lambda t: t.self_us, reverse=True)[:top],
+	)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--repeat", type=int, default=5, help="Interpreter runs per statement")
+	parser.add_argument("--top", type=int, default=10, help="Slowest modules to keep per statement")
+	parser.add_argument("--json", help="Write results as JSON to this path")
+	args = parser.parse_args()
+
+	startup = {t.module for t in importtime("pass")}
+	results = [measure(s, startup, args.repeat, args.top) for s in STATEMENTS]
+
+	print(f"{'statement':<90} {'ms':>8} {'modules':>8} {'package':>8}")
+	for r in results:
+		print(f"{r.statement[:90]:<90} {r.total_ms:>8.1f} {r.modules:>8} {r.package_modules:>8}")
+
+	if args.json:
+		with open(args.json, "w") as f:
+			json.dump(
+				{
+					"python": sys.version,
+					"repeat": args.repeat,
+					"results": [
+						{**vars(r), "slowest": [vars(t) for t in r.slowest]} for r in results
+					],
+				},
+				f,
+				indent=2,
+			)
+
+
+if __name__ == "__main__":
+	main()
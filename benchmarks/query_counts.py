@@ -0,0 +1,147 @@
+"""
+Regression benchmark: SQL statements and ORM rows issued per repository method.
+
+Runs every read method of the three SQLAlchemy repositories against a
+synthetic SQLite graph and reports how many statements were executed and how
+many ORM objects were materialized. A method that suddenly loads an order of
+magnitude more rows usually means a relationship started cascading again.
+
+Usage:
+	python benchmarks/query_counts.py
+	python benchmarks/query_counts.py --permissions 8000 --roles 500 --json counts.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from dataset import DatasetSpec, generate  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories import (  # noqa: E402
+	PermissionGroupRepository,
+	PermissionRepository,
+	RoleRepository,
+)
+
+
+@dataclass
+class QueryCount:
+	"""Statements and ORM rows issued by one repository call."""
+
+	method: str
+	statements: int
+	rows: int
+
+
+class QueryCounter:
+	"""Counts statements on an engine and ORM objects loaded by any session."""
+
+	def __init__(self, engine):
+		self.statements = 0
+		self.rows = 0
+		event.listen(engine.sync_engine, "before_cursor_execute", self._on_statement)
+		event.listen(Session, "loaded_as_persistent", self._on_load)
+
+	def _on_statement(self, *args) -> None:
+		self.statements += 1
+
+	def _on_load(self, session, instance) -> None:
+		self.rows += 1
+
+	def reset(self) -> None:
+		self.statements = 0
+		self.rows = 0
+
+	def close(self) -> None:
+		event.remove(Session, "loaded_as_persistent", self._on_load)
+
+
+async def measure(
+	session_factory: async_sessionmaker[AsyncSession],
+	counter: QueryCounter,
+	name: str,
+	call: Callable[[AsyncSession], Awaitable[object]],
+) -> QueryCount:
+	"""Run one repository call in a fresh session and record its cost."""
+	async with session_factory() as session:
+		counter.reset()
+		await call(session)
+		return QueryCount(method=name, statements=counter.statements, rows=counter.rows)
+
+
+async def run(spec: DatasetSpec) -> list[QueryCount]:
+	with tempfile.TemporaryDirectory() as tmp:
+		engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+		await generate(engine, spec)
+		session_factory = async_sessionmaker(engine, expire_on_commit=False)
+		counter = QueryCounter(engine)
+
+		cases: list[tuple[str, Callable[[AsyncSession], Awaitable[object]]]] = [
+			("RoleRepository.get_by_id", lambda s: RoleRepository(s).get_by_id(1)),
+			(
+				"RoleRepository.get_by_id_with_permissions",
+				lambda s: RoleRepository(s).get_by_id_with_permissions(1),
+			),
+			(
+				"RoleRepository.get_effective_permissions",
+				lambda s: RoleRepository(s).get_effective_permissions([1, 2, 3]),
+			),
+			("RoleRepository.list", lambda s: RoleRepository(s).list()),
+			("RoleRepository.list_paginated", lambda s: RoleRepository(s).list_paginated(1, 20)),
+			("RoleRepository.count", lambda s: RoleRepository(s).count()),
+			("RoleRepository.count_permissions", lambda s: RoleRepository(s).count_permissions(1)),
+			("PermissionRepository.get_by_id", lambda s: PermissionRepository(s).get_by_id(1)),
+			("PermissionRepository.list", lambda s: PermissionRepository(s).list()),
+			(
+				"PermissionRepository.group_by_category",
+				lambda s: PermissionRepository(s).group_by_category(),
+			),
+			(
+				"PermissionGroupRepository.get_by_id",
+				lambda s: PermissionGroupRepository(s).get_by_id(1),
+			),
+			("PermissionGroupRepository.list", lambda s: PermissionGroupRepository(s).list()),
+			(
+				"PermissionGroupRepository.count_permissions",
+				lambda s: PermissionGroupRepository(s).count_permissions(1),
+			),
+		]
+
+		results = [await measure(session_factory, counter, name, call) for name, call in cases]
+		counter.close()
+		await engine.dispose()
+		return results
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--permissions", type=int, default=DatasetSpec.permissions)
+	parser.add_argument("--roles", type=int, default=DatasetSpec.roles)
+	parser.add_argument("--groups", type=int, default=DatasetSpec.groups)
+	parser.add_argument("--json", help="Write results as JSON to this path")
+	args = parser.parse_args()
+
+	spec = DatasetSpec(permissions=args.permissions, roles=args.roles, groups=args.groups)
+	results = asyncio.run(run(spec))
+
+	print(f"{'method':<48} {'statements':>10} {'rows':>10}")
+	for result in results:
+		print(f"{result.method:<48} {result.statements:>10} {result.rows:>10}")
+
+	if args.json:
+		with open(args.json, "w") as f:
+			json.dump({"spec": vars(spec), "results": [vars(r) for r in results]}, f, indent=2)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,190 @@
+"""
+Query plans and latency of the hot lookups with and without the declared indexes.
+
+Generates a synthetic graph, drops every index declared on the models
+(primary keys and unique constraints stay), and records the plan and median
+latency of each lookup. It then recreates the indexes and measures again.
+
+SQLite runs by default on a temporary database. Pass --database-url to run
+the same comparison on another backend (e.g. PostgreSQL with asyncpg); that
+database must be empty and dedicated to the benchmark.
+
+Usage:
+	python benchmarks/query_plans.py
+	python benchmarks/query_plans.py --permissions 20000 --roles 2000 --json plans.json
+	python benchmarks/query_plans.py --database-url postgresql+asyncpg://u:p@localhost/bench
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from dataset import CATEGORIES, DatasetSpec, generate  # noqa: E402
+from sqlalchemy import Select, func, select, text, tuple_  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine  # noqa: E402
+
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models import (  # noqa: E402
+	Base,
+	PermissionGroupPermissionAssociation,
+	PermissionModel,
+	RoleModel,
+	RolePermissionAssociation,
+	RolePermissionGroupAssociation,
+	UserRoleAssociation,
+)
+
+REPEAT = 25
+
+
+@dataclass
+class PlanResult:
+	"""Plan and latency of one lookup, before and after creating the indexes."""
+
+	query: str
+	before_plan: list[str] = field(default_factory=list)
+	after_plan: list[str] = field(default_factory=list)
+	before_ms: float = 0.0
+	after_ms: float = 0.0
+
+
+def lookups(spec: DatasetSpec) -> dict[str, Select]:
+	"""Statements issued by the repositories for the hot lookups."""
+	permission_id = spec.permissions // 2
+	group_id = spec.groups // 2
+	# Same created_at layout as dataset.generate: one second apart from 2024-01-01
+	cursor = (datetime(2024, 1, 1) + timedelta(seconds=spec.roles // 2), spec.roles // 2)
+
+	return {
+		"roles granting a permission": select(RolePermissionAssociation.role_id).where(
+			RolePermissionAssociation.permission_id == permission_id
+		),
+		"groups containing a permission": select(
+			PermissionGroupPermissionAssociation.permission_group_id
+		).where(PermissionGroupPermissionAssociation.permission_id == permission_id),
+		"roles using a group": select(RolePermissionGroupAssociation.role_id).where(
+			RolePermissionGroupAssociation.permission_group_id == group_id
+		),
+		"permissions of a category": select(PermissionModel)
+		.where(PermissionModel.category == CATEGORIES[0])
+		.order_by(PermissionModel.name),
+		"group_by_category": select(PermissionModel).order_by(
+			PermissionModel.category, PermissionModel.name
+		),
+		"users of a role (page 1)": select(UserRoleAssociation)
+		.where(UserRoleAssociation.role_id == spec.roles // 2)
+		.order_by(UserRoleAssociation.user_id)
+		.limit(20),
+		"user counts of a role page": select(UserRoleAssociation.role_id, func.count())
+		.where(UserRoleAssociation.role_id.in_(range(1, 21)))
+		.group_by(UserRoleAssociation.role_id),
+		"roles newest first (page 1)": select(RoleModel)
+		.order_by(RoleModel.created_at.desc(), RoleModel.id.desc())
+		.limit(20),
+		"roles keyset page": select(RoleModel)
+		.where(tuple_(RoleModel.created_at, RoleModel.id) < cursor)
+		.order_by(RoleModel.created_at.desc(), RoleModel.id.desc())
+		.limit(20),
+	}
+
+
+async def explain(conn: AsyncConnection, stmt: Select) -> list[str]:
+	"""Return the backend's plan for a statement, one line per plan node."""
+	# Expanding IN (...) parameters become plain bound parameters
+	compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+	params = compiled.construct_params()
+	if compiled.positiontup:
+		params = tuple(params[name] for name in compiled.positiontup)
+
+	if conn.dialect.name == "sqlite":
+		result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled.string}", params)
+		return [row[-1] for row in result.all()]
+
+	result = await conn.exec_driver_sql(f"EXPLAIN {compiled.string}", params)
+	return [row[0] for row in result.all()]
+
+
+async def latency_ms(conn: AsyncConnection, stmt: Select) -> float:
+	"""Median wall time of REPEAT executions, in milliseconds."""
+	samples = []
+	for _ in range(REPEAT):
+		start = time.perf_counter()
+		(await conn.execute(stmt)).all()
+		samples.append((time.perf_counter() - start) * 1000)
+	return statistics.median(samples)
+
+
+async def set_indexes(conn: AsyncConnection, present: bool) -> None:
+	"""Create or drop every index declared on the models, then refresh statistics."""
+
+	def apply(sync_conn) -> None:
+		for table in Base.metadata.sorted_tables:
+			for index in table.indexes:
+				if present:
+					index.create(sync_conn, checkfirst=True)
+				else:
+					index.drop(sync_conn, checkfirst=True)
+
+	await conn.run_sync(apply)
+	await conn.execute(text("ANALYZE"))
+
+
+async def run(spec: DatasetSpec, database_url: str | None) -> list[PlanResult]:
+	with tempfile.TemporaryDirectory() as tmp:
+		url = database_url or f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+		engine = create_async_engine(url)
+		await generate(engine, spec)
+
+		results = {name: PlanResult(query=name) for name in lookups(spec)}
+		for present in (False, True):
+			async with engine.begin() as conn:
+				await set_indexes(conn, present)
+			async with engine.connect() as conn:
+				for name, stmt in lookups(spec).items():
+					plan = await explain(conn, stmt)
+					elapsed = await latency_ms(conn, stmt)
+					if present:
+						results[name].after_plan, results[name].after_ms = plan, elapsed
+					else:
+						results[name].before_plan, results[name].before_ms = plan, elapsed
+
+		await engine.dispose()
+		return list(results.values())
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--permissions", type=int, default=20_000)
+	parser.add_argument("--roles", type=int, default=2_000)
+	parser.add_argument("--groups", type=int, default=500)
+	parser.add_argument("--database-url", help="Empty database to use instead of SQLite")
+	parser.add_argument("--json", help="Write results as JSON to this path")
+	args = parser.parse_args()
+
+	spec = DatasetSpec(permissions=args.permissions, roles=args.roles, groups=args.groups)
+	results = asyncio.run(run(spec, args.database_url))
+
+	for result in results:
+		print(f"\n{result.query}: {result.before_ms:.3f} ms -> {result.after_ms:.3f} ms")
+		print("  before:")
+		for line in result.before_plan:
+			print(f"    {line}")
+		print("  after:")
+		for line in result.after_plan:
+			print(f"    {line}")
+
+	if args.json:
+		with open(args.json, "w") as f:
+			json.dump({"spec": vars(spec), "results": [vars(r) for r in results]}, f, indent=2)
+
+
+if __name__ == "__main__":
+	main()
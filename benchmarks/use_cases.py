@@ -0,0 +1,549 @@
+"""
+Latency, throughput, SQL statements and peak memory of every use case.
+
+Generates a synthetic graph in a temporary SQLite database, opens it through
+the public `RBAC` facade and calls each use case of the role, permission,
+permission group and user role factories `--repeat` times. Writes are fed
+disposable rows prepared outside the timed section (e.g. delete_role deletes a
+role created just before), so repeated runs measure the same work.
+
+Throughput is sequential calls per second on one connection. Peak memory is
+the tracemalloc peak of one extra call, excluding what was allocated before it.
+Results can be written as JSON and compared against a previous run.
+
+Usage:
+	python benchmarks/use_cases.py
+	python benchmarks/use_cases.py --scale large --repeat 10 --json large.json
+	python benchmarks/use_cases.py --scale large --json new.json --compare large.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, replace
+from functools import cached_property
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from dataset import SCALES, DatasetSpec, generate  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from vexen_rbac import RBAC, RBACConfig  # noqa: E402
+from vexen_rbac.application.dto import (  # noqa: E402
+	BaseResponse,
+	CreatePermissionGroupRequest,
+	CreatePermissionRequest,
+	CreateRoleRequest,
+	PaginationRequest,
+	UpdatePermissionGroupRequest,
+	UpdatePermissionRequest,
+	UpdateRoleRequest,
+)
+
+BATCH = 50  # items per bulk create / batch get / association change
+PAGE_SIZE = 50
+
+Arguments = tuple
+Prepare = Callable[[int], Awaitable[Arguments]]
+
+
+@dataclass
+class UseCaseResult:
+	"""Cost of one use case over the measured calls."""
+
+	use_case: str
+	calls: int
+	median_ms: float
+	p95_ms: float
+	ops_per_second: float
+	statements: float
+	peak_kib: float
+
+
+@dataclass
+class Case:
+	"""A use case and how to build its arguments for the n-th call."""
+
+	name: str
+	call: Callable[..., Awaitable[object]]
+	prepare: Prepare
+
+
+class StatementCounter:
+	"""Counts statements executed by any engine while installed."""
+
+	def __init__(self):
+		self.statements = 0
+		event.listen(Engine, "before_cursor_execute", self._on_statement)
+
+	def _on_statement(self, *args) -> None:
+		self.statements += 1
+
+	def close(self) -> None:
+		event.remove(Engine, "before_cursor_execute", self._on_statement)
+
+
+def fixed(*arguments) -> Prepare:
+	"""Prepare step passing the same arguments to every call."""
+
+	async def prepare(n: int) -> Arguments:
+		return arguments
+
+	return prepare
+
+
+def each(build: Callable[[int], Arguments]) -> Prepare:
+	"""Prepare step computing the arguments from the call number."""
+
+	async def prepare(n: int) -> Arguments:
+		return build(n)
+
+	return prepare
+
+
+def drained(
+	stream: Callable[..., AsyncIterator[list]],
+) -> Callable[..., Awaitable[BaseResponse[int]]]:
+	"""Call consuming every chunk of a streaming use case, responding with the item count."""
+
+	async def call(*arguments) -> BaseResponse[int]:
+		items = 0
+		async for chunk in stream(*arguments):
+			items += len(chunk)
+		return BaseResponse.ok(items)
+
+	return call
+
+
+def checked(response):
+	"""Fail loudly when a use case reports an error instead of raising."""
+	if not response.success:
+		raise RuntimeError(response.error)
+	return response
+
+
+async def cases(rbac: RBAC, spec: DatasetSpec) -> list[Case]:
+	"""Calls exercising every use case of the factories."""
+	roles, permissions, groups = rbac.roles, rbac.permissions, rbac.permission_groups
+	user_roles = rbac.user_roles
+
+	def cycle(n: int, size: int) -> int:
+		return n % size + 1
+
+	def batch(n: int, size: int) -> list[int]:
+		return [cycle(n * BATCH + offset, size) for offset in range(min(BATCH, size))]
+
+	def page(n: int, total: int) -> PaginationRequest:
+		return PaginationRequest(page=cycle(n, max(1, total // PAGE_SIZE)), page_size=PAGE_SIZE)
+
+	# Permissions created here are not granted by the dataset, so association
+	# changes always touch BATCH rows
+	created = checked(
+		await permissions.create_permissions_bulk(
+			[
+				CreatePermissionRequest(name=f"bench.spare_{i}", display_name="Spare")
+				for i in range(BATCH)
+			]
+		)
+	).data.created
+	spare = [permission.id for permission in created]
+
+	async def new_role(n: int) -> Arguments:
+		request = CreateRoleRequest(name=f"bench.doomed_role_{n}", display_name="Doomed")
+		return (checked(await roles.create_role(request)).data.id,)
+
+	async def new_permission(n: int) -> Arguments:
+		request = CreatePermissionRequest(name=f"bench.doomed_{n}", display_name="Doomed")
+		return (checked(await permissions.create_permission(request)).data.id,)
+
+	async def new_group(n: int) -> Arguments:
+		request = CreatePermissionGroupRequest(
+			name=f"bench.doomed_group_{n}", display_name="Doomed"
+		)
+		return (checked(await groups.create_permission_group(request)).data.id,)
+
+	async def role_without_spare(n: int) -> Arguments:
+		checked(await roles.remove_permissions(1, spare))
+		return (1, spare)
+
+	async def role_with_spare(n: int) -> Arguments:
+		checked(await roles.add_permissions(1, spare))
+		return (1, spare)
+
+	async def group_without_spare(n: int) -> Arguments:
+		checked(await groups.remove_permissions(1, spare))
+		return (1, spare)
+
+	async def group_with_spare(n: int) -> Arguments:
+		checked(await groups.add_permissions(1, spare))
+		return (1, spare)
+
+	# Dataset users are named user_1..user_N; this one starts without roles
+	bench_user = "bench.user"
+
+	async def user_without_roles(n: int) -> Arguments:
+		role_ids = batch(0, spec.roles)
+		checked(await user_roles.revoke_roles(bench_user, role_ids))
+		return (bench_user, role_ids)
+
+	async def user_with_roles(n: int) -> Arguments:
+		role_ids = batch(0, spec.roles)
+		checked(await user_roles.assign_roles(bench_user, role_ids))
+		return (bench_user, role_ids)
+
+	async def role_request(n: int) -> Arguments:
+		request = CreateRoleRequest(
+			name=f"bench.role_{n}",
+			display_name="Bench",
+			permissions=batch(n, spec.permissions),
+			permission_groups=[cycle(n, spec.groups)],
+		)
+		return (request,)
+
+	async def role_requests(n: int) -> Arguments:
+		return (
+			[
+				CreateRoleRequest(name=f"bench.bulk_role_{n}_{i}", display_name="Bench")
+				for i in range(BATCH)
+			],
+		)
+
+	async def permission_request(n: int) -> Arguments:
+		return (CreatePermissionRequest(name=f"bench.permission_{n}", display_name="Bench"),)
+
+	async def permission_requests(n: int) -> Arguments:
+		return (
+			[
+				CreatePermissionRequest(name=f"bench.bulk_{n}_{i}", display_name="Bench")
+				for i in range(BATCH)
+			],
+		)
+
+	async def group_request(n: int) -> Arguments:
+		request = CreatePermissionGroupRequest(
+			name=f"bench.group_{n}", display_name="Bench", permissions=batch(n, spec.permissions)
+		)
+		return (request,)
+
+	async def group_requests(n: int) -> Arguments:
+		return (
+			[
+				CreatePermissionGroupRequest(name=f"bench.bulk_group_{n}_{i}", display_name="Bench")
+				for i in range(BATCH)
+			],
+		)
+
+	return [
+		Case("roles.create_role", roles.create_role, role_request),
+		Case("roles.create_roles_bulk", roles.create_roles_bulk, role_requests),
+		Case("roles.get_role", roles.get_role, each(lambda n: (cycle(n, spec.roles),))),
+		Case(
+			"roles.get_role_expanded",
+			roles.get_role_expanded,
+			each(lambda n: (cycle(n, spec.roles),)),
+		),
+		Case(
+			"roles.get_roles_by_ids",
+			roles.get_roles_by_ids,
+			each(lambda n: (batch(n, spec.roles),)),
+		),
+		Case(
+			"roles.update_role",
+			roles.update_role,
+			each(lambda n: (cycle(n, spec.roles), UpdateRoleRequest(description=f"rev {n}"))),
+		),
+		Case("roles.delete_role", roles.delete_role, new_role),
+		Case("roles.list_roles", roles.list_roles, fixed()),
+		Case("roles.iter_roles", drained(roles.iter_roles), fixed()),
+		Case(
+			"roles.list_roles_paginated",
+			roles.list_roles_paginated,
+			each(lambda n: (page(n, spec.roles),)),
+		),
+		Case("roles.list_roles_with_counts", roles.list_roles_with_counts, fixed()),
+		Case("roles.add_permissions", roles.add_permissions, role_without_spare),
+		Case("roles.remove_permissions", roles.remove_permissions, role_with_spare),
+		Case("roles.count_roles", roles.count_roles, fixed()),
+		Case(
+			"roles.count_permissions",
+			roles.count_permissions,
+			each(lambda n: (cycle(n, spec.roles),)),
+		),
+		Case(
+			"roles.get_effective_permissions",
+			roles.get_effective_permissions,
+			each(lambda n: ([cycle(n + i, spec.roles) for i in range(3)],)),
+		),
+		Case("permissions.create_permission", permissions.create_permission, permission_request),
+		Case(
+			"permissions.create_permissions_bulk",
+			permissions.create_permissions_bulk,
+			permission_requests,
+		),
+		Case(
+			"permissions.get_permission",
+			permissions.get_permission,
+			each(lambda n: (cycle(n, spec.permissions),)),
+		),
+		Case(
+			"permissions.get_permissions_by_ids",
+			permissions.get_permissions_by_ids,
+			each(lambda n: (batch(n, spec.permissions),)),
+		),
+		Case("permissions.delete_permission", permissions.delete_permission, new_permission),
+		Case(
+			"permissions.update_permission",
+			permissions.update_permission,
+			each(
+				lambda n: (
+					cycle(n, spec.permissions),
+					UpdatePermissionRequest(description=f"rev {n}"),
+				)
+			),
+		),
+		Case("permissions.list_permissions", permissions.list_permissions, fixed()),
+		Case("permissions.iter_permissions", drained(permissions.iter_permissions), fixed()),
+		Case(
+			"permissions.list_permissions_paginated",
+			permissions.list_permissions_paginated,
+			each(lambda n: (page(n, spec.permissions),)),
+		),
+		Case("permissions.get_permissions_grouped", permissions.get_permissions_grouped, fixed()),
+		Case(
+			"permission_groups.create_permission_group",
+			groups.create_permission_group,
+			group_request,
+		),
+		Case(
+			"permission_groups.create_permission_groups_bulk",
+			groups.create_permission_groups_bulk,
+			group_requests,
+		),
+		Case(
+			"permission_groups.get_permission_group",
+			groups.get_permission_group,
+			each(lambda n: (cycle(n, spec.groups),)),
+		),
+		Case(
+			"permission_groups.get_permission_groups_by_ids",
+			groups.get_permission_groups_by_ids,
+			each(lambda n: (batch(n, spec.groups),)),
+		),
+		Case(
+			"permission_groups.delete_permission_group",
+			groups.delete_permission_group,
+			new_group,
+		),
+		Case(
+			"permission_groups.update_permission_group",
+			groups.update_permission_group,
+			each(
+				lambda n: (
+					cycle(n, spec.groups),
+					UpdatePermissionGroupRequest(description=f"rev {n}"),
+				)
+			),
+		),
+		Case("permission_groups.list_permission_groups", groups.list_permission_groups, fixed()),
+		Case(
+			"permission_groups.iter_permission_groups",
+			drained(groups.iter_permission_groups),
+			fixed(),
+		),
+		Case(
+			"permission_groups.list_permission_groups_paginated",
+			groups.list_permission_groups_paginated,
+			each(lambda n: (page(n, spec.groups),)),
+		),
+		Case(
+			"permission_groups.list_permission_groups_with_counts",
+			groups.list_permission_groups_with_counts,
+			fixed(),
+		),
+		Case("permission_groups.add_permissions", groups.add_permissions, group_without_spare),
+		Case(
+			"permission_groups.remove_permissions",
+			groups.remove_permissions,
+			group_with_spare,
+		),
+		Case(
+			"permission_groups.count_permissions",
+			groups.count_permissions,
+			each(lambda n: (cycle(n, spec.groups),)),
+		),
+		Case("user_roles.assign_roles", user_roles.assign_roles, user_without_roles),
+		Case("user_roles.revoke_roles", user_roles.revoke_roles, user_with_roles),
+		Case(
+			"user_roles.list_user_roles",
+			user_roles.list_user_roles,
+			each(lambda n: (f"user_{cycle(n, spec.users)}",)),
+		),
+		Case(
+			"user_roles.list_role_users",
+			user_roles.list_role_users,
+			each(
+				lambda n: (
+					cycle(n, spec.roles),
+					page(n, spec.users * spec.roles_per_user // spec.roles),
+				)
+			),
+		),
+	]
+
+
+async def measure(case: Case, counter: StatementCounter, repeat: int) -> UseCaseResult:
+	"""Time `repeat` calls of a use case, then one more under tracemalloc."""
+	samples = []
+	statements = 0
+	for n in range(repeat):
+		arguments = await case.prepare(n)
+		counter.statements = 0
+		start = time.perf_counter()
+		checked(await case.call(*arguments))
+		samples.append(time.perf_counter() - start)
+		statements += counter.statements
+
+	arguments = await case.prepare(repeat)
+	tracemalloc.start()
+	try:
+		baseline = tracemalloc.get_traced_memory()[0]
+		checked(await case.call(*arguments))
+		peak = tracemalloc.get_traced_memory()[1] - baseline
+	finally:
+		tracemalloc.stop()
+
+	samples.sort()
+	return UseCaseResult(
+		use_case=case.name,
+		calls=repeat,
+		median_ms=statistics.median(samples) * 1000,
+		p95_ms=samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+		ops_per_second=repeat / sum(samples),
+		statements=statements / repeat,
+		peak_kib=peak / 1024,
+	)
+
+
+def uncovered(rbac: RBAC, measured: list[Case]) -> list[str]:
+	"""Factory use cases the benchmark does not call (e.g. newly added ones)."""
+	names = {case.name for case in measured}
+	factories = {
+		"roles": rbac.roles,
+		"permissions": rbac.permissions,
+		"permission_groups": rbac.permission_groups,
+		"user_roles": rbac.user_roles,
+	}
+	return sorted(
+		f"{prefix}.{attribute}"
+		for prefix, factory in factories.items()
+		for attribute, value in vars(type(factory)).items()
+		if isinstance(value, cached_property) and f"{prefix}.{attribute}" not in names
+	)
+
+
+async def run(spec: DatasetSpec, repeat: int, materialize: bool) -> list[UseCaseResult]:
+	with tempfile.TemporaryDirectory() as tmp:
+		url = f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+		engine = create_async_engine(url)
+		await generate(engine, spec)
+		await engine.dispose()
+
+		rbac = RBAC(
+			config=RBACConfig(database_url=url, materialize_effective_permissions=materialize)
+		)
+		await rbac.init()
+		if materialize:
+			await rbac.rebuild_effective_permissions()
+
+		measured = await cases(rbac, spec)
+		missing = uncovered(rbac, measured)
+		if missing:
+			print(f"warning: not benchmarked: {', '.join(missing)}", file=sys.stderr)
+
+		counter = StatementCounter()
+		try:
+			return [await measure(case, counter, repeat) for case in measured]
+		finally:
+			counter.close()
+			await rbac.close()
+
+
+def compare(results: list[UseCaseResult], path: str) -> None:
+	"""Print the change in median latency and statements against a previous run."""
+	with open(path) as f:
+		previous = {r["use_case"]: r for r in json.load(f)["results"]}
+
+	print(f"\n{'use case':<56} {'median ms':>18}{'statements':>18}")
+	for result in results:
+		old = previous.get(result.use_case)
+		if old is None:
+			continue
+		ratio = result.median_ms / old["median_ms"] if old["median_ms"] else float("inf")
+		print(
+			f"{result.use_case:<56} {old['median_ms']:>7.2f} -> {result.median_ms:<7.2f}"
+			f"{old['statements']:>7.1f} -> {result.statements:<7.1f} x{ratio:.2f}"
+		)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--scale", choices=sorted(SCALES), default="default")
+	parser.add_argument("--permissions", type=int, help="Override the scale's permission count")
+	parser.add_argument("--roles", type=int, help="Override the scale's role count")
+	parser.add_argument("--groups", type=int, help="Override the scale's group count")
+	parser.add_argument("--repeat", type=int, default=20, help="Measured calls per use case")
+	parser.add_argument(
+		"--materialize",
+		action="store_true",
+		help="Enable materialize_effective_permissions on the measured instance",
+	)
+	parser.add_argument("--json", help="Write results as JSON to this path")
+	parser.add_argument("--compare", help="JSON file of a previous run to compare against")
+	args = parser.parse_args()
+
+	overrides = {
+		name: getattr(args, name)
+		for name in ("permissions", "roles", "groups")
+		if getattr(args, name) is not None
+	}
+	spec = replace(SCALES[args.scale], **overrides)
+	results = asyncio.run(run(spec, args.repeat, args.materialize))
+
+	print(
+		f"{'use case':<56} {'median ms':>10} {'p95 ms':>10} {'ops/s':>10}"
+		f" {'statements':>10} {'peak KiB':>10}"
+	)
+	for r in results:
+		print(
+			f"{r.use_case:<56} {r.median_ms:>10.3f} {r.p95_ms:>10.3f} {r.ops_per_second:>10.1f}"
+			f" {r.statements:>10.1f} {r.peak_kib:>10.1f}"
+		)
+
+	if args.compare:
+		compare(results, args.compare)
+
+	if args.json:
+		with open(args.json, "w") as f:
+			json.dump(
+				{
+					"spec": vars(spec),
+					"repeat": args.repeat,
+					"materialize": args.materialize,
+					"results": [vars(r) for r in results],
+				},
+				f,
+				indent=2,
+			)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,191 @@
+"""
+Batch authorization: the NumPy and pure Python matrix engines must return the
+same decisions as the one-pair-at-a-time authorization engine.
+"""
+
+import random
+
+import pytest
+
+from vexen_rbac.application.service.authorization_engine import CompiledPermissions
+from vexen_rbac.application.service.bulk_authorizer import PermissionMatrix
+from vexen_rbac.domain.entity import Permission, PermissionGroup, Role
+
+CATALOG = [
+	"tickets.read",
+	"tickets.write",
+	"tickets.comments.write",
+	"tickets.*",
+	"users.read",
+	"users.write",
+	"*.read",
+	"roles.delete",
+	"billing.refund",
+	"billing.read",
+]
+
+
+def graph(permission_ids: list[int], role_ids: list[int], group_ids: list[int]):
+	"""Fixed graph with direct, group and wildcard grants under the given IDs."""
+	permissions = [
+		Permission(id=permission_id, name=name, display_name=name)
+		for permission_id, name in zip(permission_ids, CATALOG, strict=True)
+	]
+	p = {permission.name: permission.id for permission in permissions}
+	groups = [
+		PermissionGroup(
+			id=group_ids[0],
+			name="users",
+			display_name="Users",
+			permissions=[p["users.read"], p["users.write"]],
+		),
+		PermissionGroup(
+			id=group_ids[1], name="readers", display_name="Readers", permissions=[p["*.read"]]
+		),
+		# Grants of unknown permissions are ignored
+		PermissionGroup(id=group_ids[2], name="stale", display_name="Stale", permissions=[999_999]),
+	]
+	roles = [
+		Role(id=role_ids[0], name="agent", display_name="Agent", permissions=[p["tickets.read"]]),
+		Role(
+			id=role_ids[1],
+			name="manager",
+			display_name="Manager",
+			permissions=[p["roles.delete"]],
+			permission_groups=[group_ids[0]],
+		),
+		Role(id=role_ids[2], name="tickets", display_name="Tickets", permissions=[p["tickets.*"]]),
+		Role(
+			id=role_ids[3], name="auditor", display_name="Auditor", permission_groups=[group_ids[1]]
+		),
+		Role(
+			id=role_ids[4],
+			name="stale",
+			display_name="Stale",
+			permission_groups=[group_ids[2], 888_888],
+		),
+		Role(id=role_ids[5], name="empty", display_name="Empty"),
+	]
+	return roles, groups, permissions
+
+
+def every_pair(roles, permissions, unknown_role_ids, unknown_permission_ids):
+	"""Cartesian product of known and unknown role and permission IDs."""
+	role_ids = [role.id for role in roles] + unknown_role_ids
+	permission_ids = [permission.id for permission in permissions] + unknown_permission_ids
+	pairs = [(role_id, permission_id) for role_id in role_ids for permission_id in permission_ids]
+	return [role_id for role_id, _ in pairs], [permission_id for _, permission_id in pairs]
+
+
+def expected_decisions(roles, groups, permissions, role_ids, permission_ids) -> list[bool]:
+	compiled = CompiledPermissions.compile(roles, groups, permissions)
+	names = {permission.id: permission.name for permission in permissions}
+	return [
+		permission_id in names and compiled.check(role_id, names[permission_id])
+		for role_id, permission_id in zip(role_ids, permission_ids, strict=True)
+	]
+
+
+IDS = {
+	"dense": (list(range(1, 11)), list(range(1, 7)), [1, 2, 3]),
+	"sparse": (
+		[3, 70, 1_000, 1_001, 52_000, 52_007, 900_000, 1_234_567, 5_000_000, 2**40],
+		[5, 6, 10_000, 77_777, 2**35, 2**35 + 1],
+		[9, 90_000, 2**33],
+	),
+}
+UNKNOWN_ROLE_IDS = [0, -1, 7, 4_000, 2**41]
+UNKNOWN_PERMISSION_IDS = [0, -5, 11, 999_999, 2**41]
+
+
+@pytest.mark.parametrize("layout", sorted(IDS))
+def test_python_engine_matches_authorization_engine(layout):
+	roles, groups, permissions = graph(*IDS[layout])
+	role_ids, permission_ids = every_pair(
+		roles, permissions, UNKNOWN_ROLE_IDS, UNKNOWN_PERMISSION_IDS
+	)
+
+	matrix = PermissionMatrix.compile(roles, groups, permissions, use_numpy=False)
+
+	assert not matrix.uses_numpy
+	assert matrix.check_batch(role_ids, permission_ids) == expected_decisions(
+		roles, groups, permissions, role_ids, permission_ids
+	)
+
+
+@pytest.mark.parametrize("layout", sorted(IDS))
+def test_numpy_engine_matches_python_engine(layout):
+	np = pytest.importorskip("numpy")
+	roles, groups, permissions = graph(*IDS[layout])
+	role_ids, permission_ids = every_pair(
+		roles, permissions, UNKNOWN_ROLE_IDS, UNKNOWN_PERMISSION_IDS
+	)
+
+	python = PermissionMatrix.compile(roles, groups, permissions, use_numpy=False)
+	vectorized = PermissionMatrix.compile(roles, groups, permissions, use_numpy=True)
+
+	assert vectorized.uses_numpy
+	expected = python.check_batch(role_ids, permission_ids)
+	assert vectorized.check_batch(role_ids, permission_ids).tolist() == expected
+	decisions = vectorized.check_batch(np.asarray(role_ids), np.asarray(permission_ids))
+	assert decisions.tolist() == expected
+
+
+def test_engines_agree_on_random_graph():
+	np = pytest.importorskip("numpy")
+	rng = random.Random(7)
+	permissions = [
+		Permission(id=permission_id, name=f"resource{permission_id}.action", display_name="p")
+		for permission_id in sorted(rng.sample(range(1, 5_000), 300))
+	]
+	permissions.append(Permission(id=6_000, name="resource1.*", display_name="w"))
+	permission_ids = [permission.id for permission in permissions]
+	groups = [
+		PermissionGroup(
+			id=group_id,
+			name=f"g{group_id}",
+			display_name="g",
+			permissions=rng.sample(permission_ids, 40),
+		)
+		for group_id in range(1, 30)
+	]
+	roles = [
+		Role(
+			id=role_id,
+			name=f"r{role_id}",
+			display_name="r",
+			permissions=rng.sample(permission_ids, 25),
+			permission_groups=rng.sample(range(1, 30), 3),
+		)
+		for role_id in sorted(rng.sample(range(1, 100_000), 200))
+	]
+	role_ids = [
+		rng.choice(roles).id if rng.random() < 0.95 else rng.randrange(-10, 200_000)
+		for _ in range(20_000)
+	]
+	batch_permission_ids = [
+		rng.choice(permission_ids) if rng.random() < 0.95 else rng.randrange(-10, 10_000)
+		for _ in range(20_000)
+	]
+
+	python = PermissionMatrix.compile(roles, groups, permissions, use_numpy=False)
+	vectorized = PermissionMatrix.compile(roles, groups, permissions, use_numpy=True)
+
+	expected = expected_decisions(roles, groups, permissions, role_ids, batch_permission_ids)
+	assert python.check_batch(role_ids, batch_permission_ids) == expected
+	assert (
+		vectorized.check_batch(np.asarray(role_ids), np.asarray(batch_permission_ids)).tolist()
+		== expected
+	)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_empty_and_mismatched_batches(use_numpy):
+	if use_numpy:
+		pytest.importorskip("numpy")
+	roles, groups, permissions = graph(*IDS["dense"])
+	matrix = PermissionMatrix.compile(roles, groups, permissions, use_numpy=use_numpy)
+
+	assert list(matrix.check_batch([], [])) == []
+	with pytest.raises(ValueError, match="same length"):
+		matrix.check_batch([1, 2], [1])
@@ -0,0 +1,85 @@
+"""
+Whole-graph loads read roles, groups and permissions from one state of the
+primary, never from a lagging replica.
+"""
+
+import shutil
+
+import pytest
+
+from vexen_rbac import RBAC, RBACConfig
+from vexen_rbac.application.dto import CreatePermissionRequest, CreateRoleRequest
+
+
+async def rbac_with_stale_replica(tmp_path, writer: RBAC) -> RBAC:
+	"""Grant "tickets.read" to a new role after copying the primary to a replica."""
+	primary = tmp_path / "primary.db"
+	# The replica never receives the writes made after this copy
+	shutil.copy(primary, tmp_path / "replica.db")
+	permission = await writer.permissions.create_permission(
+		CreatePermissionRequest(name="tickets.read", display_name="Read Tickets")
+	)
+	await writer.roles.create_role(
+		CreateRoleRequest(name="agent", display_name="Agent", permissions=[permission.data.id])
+	)
+	rbac = RBAC(
+		config=RBACConfig(
+			database_url=f"sqlite+aiosqlite:///{primary}",
+			replica_urls=[f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"],
+		)
+	)
+	await rbac.init()
+	return rbac
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reads_the_primary(tmp_path):
+	writer = RBAC(config=RBACConfig(database_url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}"))
+	await writer.init()
+	try:
+		rbac = await rbac_with_stale_replica(tmp_path, writer)
+		try:
+			await rbac.export_snapshot(tmp_path / "rbac.snapshot")
+		finally:
+			await rbac.close()
+	finally:
+		await writer.close()
+
+	snapshot = RBAC.load_snapshot(tmp_path / "rbac.snapshot")
+	assert len(snapshot.role_ids) == 1
+	assert snapshot.check(snapshot.role_ids[0], "tickets.read")
+
+
+@pytest.mark.asyncio
+async def test_authorization_engine_loads_from_the_primary(tmp_path):
+	writer = RBAC(config=RBACConfig(database_url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}"))
+	await writer.init()
+	try:
+		rbac = await rbac_with_stale_replica(tmp_path, writer)
+		try:
+			compiled = await rbac.authorization.load()
+
+			assert [rbac.check(role_id, "tickets.read") for role_id in compiled.role_masks] == [
+				True
+			]
+		finally:
+			await rbac.close()
+	finally:
+		await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_authorizer_loads_from_the_primary(tmp_path):
+	writer = RBAC(config=RBACConfig(database_url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}"))
+	await writer.init()
+	try:
+		rbac = await rbac_with_stale_replica(tmp_path, writer)
+		try:
+			role = (await writer.roles.list_roles()).data[0]
+			await rbac.bulk_authorization.load(use_numpy=False)
+
+			assert rbac.check_batch([role.id], role.permissions) == [True]
+		finally:
+			await rbac.close()
+	finally:
+		await writer.close()
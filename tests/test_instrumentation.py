@@ -0,0 +1,82 @@
+"""
+Instrumentation of use cases, including streaming (async generator) ones.
+"""
+
+from contextlib import aclosing
+
+import pytest
+import pytest_asyncio
+
+from vexen_rbac import RBAC, RBACConfig
+from vexen_rbac.application.dto import CreatePermissionRequest, CreateRoleRequest
+
+
+@pytest_asyncio.fixture
+async def rbac(tmp_path):
+	rbac = RBAC(
+		config=RBACConfig(
+			database_url=f"sqlite+aiosqlite:///{tmp_path / 'rbac.db'}",
+			instrumentation_enabled=True,
+		)
+	)
+	await rbac.init()
+	for index in range(5):
+		await rbac.permissions.create_permission(
+			CreatePermissionRequest(name=f"resource{index}.read", display_name="p")
+		)
+		await rbac.roles.create_role(CreateRoleRequest(name=f"role{index}", display_name="r"))
+	rbac.reset_stats()
+	yield rbac
+	await rbac.close()
+
+
+@pytest.mark.asyncio
+async def test_streaming_use_cases_are_instrumented(rbac):
+	chunks = [chunk async for chunk in rbac.roles.iter_roles(chunk_size=2)]
+	async for _ in rbac.permissions.iter_permissions():
+		pass
+	async for _ in rbac.permission_groups.iter_permission_groups():
+		pass
+
+	operations = rbac.stats().operations
+	assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+	for name in [
+		"roles.iter_roles",
+		"permissions.iter_permissions",
+		"permission_groups.iter_permission_groups",
+	]:
+		assert operations[name].calls == 1
+		assert operations[name].errors == 0
+		assert operations[name].statements >= 1
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_is_recorded_without_error(rbac):
+	async with aclosing(rbac.roles.iter_roles(chunk_size=1)) as chunks:
+		async for _ in chunks:
+			break
+
+	stats = rbac.stats().operations["roles.iter_roles"]
+	assert stats.calls == 1
+	assert stats.errors == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_error_is_counted(rbac):
+	with pytest.raises(ValueError):
+		async for _ in rbac.roles.iter_roles(chunk_size=0):
+			pass
+
+	stats = rbac.stats().operations["roles.iter_roles"]
+	assert stats.calls == 1
+	assert stats.errors == 1
+
+
+@pytest.mark.asyncio
+async def test_consumer_statements_are_not_attributed_to_stream(rbac):
+	async for _ in rbac.roles.iter_roles(chunk_size=1):
+		await rbac.roles.get_role(1)
+
+	operations = rbac.stats().operations
+	assert operations["roles.get_role"].calls == 5
+	assert operations["roles.iter_roles"].statements < operations["roles.get_role"].statements
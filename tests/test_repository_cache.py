@@ -0,0 +1,65 @@
+"""
+Repository cache: invalidation of cached misses by bulk creates.
+"""
+
+import pytest
+
+from vexen_rbac import RBAC, RBACConfig
+from vexen_rbac.application.dto import (
+	CreatePermissionGroupRequest,
+	CreatePermissionRequest,
+	CreateRoleRequest,
+)
+
+CASES = [
+	("roles", "create_role", "create_roles_bulk", "get_role", "delete_role", CreateRoleRequest),
+	(
+		"permissions",
+		"create_permission",
+		"create_permissions_bulk",
+		"get_permission",
+		"delete_permission",
+		CreatePermissionRequest,
+	),
+	(
+		"permission_groups",
+		"create_permission_group",
+		"create_permission_groups_bulk",
+		"get_permission_group",
+		"delete_permission_group",
+		CreatePermissionGroupRequest,
+	),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	("factory", "create", "create_bulk", "get", "delete", "request_type"), CASES
+)
+async def test_bulk_create_drops_cached_miss_of_reused_id(
+	tmp_path, factory, create, create_bulk, get, delete, request_type
+):
+	rbac = RBAC(
+		config=RBACConfig(
+			database_url=f"sqlite+aiosqlite:///{tmp_path / 'rbac.db'}", cache_enabled=True
+		)
+	)
+	await rbac.init()
+	try:
+		use_cases = getattr(rbac, factory)
+		first = await getattr(use_cases, create)(request_type(name="first.a", display_name="A"))
+		await getattr(use_cases, delete)(first.data.id)
+		# The miss is cached as None
+		assert not (await getattr(use_cases, get)(first.data.id)).success
+
+		bulk = await getattr(use_cases, create_bulk)(
+			[request_type(name="second.b", display_name="B")]
+		)
+
+		# SQLite hands the deleted rowid out again
+		assert bulk.data.created[0].id == first.data.id
+		found = await getattr(use_cases, get)(first.data.id)
+		assert found.success
+		assert found.data.name == "second.b"
+	finally:
+		await rbac.close()
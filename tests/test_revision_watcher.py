@@ -0,0 +1,25 @@
+"""
+Revision watcher setup during initialization.
+"""
+
+import pytest
+
+from vexen_rbac import RBAC, RBACConfig
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.database import engine_registry
+
+
+@pytest.mark.asyncio
+async def test_failed_notifier_setup_releases_engine(tmp_path):
+	engines = len(engine_registry)
+	rbac = RBAC(
+		config=RBACConfig(
+			database_url=f"sqlite+aiosqlite:///{tmp_path / 'rbac.db'}",
+			replica_urls=[f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"],
+			revision_notifications=True,
+		)
+	)
+
+	with pytest.raises(ValueError, match="asyncpg"):
+		await rbac.init()
+
+	assert len(engine_registry) == engines
@@ -0,0 +1,39 @@
+"""
+Schema creation and the recorded schema version.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.database import (
+	create_schema,
+	ensure_schema,
+	schema_is_current,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.schema_version import (
+	SCHEMA_VERSION,
+	SchemaVersionModel,
+)
+
+
+@pytest.mark.asyncio
+async def test_workers_upgrading_at_once_share_one_version_row(tmp_path):
+	url = f"sqlite+aiosqlite:///{tmp_path / 'rbac.db'}"
+	engines = [create_async_engine(url) for _ in range(4)]
+	try:
+		await create_schema(engines[0])
+		async with engines[0].begin() as conn:
+			await conn.execute(update(SchemaVersionModel).values(version=SCHEMA_VERSION - 1))
+
+		await asyncio.gather(*(ensure_schema(engine) for engine in engines))
+
+		async with engines[0].connect() as conn:
+			rows = (await conn.execute(select(SchemaVersionModel.version))).all()
+		assert [row.version for row in rows] == [SCHEMA_VERSION]
+		assert await schema_is_current(engines[0])
+	finally:
+		for engine in engines:
+			await engine.dispose()
@@ -0,0 +1,97 @@
+"""
+Per-user permission cache: revalidation against the global revision.
+"""
+
+import shutil
+
+import pytest
+
+from vexen_rbac import RBAC, RBACConfig
+from vexen_rbac.application.dto import CreatePermissionRequest, CreateRoleRequest
+
+
+async def seed(rbac: RBAC) -> int:
+	permission = await rbac.permissions.create_permission(
+		CreatePermissionRequest(name="tickets.read", display_name="Read Tickets")
+	)
+	role = await rbac.roles.create_role(
+		CreateRoleRequest(name="agent", display_name="Agent", permissions=[permission.data.id])
+	)
+	await rbac.user_roles.assign_roles("user-1", [role.data.id])
+	return role.data.id
+
+
+@pytest.mark.asyncio
+async def test_revocation_by_another_process_is_seen_on_next_check(tmp_path):
+	url = f"sqlite+aiosqlite:///{tmp_path / 'rbac.db'}"
+	rbac = RBAC(config=RBACConfig(database_url=url, revision_poll_interval=None))
+	writer = RBAC(config=RBACConfig(database_url=url, revision_poll_interval=None))
+	await rbac.init()
+	await writer.init()
+	try:
+		role_id = await seed(writer)
+		assert await rbac.authorize("user-1", "tickets.read")
+
+		await writer.user_roles.revoke_roles("user-1", [role_id])
+
+		assert not await rbac.authorize("user-1", "tickets.read")
+	finally:
+		await writer.close()
+		await rbac.close()
+
+
+@pytest.mark.asyncio
+async def test_revalidated_set_is_not_loaded_from_lagging_replica(tmp_path):
+	primary = tmp_path / "primary.db"
+	writer = RBAC(config=RBACConfig(database_url=f"sqlite+aiosqlite:///{primary}"))
+	await writer.init()
+	try:
+		role_id = await seed(writer)
+		# The replica never receives the writes made after this copy
+		shutil.copy(primary, tmp_path / "replica.db")
+
+		rbac = RBAC(
+			config=RBACConfig(
+				database_url=f"sqlite+aiosqlite:///{primary}",
+				replica_urls=[f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"],
+				revision_poll_interval=None,
+			)
+		)
+		await rbac.init()
+		try:
+			assert await rbac.authorize("user-1", "tickets.read")
+			await writer.user_roles.revoke_roles("user-1", [role_id])
+
+			assert not await rbac.authorize("user-1", "tickets.read")
+			# Plain reads still go to the replica
+			assert [
+				role.name for role in (await rbac.user_roles.list_user_roles("user-1")).data
+			] == ["agent"]
+		finally:
+			await rbac.close()
+	finally:
+		await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_costs_no_query_while_watcher_runs(tmp_path):
+	assert RBACConfig(database_url="sqlite+aiosqlite://").revision_poll_interval is not None
+	rbac = RBAC(
+		config=RBACConfig(
+			database_url=f"sqlite+aiosqlite:///{tmp_path / 'rbac.db'}",
+			revision_poll_interval=60.0,
+			instrumentation_enabled=True,
+		)
+	)
+	await rbac.init()
+	try:
+		await seed(rbac)
+		assert rbac.revisions.running
+		assert await rbac.authorize("user-1", "tickets.read")
+		rbac.reset_stats()
+
+		assert await rbac.authorize("user-1", "tickets.read")
+
+		assert rbac.stats().statements == 0
+	finally:
+		await rbac.close()
@@ -0,0 +1,152 @@
+"""
+Wildcard permissions: the segment trie, its compilation per role, and the
+agreement of the role and user engines on names missing from the catalog.
+"""
+
+import pytest
+
+from vexen_rbac import RBAC, RBACConfig
+from vexen_rbac.application.dto import CreatePermissionRequest, CreateRoleRequest
+from vexen_rbac.application.service.authorization_engine import CompiledPermissions
+from vexen_rbac.domain.entity import Permission, PermissionGroup, Role
+from vexen_rbac.domain.vo import PermissionTrie
+
+
+@pytest.mark.parametrize(
+	("pattern", "name", "expected"),
+	[
+		("tickets.*", "tickets.write", True),
+		("tickets.*", "tickets.comments.write", True),
+		("tickets.*", "tickets", False),
+		("tickets.*", "users.write", False),
+		("*.read", "users.read", True),
+		("*.read", "tickets.read", True),
+		("*.read", "users.write", False),
+		("*.read", "tickets.comments.read", False),
+		("*.*", "users.read", True),
+		("*.*", "tickets.comments.write", True),
+		("*.*", "users", False),
+		("tickets.*.write", "tickets.comments.write", True),
+		("tickets.*.write", "tickets.comments.read", False),
+		("tickets.*.write", "tickets.write", False),
+	],
+)
+def test_trie_matches(pattern, name, expected):
+	assert PermissionTrie([pattern]).matches(name) is expected
+
+
+def test_trie_combines_patterns():
+	trie = PermissionTrie(["tickets.*", "*.read"])
+
+	assert len(trie) == 2
+	assert trie.matches("tickets.close")
+	assert trie.matches("users.read")
+	assert not trie.matches("users.write")
+
+
+def test_empty_trie_matches_nothing():
+	assert not PermissionTrie().matches("tickets.read")
+
+
+@pytest.mark.parametrize("name", ["tickets.wr*", "*tickets.read", "tickets.*x"])
+def test_partial_segment_wildcard_is_rejected(name):
+	with pytest.raises(ValueError, match="whole segment"):
+		Permission(id=1, name=name, display_name=name)
+
+
+def compiled_catalog() -> CompiledPermissions:
+	names = [
+		"tickets.*",
+		"*.read",
+		"*.*",
+		"tickets.write",
+		"tickets.comments.write",
+		"users.read",
+		"users.write",
+	]
+	permissions = [
+		Permission(id=index, name=name, display_name=name)
+		for index, name in enumerate(names, start=1)
+	]
+	by_name = {p.name: p.id for p in permissions}
+	groups = [PermissionGroup(id=1, name="readers", display_name="Readers", permissions=[2])]
+	roles = [
+		Role(id=1, name="tickets", display_name="Tickets", permissions=[by_name["tickets.*"]]),
+		Role(id=2, name="reader", display_name="Reader", permission_groups=[1]),
+		Role(id=3, name="root", display_name="Root", permissions=[by_name["*.*"]]),
+		Role(id=4, name="writer", display_name="Writer", permissions=[by_name["users.write"]]),
+	]
+	return CompiledPermissions.compile(roles, groups, permissions)
+
+
+def test_role_wildcards_hold_only_roles_with_patterns():
+	compiled = compiled_catalog()
+
+	assert set(compiled.role_wildcards) == {1, 2, 3}
+	assert len(compiled.role_wildcards[1]) == 1
+	# Granted through the group
+	assert compiled.role_wildcards[2].matches("users.read")
+	assert not compiled.role_wildcards[2].matches("users.write")
+
+
+def test_compiled_check_expands_wildcards_against_catalog():
+	compiled = compiled_catalog()
+
+	assert compiled.check(1, "tickets.write")
+	assert compiled.check(1, "tickets.comments.write")
+	assert not compiled.check(1, "users.read")
+	assert compiled.check(2, "users.read")
+	assert not compiled.check(2, "users.write")
+	assert compiled.check(3, "users.write")
+	assert not compiled.check(4, "users.read")
+	# Covered by a pattern but missing from the catalog
+	assert not compiled.check(1, "tickets.x.y")
+	assert not compiled.check(3, "billing.refund")
+
+
+def test_permissions_of_lists_matched_catalog_names():
+	compiled = compiled_catalog()
+
+	assert compiled.permissions_of(1) == {"tickets.*", "tickets.write", "tickets.comments.write"}
+
+
+@pytest.mark.asyncio
+async def test_role_and_user_engines_agree(tmp_path):
+	rbac = RBAC(config=RBACConfig(database_url=f"sqlite+aiosqlite:///{tmp_path / 'rbac.db'}"))
+	await rbac.init()
+	try:
+		ids = {}
+		for name in ["tickets.*", "tickets.write", "tickets.comments.write", "users_x.read"]:
+			result = await rbac.permissions.create_permission(
+				CreatePermissionRequest(name=name, display_name=name)
+			)
+			ids[name] = result.data.id
+		role = await rbac.roles.create_role(
+			CreateRoleRequest(
+				name="tickets", display_name="Tickets", permissions=[ids["tickets.*"]]
+			)
+		)
+		await rbac.user_roles.assign_roles("user-1", [role.data.id])
+		await rbac.authorization.load()
+
+		names = [
+			"tickets.*",
+			"tickets.write",
+			"tickets.comments.write",
+			"tickets.x.y",
+			"users_x.read",
+		]
+		expected = {name: rbac.check(role.data.id, name) for name in names}
+		assert expected == {
+			"tickets.*": True,
+			"tickets.write": True,
+			"tickets.comments.write": True,
+			"tickets.x.y": False,
+			"users_x.read": False,
+		}
+		assert await rbac.check_many("user-1", names) == expected
+
+		effective = await rbac.roles.get_effective_permissions([role.data.id])
+		assert [p.name for p in effective.data] == ["tickets.*"]
+	finally:
+		await rbac.close()
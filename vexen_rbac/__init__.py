@@ -20,6 +20,22 @@ Context manager usage:
     ...     role = await rbac.roles.create_role(role_data)
 """
 
-from .core import RBAC, RBACConfig
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from .core import RBAC, RBACConfig
 
 __all__ = ["RBAC", "RBACConfig"]
+
+
+def __getattr__(name: str):
+	# PEP 562: importing a subpackage (models, maintenance CLI) does not load the facade
+	if name in __all__:
+		from . import core
+
+		return getattr(core, name)
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+	return sorted([*globals(), *__all__])
@@ -3,10 +3,13 @@ Data Transfer Objects for the application layer.
 """
 
 from vexen_rbac.application.dto.base import BaseResponse
+from vexen_rbac.application.dto.bulk import BatchGetResponse, BulkCreateResponse, BulkItemError
 from vexen_rbac.application.dto.pagination import (
 	PaginatedResponse,
 	PaginationRequest,
 	PaginationResponse,
+	decode_cursor,
+	encode_cursor,
 )
 from vexen_rbac.application.dto.permission_dto import (
 	CreatePermissionRequest,
@@ -17,31 +20,47 @@ from vexen_rbac.application.dto.permission_dto import (
 )
 from vexen_rbac.application.dto.permission_group_dto import (
 	CreatePermissionGroupRequest,
+	PermissionGroupPermissionsChangeResponse,
 	PermissionGroupResponse,
+	PermissionGroupSummaryResponse,
 	UpdatePermissionGroupRequest,
 )
 from vexen_rbac.application.dto.role_dto import (
 	CreateRoleRequest,
 	RoleExpandedResponse,
+	RolePermissionsChangeResponse,
 	RoleResponse,
+	RoleSummaryResponse,
 	UpdateRoleRequest,
 )
+from vexen_rbac.application.dto.user_role_dto import UserRoleResponse, UserRolesChangeResponse
 
 __all__ = [
 	"BaseResponse",
+	"BatchGetResponse",
+	"BulkCreateResponse",
+	"BulkItemError",
 	"PermissionResponse",
 	"PermissionSimpleResponse",
 	"CreatePermissionRequest",
 	"UpdatePermissionRequest",
 	"PermissionGroupByCategoryResponse",
 	"PermissionGroupResponse",
+	"PermissionGroupPermissionsChangeResponse",
+	"PermissionGroupSummaryResponse",
 	"CreatePermissionGroupRequest",
 	"UpdatePermissionGroupRequest",
 	"RoleResponse",
 	"RoleExpandedResponse",
+	"RolePermissionsChangeResponse",
+	"RoleSummaryResponse",
 	"CreateRoleRequest",
 	"UpdateRoleRequest",
+	"UserRoleResponse",
+	"UserRolesChangeResponse",
 	"PaginationRequest",
 	"PaginationResponse",
 	"PaginatedResponse",
+	"encode_cursor",
+	"decode_cursor",
 ]
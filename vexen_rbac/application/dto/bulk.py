@@ -0,0 +1,52 @@
+"""
+DTOs for bulk use cases.
+"""
+
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkItemError:
+	"""
+	Error for a single item of a bulk request.
+
+	Attributes:
+		index: Position of the item in the request list
+		name: Name of the item, if available
+		error: Error message
+	"""
+
+	index: int
+	name: str | None
+	error: str
+
+
+@dataclass
+class BulkCreateResponse(Generic[T]):
+	"""
+	Result of a bulk create.
+
+	Attributes:
+		created: DTOs of the created items, in request order
+		errors: Items that were not created, with the reason
+	"""
+
+	created: list[T] = field(default_factory=list)
+	errors: list[BulkItemError] = field(default_factory=list)
+
+
+@dataclass
+class BatchGetResponse(Generic[T]):
+	"""
+	Result of fetching many items by ID.
+
+	Attributes:
+		items: DTOs of the items found, in request order
+		missing: Requested IDs that do not exist
+	"""
+
+	items: list[T] = field(default_factory=list)
+	missing: list[int] = field(default_factory=list)
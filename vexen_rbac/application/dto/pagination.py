@@ -1,23 +1,110 @@
+import base64
+import json
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from datetime import datetime
+from math import ceil
+from typing import Generic, Literal, TypeVar
 
 T = TypeVar("T")
 
 
 @dataclass
 class PaginationRequest:
+	"""
+	Pagination parameters.
+
+	Offset mode (default) uses `page`/`page_size`. Cursor mode is used when
+	`mode="cursor"` or a `cursor` is given: pages are fetched by keyset on
+	`(created_at, id)`, so deep pages cost the same as the first one.
+	`include_total` controls whether the total row count is computed in
+	cursor mode (it requires a full count).
+	"""
+
 	page: int = 1
 	page_size: int = 20
+	mode: Literal["offset", "cursor"] = "offset"
+	cursor: str | None = None
+	include_total: bool = False
+
+	@property
+	def uses_cursor(self) -> bool:
+		"""Whether the request should be served with keyset pagination."""
+		return self.mode == "cursor" or self.cursor is not None
 
 
 @dataclass
 class PaginationResponse:
 	page: int
 	page_size: int
-	total_pages: int
-	total_items: int
+	total_pages: int | None
+	total_items: int | None
 	has_next: bool
 	has_prev: bool
+	next_cursor: str | None = None
+
+	@classmethod
+	def for_offset(cls, request: PaginationRequest, total: int) -> "PaginationResponse":
+		"""
+		Build the pagination metadata of an offset page.
+
+		Args:
+			request: The pagination request
+			total: Total number of items
+
+		Returns:
+			PaginationResponse: Offset pagination metadata
+		"""
+		total_pages = ceil(total / request.page_size) if total > 0 else 1
+		return cls(
+			page=request.page,
+			page_size=request.page_size,
+			total_pages=total_pages,
+			total_items=total,
+			has_next=request.page < total_pages,
+			has_prev=request.page > 1,
+		)
+
+	@classmethod
+	def for_cursor(
+		cls, request: PaginationRequest, next_cursor: str | None, total: int | None
+	) -> "PaginationResponse":
+		"""
+		Build the pagination metadata of a keyset page.
+
+		Args:
+			request: The pagination request
+			next_cursor: Cursor of the following page, None on the last page
+			total: Total number of items, if it was requested
+
+		Returns:
+			PaginationResponse: Cursor pagination metadata (total_pages only when
+			the total is known)
+		"""
+		total_pages = None
+		if total is not None:
+			total_pages = ceil(total / request.page_size) if total > 0 else 1
+
+		return cls(
+			page=request.page,
+			page_size=request.page_size,
+			total_pages=total_pages,
+			total_items=total,
+			has_next=next_cursor is not None,
+			has_prev=request.cursor is not None,
+			next_cursor=next_cursor,
+		)
+
+	@classmethod
+	def empty(cls) -> "PaginationResponse":
+		"""Pagination metadata attached to failed responses."""
+		return cls(
+			page=1,
+			page_size=20,
+			total_pages=0,
+			total_items=0,
+			has_next=False,
+			has_prev=False,
+		)
 
 
 @dataclass
@@ -26,3 +113,39 @@ class PaginatedResponse(Generic[T]):
 	data: list[T]
 	pagination: PaginationResponse
 	error: str | None = None
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+	"""
+	Encode a keyset position as an opaque, URL-safe cursor.
+
+	Args:
+		created_at: Creation timestamp of the last item of the page
+		item_id: ID of the last item of the page
+
+	Returns:
+		str: Opaque cursor
+	"""
+	payload = json.dumps([created_at.isoformat(), item_id], separators=(",", ":"))
+	return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+	"""
+	Decode a cursor produced by `encode_cursor`.
+
+	Args:
+		cursor: Opaque cursor
+
+	Returns:
+		tuple: (created_at, id) of the last item of the previous page
+
+	Raises:
+		ValueError: If the cursor is malformed
+	"""
+	try:
+		padded = cursor + "=" * (-len(cursor) % 4)
+		created_at, item_id = json.loads(base64.urlsafe_b64decode(padded))
+		return datetime.fromisoformat(created_at), int(item_id)
+	except (ValueError, TypeError) as e:
+		raise ValueError("Invalid pagination cursor") from e
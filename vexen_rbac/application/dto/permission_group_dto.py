@@ -21,6 +21,28 @@ class PermissionGroupResponse:
 	created_at: datetime
 
 
+@dataclass
+class PermissionGroupSummaryResponse:
+	"""PermissionGroup row with its permission count, without permission IDs."""
+
+	id: int
+	name: str
+	display_name: str
+	description: str | None
+	icon: str | None
+	order: int
+	permission_count: int
+	created_at: datetime
+
+
+@dataclass
+class PermissionGroupPermissionsChangeResponse:
+	"""Permissions actually added to (or removed from) a PermissionGroup."""
+
+	group_id: int
+	permission_ids: list[int]
+
+
 @dataclass
 class CreatePermissionGroupRequest:
 	"""Request DTO for creating a PermissionGroup."""
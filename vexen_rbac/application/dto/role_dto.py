@@ -29,6 +29,27 @@ class RoleExpandedResponse:
 	updated_at: datetime | None
 
 
+@dataclass
+class RoleSummaryResponse:
+	"""Role row with its direct permission count, without relationship IDs."""
+
+	id: int
+	name: str
+	display_name: str
+	description: str | None
+	permission_count: int
+	created_at: datetime
+	updated_at: datetime | None
+
+
+@dataclass
+class RolePermissionsChangeResponse:
+	"""Permissions actually granted to (or revoked from) a Role."""
+
+	role_id: int
+	permission_ids: list[int]
+
+
 @dataclass
 class CreateRoleRequest:
 	"""Request DTO for creating a Role."""
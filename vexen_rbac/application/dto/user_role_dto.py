@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class UserRoleResponse:
+	"""Assignment of a Role to a user."""
+
+	user_id: str
+	role_id: int
+	assigned_at: datetime
+
+
+@dataclass
+class UserRolesChangeResponse:
+	"""Roles actually assigned to (or revoked from) a user."""
+
+	user_id: str
+	role_ids: list[int]
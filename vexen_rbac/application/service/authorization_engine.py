@@ -0,0 +1,239 @@
+"""
+In-memory authorization engine.
+
+Loads the role → permission and role → permission_group → permission graph
+once and compiles each role's effective permissions into an integer bitset,
+so authorization decisions are answered without touching the database.
+Wildcard grants ("tickets.*") are compiled into a per-role segment trie.
+"""
+
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any
+
+from vexen_rbac.domain.entity import Permission, PermissionGroup, Role
+from vexen_rbac.domain.ports import (
+	IPermissionCheckerPort,
+	IPermissionGroupRepositoryPort,
+	IPermissionRepositoryPort,
+	IRoleRepositoryPort,
+)
+from vexen_rbac.domain.vo import PermissionTrie
+
+
+@dataclass(frozen=True)
+class CompiledPermissions:
+	"""
+	Immutable compiled view of the RBAC graph.
+
+	Every permission name is assigned a bit position and every role is
+	reduced to a single integer whose set bits are its effective permissions
+	(direct grants plus everything inherited through permission groups).
+	Wildcard permissions held by a role are also compiled into a trie, so a
+	catalog name not granted explicitly is resolved in O(segments); names
+	missing from the catalog are never granted.
+
+	Attributes:
+		permission_index: Bit position for each permission name
+		role_masks: Effective permission bitset for each role ID
+		role_wildcards: Trie of the wildcard permissions of each role that has any
+	"""
+
+	permission_index: dict[str, int] = field(default_factory=dict)
+	role_masks: dict[int, int] = field(default_factory=dict)
+	role_wildcards: dict[int, PermissionTrie] = field(default_factory=dict)
+
+	@classmethod
+	def compile(
+		cls,
+		roles: list[Role],
+		permission_groups: list[PermissionGroup],
+		permissions: list[Permission],
+	) -> "CompiledPermissions":
+		"""
+		Compile role, group and permission entities into bitsets.
+
+		Args:
+			roles: Roles with their direct permission and group IDs
+			permission_groups: Groups with their permission IDs
+			permissions: Full permission catalog
+
+		Returns:
+			CompiledPermissions: Compiled, read-only view
+		"""
+		permission_index: dict[str, int] = {}
+		position_by_id: dict[int, int] = {}
+		wildcard_mask = 0
+		for position, permission in enumerate(sorted(permissions, key=lambda p: p.name)):
+			permission_index[permission.name] = position
+			position_by_id[permission.id] = position
+			if permission.is_wildcard:
+				wildcard_mask |= 1 << position
+
+		group_masks = {
+			group.id: _to_mask(group.permissions, position_by_id) for group in permission_groups
+		}
+
+		role_masks: dict[int, int] = {}
+		role_wildcards: dict[int, PermissionTrie] = {}
+		for role in roles:
+			mask = _to_mask(role.permissions, position_by_id)
+			for group_id in role.permission_groups:
+				mask |= group_masks.get(group_id, 0)
+			role_masks[role.id] = mask
+			if mask & wildcard_mask:
+				role_wildcards[role.id] = PermissionTrie(
+					name
+					for name, position in permission_index.items()
+					if (mask & wildcard_mask) >> position & 1
+				)
+
+		return cls(
+			permission_index=permission_index,
+			role_masks=role_masks,
+			role_wildcards=role_wildcards,
+		)
+
+	def check(self, role_id: int, permission_name: str) -> bool:
+		"""
+		Check whether a role holds a permission.
+
+		Args:
+			role_id: ID of the role
+			permission_name: Permission name (e.g. "tickets.write")
+
+		Returns:
+			True if the permission is granted, False otherwise (always for
+			names missing from the catalog, even if a wildcard covers them)
+		"""
+		position = self.permission_index.get(permission_name)
+		if position is None:
+			return False
+		if (self.role_masks.get(role_id, 0) >> position) & 1:
+			return True
+		wildcards = self.role_wildcards.get(role_id)
+		return wildcards is not None and wildcards.matches(permission_name)
+
+	def permissions_of(self, role_id: int) -> set[str]:
+		"""
+		Decode the effective permission names of a role.
+
+		Catalog permissions matched by one of the role's wildcards are
+		included along with the wildcard patterns themselves.
+
+		Args:
+			role_id: ID of the role
+
+		Returns:
+			Set of permission names granted to the role
+		"""
+		mask = self.role_masks.get(role_id, 0)
+		wildcards = self.role_wildcards.get(role_id)
+		return {
+			name
+			for name, position in self.permission_index.items()
+			if (mask >> position) & 1 or (wildcards is not None and wildcards.matches(name))
+		}
+
+
+def _to_mask(permission_ids: list[int], position_by_id: dict[int, int]) -> int:
+	"""Build a bitset from permission IDs, ignoring unknown IDs."""
+	mask = 0
+	for permission_id in permission_ids:
+		position = position_by_id.get(permission_id)
+		if position is not None:
+			mask |= 1 << position
+	return mask
+
+
+@dataclass
+class AuthorizationEngine(IPermissionCheckerPort):
+	"""
+	Answers role permission checks from a compiled in-memory graph.
+
+	The graph is loaded through the repository ports with `load()` and must be
+	reloaded to pick up changes made after that point.
+
+	Example:
+		>>> await rbac.authorization.load()
+		>>> rbac.authorization.check(role_id, "tickets.write")
+		True
+	"""
+
+	_role_repository: IRoleRepositoryPort
+	_permission_repository: IPermissionRepositoryPort
+	_permission_group_repository: IPermissionGroupRepositoryPort
+	# Opens a scope whose reads all see one state of the database
+	_consistent_read: Callable[[], AbstractAsyncContextManager[Any]] = nullcontext
+
+	def __post_init__(self):
+		self._compiled: CompiledPermissions | None = None
+
+	@property
+	def is_loaded(self) -> bool:
+		"""Whether the graph has been compiled at least once."""
+		return self._compiled is not None
+
+	@property
+	def compiled(self) -> CompiledPermissions:
+		"""
+		Current compiled graph.
+
+		Raises:
+			RuntimeError: If the engine has not been loaded
+		"""
+		if self._compiled is None:
+			raise RuntimeError(
+				"Authorization engine is not loaded. Call 'await rbac.authorization.load()' first."
+			)
+		return self._compiled
+
+	async def load(self) -> CompiledPermissions:
+		"""
+		Load the RBAC graph from the repositories and compile it.
+
+		The new compiled view replaces the previous one atomically, so
+		concurrent checks always see a consistent graph.
+
+		Returns:
+			CompiledPermissions: The freshly compiled graph
+		"""
+		async with self._consistent_read():
+			roles = await self._role_repository.list()
+			permission_groups = await self._permission_group_repository.list()
+			permissions = await self._permission_repository.list()
+
+		self._compiled = CompiledPermissions.compile(roles, permission_groups, permissions)
+		return self._compiled
+
+	def check(self, role_id: int, permission_name: str) -> bool:
+		"""
+		Check whether a role holds a permission.
+
+		Args:
+			role_id: ID of the role
+			permission_name: Permission name (e.g. "tickets.write")
+
+		Returns:
+			True if the permission is granted, False otherwise
+
+		Raises:
+			RuntimeError: If the engine has not been loaded
+		"""
+		return self.compiled.check(role_id, permission_name)
+
+	def permissions_of(self, role_id: int) -> set[str]:
+		"""
+		Get the effective permission names of a role.
+
+		Args:
+			role_id: ID of the role
+
+		Returns:
+			Set of permission names granted to the role
+
+		Raises:
+			RuntimeError: If the engine has not been loaded
+		"""
+		return self.compiled.permissions_of(role_id)
@@ -0,0 +1,472 @@
+"""
+Vectorized bulk authorization over a role × permission bit matrix.
+
+For jobs that need many decisions at once (reports, data exports), the RBAC
+graph is compiled into one bit-packed matrix with a row per role and a
+column per permission. Group grants are expanded with a boolean matrix
+product (role × group times group × permission), and wildcard grants with a
+second one against the permission catalog; both are computed on packed rows as
+an OR-reduction, since each role references only a few groups. A batch of
+(role, permission) pairs is then answered with a few array operations
+instead of one check per pair.
+
+NumPy is optional: without it (or with `use_numpy=False`) each row is an
+integer bitset and batches are answered pair by pair in pure Python.
+"""
+
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass, field
+from functools import cache
+from types import ModuleType
+from typing import Any
+
+from vexen_rbac.domain.entity import Permission, PermissionGroup, Role
+from vexen_rbac.domain.ports import (
+	IPermissionGroupRepositoryPort,
+	IPermissionRepositoryPort,
+	IRoleRepositoryPort,
+)
+from vexen_rbac.domain.vo import PermissionTrie
+
+# Cells (roles × permissions) expanded per matrix product, bounding the dense
+# intermediate matrices to a few tens of MB
+CHUNK_CELLS = 1 << 22
+
+# ID → position lookups use a dense table when it has at most this many slots
+# per ID (autoincrement IDs); sparser IDs are binary-searched
+DENSE_INDEX_RATIO = 4
+
+
+@cache
+def _numpy() -> ModuleType | None:
+	"""NumPy module, or None when it is not installed (imported on first use)."""
+	try:
+		import numpy
+	except ImportError:
+		return None
+	return numpy
+
+
+def numpy_available() -> bool:
+	"""Whether the NumPy engine can be used."""
+	return _numpy() is not None
+
+
+@dataclass(frozen=True)
+class PermissionMatrix:
+	"""
+	Immutable role × permission matrix of effective grants.
+
+	Rows follow `role_ids` and columns follow `permission_ids`, both sorted
+	ascending. With NumPy, `rows` is a uint8 array of shape
+	(roles, ceil(permissions / 8)) holding the bits packed along each row;
+	otherwise it is a list with one integer bitset per role.
+
+	Attributes:
+		role_ids: Role IDs, ascending
+		permission_ids: Permission IDs, ascending
+		rows: Effective permissions of each role, bit-packed
+		role_index: Row of each role ID (dict, or _IdIndex with NumPy)
+		permission_index: Column of each permission ID (dict, or _IdIndex with NumPy)
+	"""
+
+	role_ids: Sequence[int]
+	permission_ids: Sequence[int]
+	rows: Any
+	role_index: Any = field(default=None, repr=False)
+	permission_index: Any = field(default=None, repr=False)
+
+	@property
+	def uses_numpy(self) -> bool:
+		"""Whether the matrix is backed by NumPy arrays."""
+		return not isinstance(self.rows, list)
+
+	@classmethod
+	def compile(
+		cls,
+		roles: list[Role],
+		permission_groups: list[PermissionGroup],
+		permissions: list[Permission],
+		use_numpy: bool | None = None,
+	) -> "PermissionMatrix":
+		"""
+		Compile role, group and permission entities into a bit matrix.
+
+		Wildcard permissions held by a role ("tickets.*") are expanded to every
+		catalog permission they match, as in snapshots.
+
+		Args:
+			roles: Roles with their direct permission and group IDs
+			permission_groups: Groups with their permission IDs
+			permissions: Full permission catalog
+			use_numpy: Force (True) or disable (False) the NumPy engine; by
+				default it is used when NumPy is installed
+
+		Returns:
+			PermissionMatrix: Compiled, read-only matrix
+
+		Raises:
+			RuntimeError: If use_numpy is True and NumPy is not installed
+		"""
+		np = _numpy()
+		if use_numpy and np is None:
+			raise RuntimeError(
+				"NumPy is not installed. Install it with 'pip install vexen-rbac[numpy]'"
+			)
+		if use_numpy is False:
+			np = None
+
+		ordered_roles = sorted(roles, key=lambda r: r.id)
+		ordered_permissions = sorted(permissions, key=lambda p: p.id)
+		ordered_groups = sorted(permission_groups, key=lambda g: g.id)
+		position_by_permission = {p.id: position for position, p in enumerate(ordered_permissions)}
+		position_by_group = {g.id: position for position, g in enumerate(ordered_groups)}
+		expansions = _wildcard_expansions(ordered_permissions)
+
+		role_ids = [r.id for r in ordered_roles]
+		permission_ids = [p.id for p in ordered_permissions]
+		if np is None:
+			rows = _compile_bitsets(
+				ordered_roles, ordered_groups, position_by_permission, position_by_group, expansions
+			)
+			return cls(
+				role_ids=role_ids,
+				permission_ids=permission_ids,
+				rows=rows,
+				role_index={role_id: position for position, role_id in enumerate(role_ids)},
+				permission_index=position_by_permission,
+			)
+
+		rows = _compile_matrix(
+			np,
+			ordered_roles,
+			ordered_groups,
+			position_by_permission,
+			position_by_group,
+			expansions,
+		)
+		role_index = _IdIndex.build(np, role_ids)
+		permission_index = _IdIndex.build(np, permission_ids)
+		return cls(
+			role_ids=role_index.ids,
+			permission_ids=permission_index.ids,
+			rows=rows,
+			role_index=role_index,
+			permission_index=permission_index,
+		)
+
+	def check_batch(self, role_ids: Sequence[int], permission_ids: Sequence[int]) -> Any:
+		"""
+		Check many (role, permission) pairs at once.
+
+		Pairs are taken position by position from both sequences. Unknown
+		role or permission IDs are denied.
+
+		Args:
+			role_ids: Role ID of each pair
+			permission_ids: Permission ID of each pair (same length)
+
+		Returns:
+			ndarray[bool] with the NumPy engine, otherwise list[bool]
+
+		Raises:
+			ValueError: If the sequences have different lengths
+		"""
+		if len(role_ids) != len(permission_ids):
+			raise ValueError(
+				f"role_ids and permission_ids must have the same length "
+				f"({len(role_ids)} != {len(permission_ids)})"
+			)
+		if self.uses_numpy:
+			return self._check_batch_numpy(_numpy(), role_ids, permission_ids)
+
+		decisions = []
+		for role_id, permission_id in zip(role_ids, permission_ids, strict=True):
+			role = self.role_index.get(role_id)
+			permission = self.permission_index.get(permission_id)
+			decisions.append(
+				role is not None
+				and permission is not None
+				and (self.rows[role] >> permission) & 1 == 1
+			)
+		return decisions
+
+	def _check_batch_numpy(
+		self, np: ModuleType, role_ids: Sequence[int], permission_ids: Sequence[int]
+	) -> Any:
+		roles, found_roles = self.role_index.positions(np, role_ids)
+		permissions, found_permissions = self.permission_index.positions(np, permission_ids)
+		found = found_roles & found_permissions
+		if not found.any():
+			return found
+		# Column p is bit (7 - p % 8) of byte p // 8 (np.packbits is big-endian)
+		packed = self.rows[roles, permissions >> 3]
+		bits = (packed >> (7 - (permissions & 7)).astype(np.uint8)) & 1
+		return found & (bits == 1)
+
+
+@dataclass(frozen=True)
+class _IdIndex:
+	"""
+	Vectorized ID → position lookup of the NumPy engine.
+
+	`table[id - base]` holds the position of each ID (-1 where there is none)
+	when the IDs are dense enough; otherwise `table` is None and the sorted
+	`ids` array is binary-searched.
+	"""
+
+	ids: Any
+	base: int = 0
+	table: Any = None
+
+	@classmethod
+	def build(cls, np: ModuleType, ids: list[int]) -> "_IdIndex":
+		array = np.asarray(ids, dtype=np.int64)
+		if not ids or ids[-1] - ids[0] + 1 > DENSE_INDEX_RATIO * len(ids):
+			return cls(array)
+		table = np.full(ids[-1] - ids[0] + 1, -1, dtype=np.intp)
+		table[array - ids[0]] = np.arange(len(ids))
+		return cls(array, ids[0], table)
+
+	def positions(self, np: ModuleType, values: Sequence[int]) -> tuple[Any, Any]:
+		"""Positions of the values (0 where missing), and which values were found."""
+		values = np.asarray(values, dtype=np.int64)
+		if len(self.ids) == 0:
+			return np.zeros(len(values), dtype=np.intp), np.zeros(len(values), dtype=bool)
+		if self.table is not None:
+			offsets = values - self.base
+			in_range = (offsets >= 0) & (offsets < len(self.table))
+			positions = self.table[np.where(in_range, offsets, 0)]
+			found = in_range & (positions >= 0)
+		else:
+			positions = np.minimum(np.searchsorted(self.ids, values), len(self.ids) - 1)
+			found = self.ids[positions] == values
+		return np.where(found, positions, 0), found
+
+
+def _wildcard_expansions(ordered_permissions: list[Permission]) -> dict[int, list[int]]:
+	"""Catalog positions matched by each wildcard permission, keyed by its position."""
+	expansions = {}
+	for position, permission in enumerate(ordered_permissions):
+		if permission.is_wildcard:
+			trie = PermissionTrie([permission.name])
+			expansions[position] = [
+				matched for matched, p in enumerate(ordered_permissions) if trie.matches(p.name)
+			]
+	return expansions
+
+
+def _compile_bitsets(
+	ordered_roles: list[Role],
+	ordered_groups: list[PermissionGroup],
+	position_by_permission: dict[int, int],
+	position_by_group: dict[int, int],
+	expansions: dict[int, list[int]],
+) -> list[int]:
+	"""Pure-Python engine: one integer bitset per role."""
+
+	def to_mask(permission_ids: list[int]) -> int:
+		mask = 0
+		for permission_id in permission_ids:
+			position = position_by_permission.get(permission_id)
+			if position is not None:
+				mask |= 1 << position
+		return mask
+
+	group_masks = [to_mask(g.permissions) for g in ordered_groups]
+	expansion_masks = {
+		position: sum(1 << matched for matched in matches)
+		for position, matches in expansions.items()
+	}
+	rows = []
+	for role in ordered_roles:
+		mask = to_mask(role.permissions)
+		for group_id in role.permission_groups:
+			group = position_by_group.get(group_id)
+			if group is not None:
+				mask |= group_masks[group]
+		for position, expansion in expansion_masks.items():
+			if (mask >> position) & 1:
+				mask |= expansion
+		rows.append(mask)
+	return rows
+
+
+def _compile_matrix(
+	np: ModuleType,
+	ordered_roles: list[Role],
+	ordered_groups: list[PermissionGroup],
+	position_by_permission: dict[int, int],
+	position_by_group: dict[int, int],
+	expansions: dict[int, list[int]],
+) -> Any:
+	"""NumPy engine: bit-packed uint8 matrix, expanded CHUNK_CELLS at a time."""
+	permission_count = len(position_by_permission)
+	row_chunk = max(1, CHUNK_CELLS // max(permission_count, 1))
+
+	# Group × permission and wildcard × matched permission matrices, bit-packed
+	groups = _packed(
+		np,
+		([position_by_permission.get(p) for p in g.permissions] for g in ordered_groups),
+		len(ordered_groups),
+		permission_count,
+	)
+	wildcards = _packed(np, expansions.values(), len(expansions), permission_count)
+	wildcard_columns = np.asarray(list(expansions), dtype=np.intp)
+
+	direct_rows, direct_columns = _coordinates(
+		np, ([position_by_permission.get(p) for p in r.permissions] for r in ordered_roles)
+	)
+	group_rows, group_columns = _coordinates(
+		np, ([position_by_group.get(g) for g in r.permission_groups] for r in ordered_roles)
+	)
+
+	packed = np.zeros((len(ordered_roles), (permission_count + 7) // 8), dtype=np.uint8)
+	for start in range(0, len(ordered_roles), row_chunk):
+		end = min(start + row_chunk, len(ordered_roles))
+		effective = np.zeros((end - start, permission_count), dtype=bool)
+		_fill(np, effective, direct_rows, direct_columns, start, end)
+		chunk = np.packbits(effective, axis=1)
+
+		# (role × group) ∘ (group × permission) as a boolean matrix product
+		low, high = np.searchsorted(group_rows, [start, end])
+		_or_product(np, chunk, group_rows[low:high] - start, group_columns[low:high], groups)
+
+		# (role × wildcard) ∘ (wildcard × permission), from the expanded grants
+		if len(expansions):
+			held = (chunk[:, wildcard_columns >> 3] >> (7 - (wildcard_columns & 7))) & 1
+			rows, wildcard = np.nonzero(held)
+			_or_product(np, chunk, rows, wildcard, wildcards)
+
+		packed[start:end] = chunk
+	return packed
+
+
+def _packed(np: ModuleType, lists: Any, count: int, permission_count: int) -> Any:
+	"""Bit-packed matrix with one row per adjacency list."""
+	matrix = np.zeros((count, permission_count), dtype=bool)
+	rows, columns = _coordinates(np, lists)
+	matrix[rows, columns] = True
+	return np.packbits(matrix, axis=1)
+
+
+def _or_product(np: ModuleType, target: Any, rows: Any, sources: Any, matrix: Any) -> None:
+	"""
+	OR the packed `matrix[sources[i]]` into `target[rows[i]]` (rows ascending).
+
+	This is the boolean product of the sparse (target row × source) relation
+	and `matrix`, computed as one OR-reduction per target row.
+	"""
+	if len(rows) == 0:
+		return
+	starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+	target[rows[starts]] |= np.bitwise_or.reduceat(matrix[sources], starts, axis=0)
+
+
+def _coordinates(np: ModuleType, lists: Any) -> tuple[Any, Any]:
+	"""(row, column) arrays of adjacency lists, skipping None columns; rows ascending."""
+	rows: list[int] = []
+	columns: list[int] = []
+	for row, values in enumerate(lists):
+		for column in values:
+			if column is not None:
+				rows.append(row)
+				columns.append(column)
+	return np.asarray(rows, dtype=np.intp), np.asarray(columns, dtype=np.intp)
+
+
+def _fill(np: ModuleType, matrix: Any, rows: Any, columns: Any, start: int, end: int) -> None:
+	"""Set the coordinates whose row falls in [start, end) (rows are ascending)."""
+	low, high = np.searchsorted(rows, [start, end])
+	matrix[rows[low:high] - start, columns[low:high]] = 1
+
+
+@dataclass
+class BulkAuthorizer:
+	"""
+	Answers large batches of role permission checks from a PermissionMatrix.
+
+	The matrix is loaded through the repository ports with `load()` and must
+	be reloaded to pick up changes made after that point.
+
+	Example:
+		>>> await rbac.bulk_authorization.load()
+		>>> rbac.check_batch([1, 1, 2], [10, 11, 10])
+		array([ True, False,  True])
+	"""
+
+	_role_repository: IRoleRepositoryPort
+	_permission_repository: IPermissionRepositoryPort
+	_permission_group_repository: IPermissionGroupRepositoryPort
+	# Opens a scope whose reads all see one state of the database
+	_consistent_read: Callable[[], AbstractAsyncContextManager[Any]] = nullcontext
+
+	def __post_init__(self):
+		self._matrix: PermissionMatrix | None = None
+		self._use_numpy: bool | None = None
+
+	@property
+	def is_loaded(self) -> bool:
+		"""Whether the matrix has been compiled at least once."""
+		return self._matrix is not None
+
+	@property
+	def matrix(self) -> PermissionMatrix:
+		"""
+		Current compiled matrix.
+
+		Raises:
+			RuntimeError: If the authorizer has not been loaded
+		"""
+		if self._matrix is None:
+			raise RuntimeError(
+				"Bulk authorizer is not loaded. Call 'await rbac.bulk_authorization.load()' first."
+			)
+		return self._matrix
+
+	async def load(self, use_numpy: bool | None = None) -> PermissionMatrix:
+		"""
+		Load the RBAC graph from the repositories and compile it.
+
+		The new matrix replaces the previous one atomically, so concurrent
+		batches always see a consistent graph.
+
+		Args:
+			use_numpy: Force (True) or disable (False) the NumPy engine; by
+				default it is used when NumPy is installed. Kept for reloads.
+
+		Returns:
+			PermissionMatrix: The freshly compiled matrix
+
+		Raises:
+			RuntimeError: If use_numpy is True and NumPy is not installed
+		"""
+		if use_numpy is not None:
+			self._use_numpy = use_numpy
+		async with self._consistent_read():
+			roles = await self._role_repository.list()
+			permission_groups = await self._permission_group_repository.list()
+			permissions = await self._permission_repository.list()
+
+		self._matrix = PermissionMatrix.compile(
+			roles, permission_groups, permissions, use_numpy=self._use_numpy
+		)
+		return self._matrix
+
+	def check_batch(self, role_ids: Sequence[int], permission_ids: Sequence[int]) -> Any:
+		"""
+		Check many (role, permission) pairs at once.
+
+		Args:
+			role_ids: Role ID of each pair
+			permission_ids: Permission ID of each pair (same length)
+
+		Returns:
+			ndarray[bool] with the NumPy engine, otherwise list[bool]
+
+		Raises:
+			RuntimeError: If the authorizer has not been loaded
+			ValueError: If the sequences have different lengths
+		"""
+		return self.matrix.check_batch(role_ids, permission_ids)
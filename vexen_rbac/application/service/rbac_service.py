@@ -1,14 +1,22 @@
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass
+from typing import Any
 
+from vexen_rbac.application.service.authorization_engine import AuthorizationEngine
+from vexen_rbac.application.service.bulk_authorizer import BulkAuthorizer
+from vexen_rbac.application.service.user_authorizer import UserAuthorizer
 from vexen_rbac.application.usecase import (
 	PermissionGroupUseCaseFactory,
 	PermissionUseCaseFactory,
 	RoleUseCaseFactory,
+	UserRoleUseCaseFactory,
 )
 from vexen_rbac.domain.ports import (
 	IPermissionGroupRepositoryPort,
 	IPermissionRepositoryPort,
 	IRoleRepositoryPort,
+	IUserRoleRepositoryPort,
 )
 
 
@@ -17,11 +25,27 @@ class RBACService:
 	_role_repository: IRoleRepositoryPort
 	_permission_repository: IPermissionRepositoryPort
 	_permission_group_repository: IPermissionGroupRepositoryPort
+	_user_role_repository: IUserRoleRepositoryPort | None = None
+	_consistent_read: Callable[[], AbstractAsyncContextManager[Any]] = nullcontext
 
 	def __post_init__(self):
 		self.roles = RoleUseCaseFactory(self._role_repository)
 		self.permissions = PermissionUseCaseFactory(self._permission_repository)
 		self.permission_groups = PermissionGroupUseCaseFactory(self._permission_group_repository)
+		self.user_roles = UserRoleUseCaseFactory(self._user_role_repository)
+		self.authorization = AuthorizationEngine(
+			self._role_repository,
+			self._permission_repository,
+			self._permission_group_repository,
+			self._consistent_read,
+		)
+		self.bulk_authorization = BulkAuthorizer(
+			self._role_repository,
+			self._permission_repository,
+			self._permission_group_repository,
+			self._consistent_read,
+		)
+		self.user_authorization = UserAuthorizer(self._user_role_repository)
 
 	async def health_check(self) -> bool:
 		"""
@@ -36,21 +60,39 @@ class RBACService:
 	async def get_role_by_id(self, role_id: int):
 		return await self.roles.get_role(role_id)
 
+	async def get_roles_by_ids(self, role_ids: list[int]):
+		return await self.roles.get_roles_by_ids(role_ids)
+
 	async def get_list_of_roles(self):
 		return await self.roles.list_roles()
 
+	def iter_roles(self, chunk_size: int = 500):
+		return self.roles.iter_roles(chunk_size)
+
 	async def get_permission_by_id(self, permission_id: int):
 		return await self.permissions.get_permission(permission_id)
 
+	async def get_permissions_by_ids(self, permission_ids: list[int]):
+		return await self.permissions.get_permissions_by_ids(permission_ids)
+
 	async def get_list_of_permissions(self):
 		return await self.permissions.list_permissions()
 
+	def iter_permissions(self, chunk_size: int = 500):
+		return self.permissions.iter_permissions(chunk_size)
+
 	async def get_permission_group_by_id(self, permission_group_id: int):
 		return await self.permission_groups.get_permission_group(permission_group_id)
 
+	async def get_permission_groups_by_ids(self, permission_group_ids: list[int]):
+		return await self.permission_groups.get_permission_groups_by_ids(permission_group_ids)
+
 	async def get_list_of_permission_groups(self):
 		return await self.permission_groups.list_permission_groups()
 
+	def iter_permission_groups(self, chunk_size: int = 500):
+		return self.permission_groups.iter_permission_groups(chunk_size)
+
 	async def create_role(self, role_data):
 		return await self.roles.create_role(role_data)
 
@@ -60,6 +102,15 @@ class RBACService:
 	async def create_permission_group(self, permission_group_data):
 		return await self.permission_groups.create_permission_group(permission_group_data)
 
+	async def create_roles_bulk(self, roles_data: list):
+		return await self.roles.create_roles_bulk(roles_data)
+
+	async def create_permissions_bulk(self, permissions_data: list):
+		return await self.permissions.create_permissions_bulk(permissions_data)
+
+	async def create_permission_groups_bulk(self, permission_groups_data: list):
+		return await self.permission_groups.create_permission_groups_bulk(permission_groups_data)
+
 	async def update_role(self, role_id: int, role_data):
 		return await self.roles.update_role(role_id, role_data)
 
@@ -101,14 +152,56 @@ class RBACService:
 	async def count_group_permissions(self, group_id: int):
 		return await self.permission_groups.count_permissions(group_id)
 
+	async def list_roles_with_counts(self):
+		return await self.roles.list_roles_with_counts()
+
+	async def list_permission_groups_with_counts(self):
+		return await self.permission_groups.list_permission_groups_with_counts()
+
 	async def list_roles_paginated(self, page: int = 1, page_size: int = 20):
 		from vexen_rbac.application.dto import PaginationRequest
 
 		request = PaginationRequest(page=page, page_size=page_size)
 		return await self.roles.list_roles_paginated(request)
 
+	async def list_permissions_paginated(self, page: int = 1, page_size: int = 20):
+		from vexen_rbac.application.dto import PaginationRequest
+
+		request = PaginationRequest(page=page, page_size=page_size)
+		return await self.permissions.list_permissions_paginated(request)
+
+	async def list_permission_groups_paginated(self, page: int = 1, page_size: int = 20):
+		from vexen_rbac.application.dto import PaginationRequest
+
+		request = PaginationRequest(page=page, page_size=page_size)
+		return await self.permission_groups.list_permission_groups_paginated(request)
+
 	async def get_role_expanded(self, role_id: int):
 		return await self.roles.get_role_expanded(role_id)
 
+	async def get_effective_permissions(self, role_ids: list[int]):
+		return await self.roles.get_effective_permissions(role_ids)
+
 	async def get_permissions_grouped(self):
 		return await self.permissions.get_permissions_grouped()
+
+	async def assign_roles_to_user(self, user_id: str, role_ids: list[int]):
+		return await self.user_roles.assign_roles(user_id, role_ids)
+
+	async def revoke_roles_from_user(self, user_id: str, role_ids: list[int]):
+		return await self.user_roles.revoke_roles(user_id, role_ids)
+
+	async def authorize(self, user_id: str, permission_name: str) -> bool:
+		return await self.user_authorization.authorize(user_id, permission_name)
+
+	async def check_many(self, user_id: str, permission_names: list[str]) -> dict[str, bool]:
+		return await self.user_authorization.check_many(user_id, permission_names)
+
+	async def list_user_roles(self, user_id: str):
+		return await self.user_roles.list_user_roles(user_id)
+
+	async def list_role_users(self, role_id: int, page: int = 1, page_size: int = 20):
+		from vexen_rbac.application.dto import PaginationRequest
+
+		request = PaginationRequest(page=page, page_size=page_size)
+		return await self.user_roles.list_role_users(role_id, request)
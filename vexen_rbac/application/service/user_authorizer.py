@@ -0,0 +1,69 @@
+"""
+Permission checks for the users of the application, resolved through their roles.
+"""
+
+from dataclasses import dataclass
+
+from vexen_rbac.domain.ports import IUserRoleRepositoryPort
+from vexen_rbac.domain.vo import PermissionSet
+
+
+@dataclass
+class UserAuthorizer:
+	"""
+	Answers user permission checks from the user's effective permission set.
+
+	The set (direct and group-derived grants of every role of the user) is
+	resolved by the repository in one query; `RBAC` puts a per-user cache in
+	front of it, so repeated checks for the same user do not touch the
+	database until roles or grants change. Wildcard grants ("tickets.*",
+	"*.read") are matched through the set's segment trie.
+
+	Example:
+		>>> await rbac.authorize("user-42", "tickets.write")
+		True
+		>>> await rbac.check_many("user-42", ["tickets.read", "users.delete"])
+		{'tickets.read': True, 'users.delete': False}
+	"""
+
+	_user_role_repository: IUserRoleRepositoryPort
+
+	async def permissions_of(self, user_id: str) -> PermissionSet:
+		"""
+		Get the effective permissions of a user.
+
+		Args:
+			user_id: Identifier of the user
+
+		Returns:
+			PermissionSet granted through the user's roles; its `names` are the
+			granted names and patterns plus the catalog names the patterns match
+		"""
+		return await self._user_role_repository.get_permission_set(user_id)
+
+	async def authorize(self, user_id: str, permission_name: str) -> bool:
+		"""
+		Check whether a user holds a permission through any of their roles.
+
+		Args:
+			user_id: Identifier of the user
+			permission_name: Permission name (e.g. "tickets.write")
+
+		Returns:
+			True if the permission is granted, False otherwise
+		"""
+		return permission_name in await self.permissions_of(user_id)
+
+	async def check_many(self, user_id: str, permission_names: list[str]) -> dict[str, bool]:
+		"""
+		Check many permissions of a user with a single lookup of their permission set.
+
+		Args:
+			user_id: Identifier of the user
+			permission_names: Permission names to check
+
+		Returns:
+			Decision for each requested name
+		"""
+		granted = await self.permissions_of(user_id)
+		return {name: name in granted for name in permission_names}
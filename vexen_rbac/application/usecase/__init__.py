@@ -4,12 +4,37 @@ Use cases for the RBAC application.
 This module exports all use cases organized by entity.
 """
 
-from .permission.factory import PermissionUseCaseFactory
-from .permission_group.factory import PermissionGroupUseCaseFactory
-from .role.factory import RoleUseCaseFactory
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from .permission.factory import PermissionUseCaseFactory
+	from .permission_group.factory import PermissionGroupUseCaseFactory
+	from .role.factory import RoleUseCaseFactory
+	from .user_role.factory import UserRoleUseCaseFactory
+
+# Factory name -> module, imported on first access (PEP 562)
+_FACTORIES = {
+	"RoleUseCaseFactory": ".role.factory",
+	"PermissionUseCaseFactory": ".permission.factory",
+	"PermissionGroupUseCaseFactory": ".permission_group.factory",
+	"UserRoleUseCaseFactory": ".user_role.factory",
+}
 
 __all__ = [
 	"RoleUseCaseFactory",
 	"PermissionUseCaseFactory",
 	"PermissionGroupUseCaseFactory",
+	"UserRoleUseCaseFactory",
 ]
+
+
+def __getattr__(name: str):
+	module = _FACTORIES.get(name)
+	if module is None:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	return getattr(import_module(module, __name__), name)
+
+
+def __dir__() -> list[str]:
+	return sorted([*globals(), *__all__])
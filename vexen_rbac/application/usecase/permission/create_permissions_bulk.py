@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto.base import BaseResponse
+from vexen_rbac.application.dto.bulk import BulkCreateResponse, BulkItemError
+from vexen_rbac.application.dto.permission_dto import (
+	CreatePermissionRequest,
+	PermissionResponse,
+)
+from vexen_rbac.domain.entity.permission import Permission
+from vexen_rbac.domain.ports.permission_repository_port import IPermissionRepositoryPort
+
+
+@dataclass
+class CreatePermissionsBulk:
+	repository: IPermissionRepositoryPort
+
+	async def __call__(
+		self, requests: list[CreatePermissionRequest]
+	) -> BaseResponse[BulkCreateResponse[PermissionResponse]]:
+		try:
+			response = BulkCreateResponse[PermissionResponse]()
+			permissions: list[Permission] = []
+			indexes: list[int] = []
+			seen: set[str] = set()
+
+			for index, request in enumerate(requests):
+				try:
+					if request.name in seen:
+						raise ValueError(f"Duplicate name '{request.name}' in batch")
+					permission = Permission(
+						id=None,
+						name=request.name,
+						display_name=request.display_name,
+						description=request.description,
+						category=request.category,
+					)
+				except ValueError as e:
+					response.errors.append(BulkItemError(index, request.name, str(e)))
+					continue
+
+				seen.add(request.name)
+				permissions.append(permission)
+				indexes.append(index)
+
+			saved = await self.repository.create_many(permissions)
+
+			for index, permission, saved_permission in zip(
+				indexes, permissions, saved, strict=True
+			):
+				if saved_permission is None:
+					response.errors.append(
+						BulkItemError(
+							index, permission.name, f"Permission '{permission.name}' already exists"
+						)
+					)
+					continue
+
+				response.created.append(
+					PermissionResponse(
+						id=saved_permission.id,
+						name=saved_permission.name,
+						display_name=saved_permission.display_name,
+						description=saved_permission.description,
+						category=saved_permission.category,
+						created_at=saved_permission.created_at,
+					)
+				)
+
+			response.errors.sort(key=lambda error: error.index)
+			return BaseResponse.ok(response)
+
+		except Exception as e:
+			return BaseResponse.fail(f"Error creating permissions: {str(e)}")
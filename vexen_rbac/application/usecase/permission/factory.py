@@ -1,23 +1,84 @@
 from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from vexen_rbac.domain.ports.permission_repository_port import IPermissionRepositoryPort
 
-from .create_permission import CreatePermission
-from .delete_permission import DeletePermission
-from .get_permission import GetPermission
-from .get_permissions_grouped import GetPermissionsGrouped
-from .list_permissions import ListPermissions
-from .update_permission import UpdatePermission
+if TYPE_CHECKING:
+	from .create_permission import CreatePermission
+	from .create_permissions_bulk import CreatePermissionsBulk
+	from .delete_permission import DeletePermission
+	from .get_permission import GetPermission
+	from .get_permissions_by_ids import GetPermissionsByIds
+	from .get_permissions_grouped import GetPermissionsGrouped
+	from .iter_permissions import IterPermissions
+	from .list_permissions import ListPermissions
+	from .list_permissions_paginated import ListPermissionsPaginated
+	from .update_permission import UpdatePermission
 
 
 @dataclass
 class PermissionUseCaseFactory:
+	"""Permission use cases, each built (and its module imported) on first access."""
+
 	repository: IPermissionRepositoryPort
 
-	def __post_init__(self):
-		self.create_permission = CreatePermission(self.repository)
-		self.get_permission = GetPermission(self.repository)
-		self.delete_permission = DeletePermission(self.repository)
-		self.update_permission = UpdatePermission(self.repository)
-		self.list_permissions = ListPermissions(self.repository)
-		self.get_permissions_grouped = GetPermissionsGrouped(self.repository)
+	@cached_property
+	def create_permission(self) -> "CreatePermission":
+		from .create_permission import CreatePermission
+
+		return CreatePermission(self.repository)
+
+	@cached_property
+	def create_permissions_bulk(self) -> "CreatePermissionsBulk":
+		from .create_permissions_bulk import CreatePermissionsBulk
+
+		return CreatePermissionsBulk(self.repository)
+
+	@cached_property
+	def get_permission(self) -> "GetPermission":
+		from .get_permission import GetPermission
+
+		return GetPermission(self.repository)
+
+	@cached_property
+	def get_permissions_by_ids(self) -> "GetPermissionsByIds":
+		from .get_permissions_by_ids import GetPermissionsByIds
+
+		return GetPermissionsByIds(self.repository)
+
+	@cached_property
+	def delete_permission(self) -> "DeletePermission":
+		from .delete_permission import DeletePermission
+
+		return DeletePermission(self.repository)
+
+	@cached_property
+	def update_permission(self) -> "UpdatePermission":
+		from .update_permission import UpdatePermission
+
+		return UpdatePermission(self.repository)
+
+	@cached_property
+	def list_permissions(self) -> "ListPermissions":
+		from .list_permissions import ListPermissions
+
+		return ListPermissions(self.repository)
+
+	@cached_property
+	def iter_permissions(self) -> "IterPermissions":
+		from .iter_permissions import IterPermissions
+
+		return IterPermissions(self.repository)
+
+	@cached_property
+	def list_permissions_paginated(self) -> "ListPermissionsPaginated":
+		from .list_permissions_paginated import ListPermissionsPaginated
+
+		return ListPermissionsPaginated(self.repository)
+
+	@cached_property
+	def get_permissions_grouped(self) -> "GetPermissionsGrouped":
+		from .get_permissions_grouped import GetPermissionsGrouped
+
+		return GetPermissionsGrouped(self.repository)
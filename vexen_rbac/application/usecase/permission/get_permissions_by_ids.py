@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto.base import BaseResponse
+from vexen_rbac.application.dto.bulk import BatchGetResponse
+from vexen_rbac.application.dto.permission_dto import PermissionResponse
+from vexen_rbac.domain.ports.permission_repository_port import IPermissionRepositoryPort
+
+
+@dataclass
+class GetPermissionsByIds:
+	repository: IPermissionRepositoryPort
+
+	async def __call__(
+		self, permission_ids: list[int]
+	) -> BaseResponse[BatchGetResponse[PermissionResponse]]:
+		try:
+			permissions = await self.repository.get_many(permission_ids)
+			by_id = {permission.id: permission for permission in permissions}
+
+			response = BatchGetResponse[PermissionResponse]()
+			for permission_id in dict.fromkeys(permission_ids):
+				permission = by_id.get(permission_id)
+				if permission is None:
+					response.missing.append(permission_id)
+					continue
+
+				response.items.append(
+					PermissionResponse(
+						id=permission.id,
+						name=permission.name,
+						display_name=permission.display_name,
+						description=permission.description,
+						category=permission.category,
+						created_at=permission.created_at,
+					)
+				)
+
+			return BaseResponse.ok(response)
+
+		except Exception as e:
+			return BaseResponse.fail(f"Error getting permissions: {str(e)}")
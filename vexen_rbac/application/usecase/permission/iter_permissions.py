@@ -0,0 +1,34 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto.permission_dto import PermissionResponse
+from vexen_rbac.domain.ports.permission_repository_port import IPermissionRepositoryPort
+
+
+@dataclass
+class IterPermissions:
+	"""
+	Stream every permission, ordered by name, in chunks of at most `chunk_size` DTOs.
+
+	Unlike ListPermissions, only one chunk is held in memory at a time. Errors
+	are raised instead of being wrapped in a BaseResponse.
+	"""
+
+	repository: IPermissionRepositoryPort
+
+	async def __call__(self, chunk_size: int = 500) -> AsyncIterator[list[PermissionResponse]]:
+		if chunk_size < 1:
+			raise ValueError("chunk_size must be at least 1")
+
+		async for permissions in self.repository.stream(chunk_size):
+			yield [
+				PermissionResponse(
+					id=p.id,
+					name=p.name,
+					display_name=p.display_name,
+					description=p.description,
+					category=p.category,
+					created_at=p.created_at,
+				)
+				for p in permissions
+			]
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto import (
+	PaginatedResponse,
+	PaginationRequest,
+	PaginationResponse,
+	PermissionResponse,
+	decode_cursor,
+	encode_cursor,
+)
+from vexen_rbac.domain.ports.permission_repository_port import IPermissionRepositoryPort
+
+
+@dataclass
+class ListPermissionsPaginated:
+	repository: IPermissionRepositoryPort
+
+	async def __call__(self, request: PaginationRequest) -> PaginatedResponse[PermissionResponse]:
+		try:
+			if request.uses_cursor:
+				after = decode_cursor(request.cursor) if request.cursor else None
+				# Fetch one extra row to know whether another page follows
+				permissions, total = await self.repository.list_after(
+					after, request.page_size + 1, request.include_total
+				)
+				has_next = len(permissions) > request.page_size
+				permissions = permissions[: request.page_size]
+				next_cursor = (
+					encode_cursor(permissions[-1].created_at, permissions[-1].id)
+					if has_next
+					else None
+				)
+				pagination = PaginationResponse.for_cursor(request, next_cursor, total)
+			else:
+				permissions, total = await self.repository.list_paginated(
+					request.page, request.page_size
+				)
+				pagination = PaginationResponse.for_offset(request, total)
+
+			response_data = [
+				PermissionResponse(
+					id=p.id,
+					name=p.name,
+					display_name=p.display_name,
+					description=p.description,
+					category=p.category,
+					created_at=p.created_at,
+				)
+				for p in permissions
+			]
+
+			return PaginatedResponse(success=True, data=response_data, pagination=pagination)
+
+		except Exception as e:
+			return PaginatedResponse(
+				success=False,
+				data=[],
+				pagination=PaginationResponse.empty(),
+				error=str(e),
+			)
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from vexen_rbac.application.dto.base import BaseResponse
+from vexen_rbac.application.dto.bulk import BulkCreateResponse, BulkItemError
+from vexen_rbac.application.dto.permission_group_dto import (
+	CreatePermissionGroupRequest,
+	PermissionGroupResponse,
+)
+from vexen_rbac.domain.entity.permission_group import PermissionGroup
+from vexen_rbac.domain.ports.permission_group_repository_port import (
+	IPermissionGroupRepositoryPort,
+)
+
+
+@dataclass
+class CreatePermissionGroupsBulk:
+	repository: IPermissionGroupRepositoryPort
+
+	async def __call__(
+		self, requests: list[CreatePermissionGroupRequest]
+	) -> BaseResponse[BulkCreateResponse[PermissionGroupResponse]]:
+		try:
+			response = BulkCreateResponse[PermissionGroupResponse]()
+			groups: list[PermissionGroup] = []
+			indexes: list[int] = []
+			seen: set[str] = set()
+
+			for index, request in enumerate(requests):
+				if request.name in seen:
+					error = f"Duplicate name '{request.name}' in batch"
+					response.errors.append(BulkItemError(index, request.name, error))
+					continue
+
+				seen.add(request.name)
+				groups.append(
+					PermissionGroup(
+						id=0,
+						name=request.name,
+						display_name=request.display_name,
+						description=request.description,
+						icon=request.icon,
+						order=request.order,
+						permissions=request.permissions or [],
+						created_at=datetime.now(),
+					)
+				)
+				indexes.append(index)
+
+			saved = await self.repository.create_many(groups)
+
+			for index, group, saved_group in zip(indexes, groups, saved, strict=True):
+				if saved_group is None:
+					response.errors.append(
+						BulkItemError(
+							index, group.name, f"Permission group '{group.name}' already exists"
+						)
+					)
+					continue
+
+				response.created.append(
+					PermissionGroupResponse(
+						id=saved_group.id,
+						name=saved_group.name,
+						display_name=saved_group.display_name,
+						description=saved_group.description,
+						icon=saved_group.icon,
+						order=saved_group.order,
+						permissions=saved_group.permissions,
+						permission_count=saved_group.permission_count(),
+						created_at=saved_group.created_at,
+					)
+				)
+
+			response.errors.sort(key=lambda error: error.index)
+			return BaseResponse.ok(response)
+
+		except Exception as e:
+			return BaseResponse.fail(f"Error creating permission groups: {str(e)}")
@@ -1,27 +1,105 @@
 from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from vexen_rbac.domain.ports.permission_group_repository_port import IPermissionGroupRepositoryPort
 
-from .add_permissions_to_group import AddPermissionsToGroup
-from .count_group_permissions import CountGroupPermissions
-from .create_permission_group import CreatePermissionGroup
-from .delete_permission_group import DeletePermissionGroup
-from .get_permission_group import GetPermissionGroup
-from .list_permission_groups import ListPermissionGroups
-from .remove_permissions_from_group import RemovePermissionsFromGroup
-from .update_permission_group import UpdatePermissionGroup
+if TYPE_CHECKING:
+	from .add_permissions_to_group import AddPermissionsToGroup
+	from .count_group_permissions import CountGroupPermissions
+	from .create_permission_group import CreatePermissionGroup
+	from .create_permission_groups_bulk import CreatePermissionGroupsBulk
+	from .delete_permission_group import DeletePermissionGroup
+	from .get_permission_group import GetPermissionGroup
+	from .get_permission_groups_by_ids import GetPermissionGroupsByIds
+	from .iter_permission_groups import IterPermissionGroups
+	from .list_permission_groups import ListPermissionGroups
+	from .list_permission_groups_paginated import ListPermissionGroupsPaginated
+	from .list_permission_groups_with_counts import ListPermissionGroupsWithCounts
+	from .remove_permissions_from_group import RemovePermissionsFromGroup
+	from .update_permission_group import UpdatePermissionGroup
 
 
 @dataclass
 class PermissionGroupUseCaseFactory:
+	"""Permission group use cases, each built (and its module imported) on first access."""
+
 	repository: IPermissionGroupRepositoryPort
 
-	def __post_init__(self):
-		self.create_permission_group = CreatePermissionGroup(self.repository)
-		self.get_permission_group = GetPermissionGroup(self.repository)
-		self.delete_permission_group = DeletePermissionGroup(self.repository)
-		self.update_permission_group = UpdatePermissionGroup(self.repository)
-		self.list_permission_groups = ListPermissionGroups(self.repository)
-		self.add_permissions = AddPermissionsToGroup(self.repository)
-		self.remove_permissions = RemovePermissionsFromGroup(self.repository)
-		self.count_permissions = CountGroupPermissions(self.repository)
+	@cached_property
+	def create_permission_group(self) -> "CreatePermissionGroup":
+		from .create_permission_group import CreatePermissionGroup
+
+		return CreatePermissionGroup(self.repository)
+
+	@cached_property
+	def create_permission_groups_bulk(self) -> "CreatePermissionGroupsBulk":
+		from .create_permission_groups_bulk import CreatePermissionGroupsBulk
+
+		return CreatePermissionGroupsBulk(self.repository)
+
+	@cached_property
+	def get_permission_group(self) -> "GetPermissionGroup":
+		from .get_permission_group import GetPermissionGroup
+
+		return GetPermissionGroup(self.repository)
+
+	@cached_property
+	def get_permission_groups_by_ids(self) -> "GetPermissionGroupsByIds":
+		from .get_permission_groups_by_ids import GetPermissionGroupsByIds
+
+		return GetPermissionGroupsByIds(self.repository)
+
+	@cached_property
+	def delete_permission_group(self) -> "DeletePermissionGroup":
+		from .delete_permission_group import DeletePermissionGroup
+
+		return DeletePermissionGroup(self.repository)
+
+	@cached_property
+	def update_permission_group(self) -> "UpdatePermissionGroup":
+		from .update_permission_group import UpdatePermissionGroup
+
+		return UpdatePermissionGroup(self.repository)
+
+	@cached_property
+	def list_permission_groups(self) -> "ListPermissionGroups":
+		from .list_permission_groups import ListPermissionGroups
+
+		return ListPermissionGroups(self.repository)
+
+	@cached_property
+	def iter_permission_groups(self) -> "IterPermissionGroups":
+		from .iter_permission_groups import IterPermissionGroups
+
+		return IterPermissionGroups(self.repository)
+
+	@cached_property
+	def list_permission_groups_paginated(self) -> "ListPermissionGroupsPaginated":
+		from .list_permission_groups_paginated import ListPermissionGroupsPaginated
+
+		return ListPermissionGroupsPaginated(self.repository)
+
+	@cached_property
+	def list_permission_groups_with_counts(self) -> "ListPermissionGroupsWithCounts":
+		from .list_permission_groups_with_counts import ListPermissionGroupsWithCounts
+
+		return ListPermissionGroupsWithCounts(self.repository)
+
+	@cached_property
+	def add_permissions(self) -> "AddPermissionsToGroup":
+		from .add_permissions_to_group import AddPermissionsToGroup
+
+		return AddPermissionsToGroup(self.repository)
+
+	@cached_property
+	def remove_permissions(self) -> "RemovePermissionsFromGroup":
+		from .remove_permissions_from_group import RemovePermissionsFromGroup
+
+		return RemovePermissionsFromGroup(self.repository)
+
+	@cached_property
+	def count_permissions(self) -> "CountGroupPermissions":
+		from .count_group_permissions import CountGroupPermissions
+
+		return CountGroupPermissions(self.repository)
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto.base import BaseResponse
+from vexen_rbac.application.dto.bulk import BatchGetResponse
+from vexen_rbac.application.dto.permission_group_dto import PermissionGroupResponse
+from vexen_rbac.domain.ports.permission_group_repository_port import (
+	IPermissionGroupRepositoryPort,
+)
+
+
+@dataclass
+class GetPermissionGroupsByIds:
+	repository: IPermissionGroupRepositoryPort
+
+	async def __call__(
+		self, permission_group_ids: list[int]
+	) -> BaseResponse[BatchGetResponse[PermissionGroupResponse]]:
+		try:
+			permission_groups = await self.repository.get_many(permission_group_ids)
+			by_id = {group.id: group for group in permission_groups}
+
+			response = BatchGetResponse[PermissionGroupResponse]()
+			for permission_group_id in dict.fromkeys(permission_group_ids):
+				permission_group = by_id.get(permission_group_id)
+				if permission_group is None:
+					response.missing.append(permission_group_id)
+					continue
+
+				response.items.append(
+					PermissionGroupResponse(
+						id=permission_group.id,
+						name=permission_group.name,
+						display_name=permission_group.display_name,
+						description=permission_group.description,
+						icon=permission_group.icon,
+						order=permission_group.order,
+						permissions=permission_group.permissions,
+						permission_count=permission_group.permission_count(),
+						created_at=permission_group.created_at,
+					)
+				)
+
+			return BaseResponse.ok(response)
+
+		except Exception as e:
+			return BaseResponse.fail(f"Error getting permission groups: {str(e)}")
@@ -0,0 +1,39 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto.permission_group_dto import PermissionGroupResponse
+from vexen_rbac.domain.ports.permission_group_repository_port import (
+	IPermissionGroupRepositoryPort,
+)
+
+
+@dataclass
+class IterPermissionGroups:
+	"""
+	Stream every permission group, ordered by name, in chunks of at most `chunk_size` DTOs.
+
+	Unlike ListPermissionGroups, only one chunk is held in memory at a time.
+	Errors are raised instead of being wrapped in a BaseResponse.
+	"""
+
+	repository: IPermissionGroupRepositoryPort
+
+	async def __call__(self, chunk_size: int = 500) -> AsyncIterator[list[PermissionGroupResponse]]:
+		if chunk_size < 1:
+			raise ValueError("chunk_size must be at least 1")
+
+		async for groups in self.repository.stream(chunk_size):
+			yield [
+				PermissionGroupResponse(
+					id=g.id,
+					name=g.name,
+					display_name=g.display_name,
+					description=g.description,
+					icon=g.icon,
+					order=g.order,
+					permissions=g.permissions if g.permissions else [],
+					permission_count=len(g.permissions) if g.permissions else 0,
+					created_at=g.created_at,
+				)
+				for g in groups
+			]
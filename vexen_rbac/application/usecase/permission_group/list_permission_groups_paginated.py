@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto import (
+	PaginatedResponse,
+	PaginationRequest,
+	PaginationResponse,
+	PermissionGroupResponse,
+	decode_cursor,
+	encode_cursor,
+)
+from vexen_rbac.domain.ports.permission_group_repository_port import (
+	IPermissionGroupRepositoryPort,
+)
+
+
+@dataclass
+class ListPermissionGroupsPaginated:
+	repository: IPermissionGroupRepositoryPort
+
+	async def __call__(
+		self, request: PaginationRequest
+	) -> PaginatedResponse[PermissionGroupResponse]:
+		try:
+			if request.uses_cursor:
+				after = decode_cursor(request.cursor) if request.cursor else None
+				# Fetch one extra row to know whether another page follows
+				groups, total = await self.repository.list_after(
+					after, request.page_size + 1, request.include_total
+				)
+				has_next = len(groups) > request.page_size
+				groups = groups[: request.page_size]
+				next_cursor = (
+					encode_cursor(groups[-1].created_at, groups[-1].id) if has_next else None
+				)
+				pagination = PaginationResponse.for_cursor(request, next_cursor, total)
+			else:
+				groups, total = await self.repository.list_paginated(
+					request.page, request.page_size
+				)
+				pagination = PaginationResponse.for_offset(request, total)
+
+			response_data = [
+				PermissionGroupResponse(
+					id=g.id,
+					name=g.name,
+					display_name=g.display_name,
+					description=g.description,
+					icon=g.icon,
+					order=g.order,
+					permissions=g.permissions,
+					permission_count=g.permission_count(),
+					created_at=g.created_at,
+				)
+				for g in groups
+			]
+
+			return PaginatedResponse(success=True, data=response_data, pagination=pagination)
+
+		except Exception as e:
+			return PaginatedResponse(
+				success=False,
+				data=[],
+				pagination=PaginationResponse.empty(),
+				error=str(e),
+			)
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto.base import BaseResponse
+from vexen_rbac.application.dto.permission_group_dto import PermissionGroupSummaryResponse
+from vexen_rbac.domain.ports.permission_group_repository_port import (
+	IPermissionGroupRepositoryPort,
+)
+
+
+@dataclass
+class ListPermissionGroupsWithCounts:
+	repository: IPermissionGroupRepositoryPort
+
+	async def __call__(self) -> BaseResponse[list[PermissionGroupSummaryResponse]]:
+		try:
+			rows = await self.repository.list_with_counts()
+
+			response_data = [
+				PermissionGroupSummaryResponse(
+					id=g.id,
+					name=g.name,
+					display_name=g.display_name,
+					description=g.description,
+					icon=g.icon,
+					order=g.order,
+					permission_count=count,
+					created_at=g.created_at,
+				)
+				for g, count in rows
+			]
+
+			return BaseResponse.ok(response_data)
+
+		except Exception as e:
+			return BaseResponse.fail(f"Error listing permission groups: {str(e)}")
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 
 from vexen_rbac.application.dto.base import BaseResponse
-from vexen_rbac.application.dto.permission_group_dto import PermissionGroupResponse
+from vexen_rbac.application.dto.permission_group_dto import (
+	PermissionGroupPermissionsChangeResponse,
+)
 from vexen_rbac.domain.ports.permission_group_repository_port import (
 	IPermissionGroupRepositoryPort,
 )
@@ -13,20 +15,12 @@ class RemovePermissionsFromGroup:
 
 	async def __call__(
 		self, group_id: int, permission_ids: list[int]
-	) -> BaseResponse[PermissionGroupResponse]:
+	) -> BaseResponse[PermissionGroupPermissionsChangeResponse]:
 		try:
-			group = await self.repository.remove_permissions(group_id, permission_ids)
+			changed = await self.repository.remove_permissions(group_id, permission_ids)
 
-			response = PermissionGroupResponse(
-				id=group.id,
-				name=group.name,
-				display_name=group.display_name,
-				description=group.description,
-				icon=group.icon,
-				order=group.order,
-				permissions=group.permissions,
-				permission_count=len(group.permissions),
-				created_at=group.created_at,
+			response = PermissionGroupPermissionsChangeResponse(
+				group_id=group_id, permission_ids=changed
 			)
 
 			return BaseResponse(success=True, data=response)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from vexen_rbac.application.dto.base import BaseResponse
-from vexen_rbac.application.dto.role_dto import RoleResponse
+from vexen_rbac.application.dto.role_dto import RolePermissionsChangeResponse
 from vexen_rbac.domain.ports.role_repository_port import IRoleRepositoryPort
 
 
@@ -9,21 +9,13 @@ from vexen_rbac.domain.ports.role_repository_port import IRoleRepositoryPort
 class AddPermissionsToRole:
 	repository: IRoleRepositoryPort
 
-	async def __call__(self, role_id: int, permission_ids: list[int]) -> BaseResponse[RoleResponse]:
+	async def __call__(
+		self, role_id: int, permission_ids: list[int]
+	) -> BaseResponse[RolePermissionsChangeResponse]:
 		try:
-			role = await self.repository.add_permissions(role_id, permission_ids)
+			changed = await self.repository.add_permissions(role_id, permission_ids)
 
-			response = RoleResponse(
-				id=role.id,
-				name=role.name,
-				display_name=role.display_name,
-				description=role.description,
-				permissions=role.permissions,
-				permission_groups=role.permission_groups,
-				user_count=role.user_count,
-				created_at=role.created_at,
-				updated_at=role.updated_at,
-			)
+			response = RolePermissionsChangeResponse(role_id=role_id, permission_ids=changed)
 
 			return BaseResponse(success=True, data=response)
 
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from vexen_rbac.application.dto.base import BaseResponse
+from vexen_rbac.application.dto.bulk import BulkCreateResponse, BulkItemError
+from vexen_rbac.application.dto.role_dto import CreateRoleRequest, RoleResponse
+from vexen_rbac.domain.entity.role import Role
+from vexen_rbac.domain.ports.role_repository_port import IRoleRepositoryPort
+
+
+@dataclass
+class CreateRolesBulk:
+	repository: IRoleRepositoryPort
+
+	async def __call__(
+		self, requests: list[CreateRoleRequest]
+	) -> BaseResponse[BulkCreateResponse[RoleResponse]]:
+		try:
+			response = BulkCreateResponse[RoleResponse]()
+			roles: list[Role] = []
+			indexes: list[int] = []
+			seen: set[str] = set()
+
+			for index, request in enumerate(requests):
+				if request.name in seen:
+					error = f"Duplicate name '{request.name}' in batch"
+					response.errors.append(BulkItemError(index, request.name, error))
+					continue
+
+				seen.add(request.name)
+				roles.append(
+					Role(
+						id=0,
+						name=request.name,
+						display_name=request.display_name,
+						description=request.description,
+						permissions=request.permissions or [],
+						permission_groups=request.permission_groups or [],
+						user_count=0,
+						created_at=datetime.now(),
+					)
+				)
+				indexes.append(index)
+
+			saved = await self.repository.create_many(roles)
+
+			for index, role, saved_role in zip(indexes, roles, saved, strict=True):
+				if saved_role is None:
+					response.errors.append(
+						BulkItemError(index, role.name, f"Role '{role.name}' already exists")
+					)
+					continue
+
+				response.created.append(
+					RoleResponse(
+						id=saved_role.id,
+						name=saved_role.name,
+						display_name=saved_role.display_name,
+						description=saved_role.description,
+						permissions=saved_role.permissions,
+						permission_groups=saved_role.permission_groups,
+						user_count=saved_role.user_count,
+						created_at=saved_role.created_at,
+						updated_at=saved_role.updated_at,
+					)
+				)
+
+			response.errors.sort(key=lambda error: error.index)
+			return BaseResponse.ok(response)
+
+		except Exception as e:
+			return BaseResponse.fail(f"Error creating roles: {str(e)}")
@@ -1,33 +1,126 @@
 from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from vexen_rbac.domain.ports.role_repository_port import IRoleRepositoryPort
 
-from .add_permissions_to_role import AddPermissionsToRole
-from .count_role_permissions import CountRolePermissions
-from .count_roles import CountRoles
-from .create_role import CreateRole
-from .delete_role import DeleteRole
-from .get_role import GetRole
-from .get_role_expanded import GetRoleExpanded
-from .list_roles import ListRoles
-from .list_roles_paginated import ListRolesPaginated
-from .remove_permissions_from_role import RemovePermissionsFromRole
-from .update_role import UpdateRole
+if TYPE_CHECKING:
+	from .add_permissions_to_role import AddPermissionsToRole
+	from .count_role_permissions import CountRolePermissions
+	from .count_roles import CountRoles
+	from .create_role import CreateRole
+	from .create_roles_bulk import CreateRolesBulk
+	from .delete_role import DeleteRole
+	from .get_effective_permissions import GetEffectivePermissions
+	from .get_role import GetRole
+	from .get_role_expanded import GetRoleExpanded
+	from .get_roles_by_ids import GetRolesByIds
+	from .iter_roles import IterRoles
+	from .list_roles import ListRoles
+	from .list_roles_paginated import ListRolesPaginated
+	from .list_roles_with_counts import ListRolesWithCounts
+	from .remove_permissions_from_role import RemovePermissionsFromRole
+	from .update_role import UpdateRole
 
 
 @dataclass
 class RoleUseCaseFactory:
+	"""Role use cases, each built (and its module imported) on first access."""
+
 	repository: IRoleRepositoryPort
 
-	def __post_init__(self):
-		self.create_role = CreateRole(self.repository)
-		self.get_role = GetRole(self.repository)
-		self.get_role_expanded = GetRoleExpanded(self.repository)
-		self.update_role = UpdateRole(self.repository)
-		self.delete_role = DeleteRole(self.repository)
-		self.list_roles = ListRoles(self.repository)
-		self.list_roles_paginated = ListRolesPaginated(self.repository)
-		self.add_permissions = AddPermissionsToRole(self.repository)
-		self.remove_permissions = RemovePermissionsFromRole(self.repository)
-		self.count_roles = CountRoles(self.repository)
-		self.count_permissions = CountRolePermissions(self.repository)
+	@cached_property
+	def create_role(self) -> "CreateRole":
+		from .create_role import CreateRole
+
+		return CreateRole(self.repository)
+
+	@cached_property
+	def create_roles_bulk(self) -> "CreateRolesBulk":
+		from .create_roles_bulk import CreateRolesBulk
+
+		return CreateRolesBulk(self.repository)
+
+	@cached_property
+	def get_role(self) -> "GetRole":
+		from .get_role import GetRole
+
+		return GetRole(self.repository)
+
+	@cached_property
+	def get_role_expanded(self) -> "GetRoleExpanded":
+		from .get_role_expanded import GetRoleExpanded
+
+		return GetRoleExpanded(self.repository)
+
+	@cached_property
+	def get_roles_by_ids(self) -> "GetRolesByIds":
+		from .get_roles_by_ids import GetRolesByIds
+
+		return GetRolesByIds(self.repository)
+
+	@cached_property
+	def update_role(self) -> "UpdateRole":
+		from .update_role import UpdateRole
+
+		return UpdateRole(self.repository)
+
+	@cached_property
+	def delete_role(self) -> "DeleteRole":
+		from .delete_role import DeleteRole
+
+		return DeleteRole(self.repository)
+
+	@cached_property
+	def list_roles(self) -> "ListRoles":
+		from .list_roles import ListRoles
+
+		return ListRoles(self.repository)
+
+	@cached_property
+	def iter_roles(self) -> "IterRoles":
+		from .iter_roles import IterRoles
+
+		return IterRoles(self.repository)
+
+	@cached_property
+	def list_roles_paginated(self) -> "ListRolesPaginated":
+		from .list_roles_paginated import ListRolesPaginated
+
+		return ListRolesPaginated(self.repository)
+
+	@cached_property
+	def list_roles_with_counts(self) -> "ListRolesWithCounts":
+		from .list_roles_with_counts import ListRolesWithCounts
+
+		return ListRolesWithCounts(self.repository)
+
+	@cached_property
+	def add_permissions(self) -> "AddPermissionsToRole":
+		from .add_permissions_to_role import AddPermissionsToRole
+
+		return AddPermissionsToRole(self.repository)
+
+	@cached_property
+	def remove_permissions(self) -> "RemovePermissionsFromRole":
+		from .remove_permissions_from_role import RemovePermissionsFromRole
+
+		return RemovePermissionsFromRole(self.repository)
+
+	@cached_property
+	def count_roles(self) -> "CountRoles":
+		from .count_roles import CountRoles
+
+		return CountRoles(self.repository)
+
+	@cached_property
+	def count_permissions(self) -> "CountRolePermissions":
+		from .count_role_permissions import CountRolePermissions
+
+		return CountRolePermissions(self.repository)
+
+	@cached_property
+	def get_effective_permissions(self) -> "GetEffectivePermissions":
+		from .get_effective_permissions import GetEffectivePermissions
+
+		return GetEffectivePermissions(self.repository)
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto import BaseResponse, PermissionSimpleResponse
+from vexen_rbac.domain.ports.role_repository_port import IRoleRepositoryPort
+
+
+@dataclass
+class GetEffectivePermissions:
+	repository: IRoleRepositoryPort
+
+	async def __call__(self, role_ids: list[int]) -> BaseResponse[list[PermissionSimpleResponse]]:
+		try:
+			permissions = await self.repository.get_effective_permissions(role_ids)
+
+			response_data = [
+				PermissionSimpleResponse(
+					id=p.id, name=p.name, display_name=p.display_name, category=p.category
+				)
+				for p in permissions
+			]
+
+			return BaseResponse.ok(response_data)
+
+		except Exception as e:
+			return BaseResponse.fail(f"Error resolving effective permissions: {str(e)}")
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto.base import BaseResponse
+from vexen_rbac.application.dto.bulk import BatchGetResponse
+from vexen_rbac.application.dto.role_dto import RoleResponse
+from vexen_rbac.domain.ports.role_repository_port import IRoleRepositoryPort
+
+
+@dataclass
+class GetRolesByIds:
+	repository: IRoleRepositoryPort
+
+	async def __call__(self, role_ids: list[int]) -> BaseResponse[BatchGetResponse[RoleResponse]]:
+		try:
+			roles = await self.repository.get_many(role_ids)
+			by_id = {role.id: role for role in roles}
+
+			response = BatchGetResponse[RoleResponse]()
+			for role_id in dict.fromkeys(role_ids):
+				role = by_id.get(role_id)
+				if role is None:
+					response.missing.append(role_id)
+					continue
+
+				response.items.append(
+					RoleResponse(
+						id=role.id,
+						name=role.name,
+						display_name=role.display_name,
+						description=role.description,
+						permissions=role.permissions,
+						permission_groups=role.permission_groups,
+						user_count=role.user_count,
+						created_at=role.created_at,
+						updated_at=role.updated_at,
+					)
+				)
+
+			return BaseResponse.ok(response)
+
+		except Exception as e:
+			return BaseResponse.fail(f"Error getting roles: {str(e)}")
@@ -0,0 +1,37 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto.role_dto import RoleResponse
+from vexen_rbac.domain.ports.role_repository_port import IRoleRepositoryPort
+
+
+@dataclass
+class IterRoles:
+	"""
+	Stream every role, ordered by name, in chunks of at most `chunk_size` DTOs.
+
+	Unlike ListRoles, only one chunk is held in memory at a time. Errors are
+	raised instead of being wrapped in a BaseResponse.
+	"""
+
+	repository: IRoleRepositoryPort
+
+	async def __call__(self, chunk_size: int = 500) -> AsyncIterator[list[RoleResponse]]:
+		if chunk_size < 1:
+			raise ValueError("chunk_size must be at least 1")
+
+		async for roles in self.repository.stream(chunk_size):
+			yield [
+				RoleResponse(
+					id=r.id,
+					name=r.name,
+					display_name=r.display_name,
+					description=r.description,
+					permissions=r.permissions if r.permissions else [],
+					permission_groups=r.permission_groups if r.permission_groups else [],
+					user_count=r.user_count,
+					created_at=r.created_at,
+					updated_at=None,  # Role entity doesn't have updated_at
+				)
+				for r in roles
+			]
@@ -21,7 +21,7 @@ class ListRoles:
 					description=r.description,
 					permissions=r.permissions if r.permissions else [],
 					permission_groups=r.permission_groups if r.permission_groups else [],
-					user_count=0,  # Not available in simple list
+					user_count=r.user_count,
 					created_at=r.created_at,
 					updated_at=None,  # Role entity doesn't have updated_at
 				)
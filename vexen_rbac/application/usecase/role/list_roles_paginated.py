@@ -1,11 +1,12 @@
 from dataclasses import dataclass
-from math import ceil
 
 from vexen_rbac.application.dto import (
 	PaginatedResponse,
 	PaginationRequest,
 	PaginationResponse,
 	RoleResponse,
+	decode_cursor,
+	encode_cursor,
 )
 from vexen_rbac.domain.ports.role_repository_port import IRoleRepositoryPort
 
@@ -16,9 +17,21 @@ class ListRolesPaginated:
 
 	async def __call__(self, request: PaginationRequest) -> PaginatedResponse[RoleResponse]:
 		try:
-			roles, total = await self.repository.list_paginated(request.page, request.page_size)
-
-			total_pages = ceil(total / request.page_size) if total > 0 else 1
+			if request.uses_cursor:
+				after = decode_cursor(request.cursor) if request.cursor else None
+				# Fetch one extra row to know whether another page follows
+				roles, total = await self.repository.list_after(
+					after, request.page_size + 1, request.include_total
+				)
+				has_next = len(roles) > request.page_size
+				roles = roles[: request.page_size]
+				next_cursor = (
+					encode_cursor(roles[-1].created_at, roles[-1].id) if has_next else None
+				)
+				pagination = PaginationResponse.for_cursor(request, next_cursor, total)
+			else:
+				roles, total = await self.repository.list_paginated(request.page, request.page_size)
+				pagination = PaginationResponse.for_offset(request, total)
 
 			role_responses = [
 				RoleResponse(
@@ -35,28 +48,12 @@ class ListRolesPaginated:
 				for role in roles
 			]
 
-			pagination = PaginationResponse(
-				page=request.page,
-				page_size=request.page_size,
-				total_pages=total_pages,
-				total_items=total,
-				has_next=request.page < total_pages,
-				has_prev=request.page > 1,
-			)
-
 			return PaginatedResponse(success=True, data=role_responses, pagination=pagination)
 
 		except Exception as e:
 			return PaginatedResponse(
 				success=False,
 				data=[],
-				pagination=PaginationResponse(
-					page=1,
-					page_size=20,
-					total_pages=0,
-					total_items=0,
-					has_next=False,
-					has_prev=False,
-				),
+				pagination=PaginationResponse.empty(),
 				error=str(e),
 			)
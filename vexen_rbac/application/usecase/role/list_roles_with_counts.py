@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto.base import BaseResponse
+from vexen_rbac.application.dto.role_dto import RoleSummaryResponse
+from vexen_rbac.domain.ports.role_repository_port import IRoleRepositoryPort
+
+
+@dataclass
+class ListRolesWithCounts:
+	repository: IRoleRepositoryPort
+
+	async def __call__(self) -> BaseResponse[list[RoleSummaryResponse]]:
+		try:
+			rows = await self.repository.list_with_counts()
+
+			response_data = [
+				RoleSummaryResponse(
+					id=r.id,
+					name=r.name,
+					display_name=r.display_name,
+					description=r.description,
+					permission_count=count,
+					created_at=r.created_at,
+					updated_at=r.updated_at,
+				)
+				for r, count in rows
+			]
+
+			return BaseResponse.ok(response_data)
+
+		except Exception as e:
+			return BaseResponse.fail(f"Error listing roles: {str(e)}")
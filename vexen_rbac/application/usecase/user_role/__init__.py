@@ -0,0 +1,9 @@
+"""
+User role assignment use cases.
+"""
+
+from .factory import UserRoleUseCaseFactory
+
+__all__ = [
+	"UserRoleUseCaseFactory",
+]
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto.base import BaseResponse
+from vexen_rbac.application.dto.user_role_dto import UserRolesChangeResponse
+from vexen_rbac.domain.ports.user_role_repository_port import IUserRoleRepositoryPort
+
+
+@dataclass
+class AssignRolesToUser:
+	repository: IUserRoleRepositoryPort
+
+	async def __call__(
+		self, user_id: str, role_ids: list[int]
+	) -> BaseResponse[UserRolesChangeResponse]:
+		try:
+			changed = await self.repository.assign(user_id, role_ids)
+
+			response = UserRolesChangeResponse(user_id=user_id, role_ids=changed)
+
+			return BaseResponse(success=True, data=response)
+
+		except Exception as e:
+			return BaseResponse(success=False, error=str(e))
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from vexen_rbac.domain.ports.user_role_repository_port import IUserRoleRepositoryPort
+
+if TYPE_CHECKING:
+	from .assign_roles_to_user import AssignRolesToUser
+	from .list_role_users import ListRoleUsers
+	from .list_user_roles import ListUserRoles
+	from .revoke_roles_from_user import RevokeRolesFromUser
+
+
+@dataclass
+class UserRoleUseCaseFactory:
+	"""User role assignment use cases, each built (and its module imported) on first access."""
+
+	repository: IUserRoleRepositoryPort
+
+	@cached_property
+	def assign_roles(self) -> "AssignRolesToUser":
+		from .assign_roles_to_user import AssignRolesToUser
+
+		return AssignRolesToUser(self.repository)
+
+	@cached_property
+	def revoke_roles(self) -> "RevokeRolesFromUser":
+		from .revoke_roles_from_user import RevokeRolesFromUser
+
+		return RevokeRolesFromUser(self.repository)
+
+	@cached_property
+	def list_user_roles(self) -> "ListUserRoles":
+		from .list_user_roles import ListUserRoles
+
+		return ListUserRoles(self.repository)
+
+	@cached_property
+	def list_role_users(self) -> "ListRoleUsers":
+		from .list_role_users import ListRoleUsers
+
+		return ListRoleUsers(self.repository)
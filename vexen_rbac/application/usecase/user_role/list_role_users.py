@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto import (
+	PaginatedResponse,
+	PaginationRequest,
+	PaginationResponse,
+	UserRoleResponse,
+)
+from vexen_rbac.domain.ports.user_role_repository_port import IUserRoleRepositoryPort
+
+
+@dataclass
+class ListRoleUsers:
+	repository: IUserRoleRepositoryPort
+
+	async def __call__(
+		self, role_id: int, request: PaginationRequest
+	) -> PaginatedResponse[UserRoleResponse]:
+		try:
+			# Assignments have no (created_at, id) keyset: only offset pages
+			if request.uses_cursor:
+				raise ValueError("Cursor pagination is not supported for role users")
+
+			assignments, total = await self.repository.list_role_users(
+				role_id, request.page, request.page_size
+			)
+
+			responses = [
+				UserRoleResponse(
+					user_id=assignment.user_id,
+					role_id=assignment.role_id,
+					assigned_at=assignment.assigned_at,
+				)
+				for assignment in assignments
+			]
+
+			return PaginatedResponse(
+				success=True,
+				data=responses,
+				pagination=PaginationResponse.for_offset(request, total),
+			)
+
+		except Exception as e:
+			return PaginatedResponse(
+				success=False,
+				data=[],
+				pagination=PaginationResponse.empty(),
+				error=str(e),
+			)
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+from vexen_rbac.application.dto.base import BaseResponse
+from vexen_rbac.application.dto.role_dto import RoleResponse
+from vexen_rbac.domain.ports.user_role_repository_port import IUserRoleRepositoryPort
+
+
+@dataclass
+class ListUserRoles:
+	repository: IUserRoleRepositoryPort
+
+	async def __call__(self, user_id: str) -> BaseResponse[list[RoleResponse]]:
+		try:
+			roles = await self.repository.list_user_roles(user_id)
+
+			response_data = [
+				RoleResponse(
+					id=r.id,
+					name=r.name,
+					display_name=r.display_name,
+					description=r.description,
+					permissions=r.permissions,
+					permission_groups=r.permission_groups,
+					user_count=r.user_count,
+					created_at=r.created_at,
+					updated_at=r.updated_at,
+				)
+				for r in roles
+			]
+
+			return BaseResponse.ok(response_data)
+
+		except Exception as e:
+			return BaseResponse.fail(f"Error listing user roles: {str(e)}")
@@ -5,26 +5,116 @@ This module provides the main entry point for the RBAC library,
 following hexagonal architecture principles.
 """
 
-from dataclasses import dataclass
-from typing import Literal
+import os
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
 
+from vexen_rbac.application.service.authorization_engine import AuthorizationEngine
+from vexen_rbac.application.service.bulk_authorizer import BulkAuthorizer
 from vexen_rbac.application.service.rbac_service import RBACService
 from vexen_rbac.domain.ports import (
 	IPermissionGroupRepositoryPort,
 	IPermissionRepositoryPort,
+	IRevisionRepositoryPort,
 	IRoleRepositoryPort,
+	IUserRoleRepositoryPort,
 )
 
+if TYPE_CHECKING:
+	from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+	from vexen_rbac.infraestructure.output.instrumentation import (
+		Instrumentation,
+		InstrumentationStats,
+	)
+	from vexen_rbac.infraestructure.output.persistence.cache import (
+		CacheStats,
+		LRUTTLCache,
+		UserPermissionCache,
+	)
+	from vexen_rbac.infraestructure.output.persistence.revision_watcher import RevisionWatcher
+	from vexen_rbac.infraestructure.output.persistence.sqlalchemy.unit_of_work import (
+		SQLAlchemyUnitOfWork,
+	)
+	from vexen_rbac.infraestructure.output.snapshot import SnapshotAuthorizer
+
 
 @dataclass
 class RBACConfig:
-	"""Configuration for RBAC initialization."""
+	"""
+	Configuration for RBAC initialization.
+
+	Attributes:
+		database_url: Database connection URL
+		adapter: Database adapter to use (currently only "sqlalchemy")
+		echo: Enable SQL echo for debugging
+		pool_size: Connections kept open in the pool
+		max_overflow: Extra connections allowed above pool_size
+		pool_recycle: Seconds after which a pooled connection is replaced
+		pool_pre_ping: Test connections on checkout and replace stale ones
+		pool_timeout: Seconds to wait for a free connection before failing
+		statement_cache_size: asyncpg prepared statement cache size per
+			connection (0 disables it); None keeps the driver default
+		replica_urls: Read replica URLs; read-only calls made outside a unit
+			of work are spread over them (same pool settings as the primary)
+		replica_retry_after: Seconds an unreachable replica is skipped
+		materialize_effective_permissions: Maintain the role_effective_permissions
+			table on every write and answer effective-permission reads from it
+			(run `rebuild_effective_permissions()` once after enabling it)
+		revision_poll_interval: Seconds between background probes of the
+			global revision (one primary-key lookup each); when another process
+			changes RBAC data, the caches are cleared and loaded authorization
+			engines (including the batch matrix) are reloaded. None disables
+			background watching, and cached user permission sets are then
+			revalidated on every check instead
+		revision_notifications: Also react immediately to PostgreSQL NOTIFY
+			(asyncpg only; requires revision_poll_interval)
+		create_schema: Create or upgrade the schema on init when its recorded
+			version is missing or outdated (one query otherwise); disable it
+			when migrations are run separately
+		cache_enabled: Wrap the repositories with an in-process LRU+TTL cache
+		cache_max_size: Maximum number of cached entries
+		cache_ttl: Seconds a cached entry stays valid
+		instrumentation_enabled: Measure every use case call (latency
+			histogram, SQL statements, rows) for `stats()` and
+			`prometheus_metrics()`; nothing is installed when disabled
+		authorization_cache_size: Users whose effective permission set is kept
+			in memory for `authorize()` and `check_many()` (0 disables it).
+			With the revision watcher (the default), a cache hit costs no
+			query; with revision_poll_interval=None, each hit is revalidated
+			against the global revision, one primary-key lookup per check
+		authorization_cache_ttl: Seconds a user's permission set stays cached;
+			writes made through this instance and detected revision changes
+			drop it earlier. Warning: while the watcher runs, entries are not
+			revalidated per check, so a role revoked by another process keeps
+			being granted here until the watcher's next probe (up to
+			revision_poll_interval seconds, or the TTL if the watcher stops);
+			set revision_poll_interval=None to trade that window for a query
+			per check
+	"""
 
 	database_url: str
 	adapter: Literal["sqlalchemy"] = "sqlalchemy"
 	echo: bool = False
 	pool_size: int = 5
 	max_overflow: int = 10
+	pool_recycle: int = 3600
+	pool_pre_ping: bool = True
+	pool_timeout: float = 30.0
+	statement_cache_size: int | None = None
+	replica_urls: list[str] = field(default_factory=list)
+	replica_retry_after: float = 30.0
+	materialize_effective_permissions: bool = False
+	revision_poll_interval: float | None = 1.0
+	revision_notifications: bool = False
+	create_schema: bool = True
+	cache_enabled: bool = False
+	cache_max_size: int = 1024
+	cache_ttl: float = 60.0
+	instrumentation_enabled: bool = False
+	authorization_cache_size: int = 10_000
+	authorization_cache_ttl: float = 300.0
 
 
 class RBAC:
@@ -66,6 +156,7 @@ class RBAC:
 		Raises:
 			ValueError: If neither database_url nor config is provided
 			ValueError: If adapter is not supported
+			ValueError: If revision notifications are enabled without polling
 		"""
 		if config:
 			self._config = config
@@ -83,11 +174,27 @@ class RBAC:
 		if self._config.adapter != "sqlalchemy":
 			raise ValueError(f"Unsupported adapter: {self._config.adapter}")
 
+		if self._config.revision_notifications and self._config.revision_poll_interval is None:
+			raise ValueError("'revision_notifications' requires 'revision_poll_interval'")
+
 		self._initialized = False
 		self._service: RBACService | None = None
 		self._repositories: dict[
-			str, IPermissionGroupRepositoryPort | IPermissionRepositoryPort | IRoleRepositoryPort
+			str,
+			IPermissionGroupRepositoryPort
+			| IPermissionRepositoryPort
+			| IRoleRepositoryPort
+			| IRevisionRepositoryPort
+			| IUserRoleRepositoryPort,
 		] = {}
+		self._cache: LRUTTLCache | None = None
+		self._user_permissions: UserPermissionCache | None = None
+		self._engine: AsyncEngine | None = None
+		self._session_factory: async_sessionmaker[AsyncSession] | None = None
+		self._replica_engines: list[AsyncEngine] = []
+		self._revision_watcher: RevisionWatcher | None = None
+		self._instrumentation: Instrumentation | None = None
+		self._instrumentation_detach: Callable[[], None] | None = None
 
 	async def init(self) -> None:
 		"""
@@ -95,7 +202,7 @@ class RBAC:
 
 		This method:
 		1. Creates the database engine and session factory
-		2. Initializes the database schema (creates tables if they don't exist)
+		2. Creates or upgrades the database schema if its version is not current
 		3. Instantiates repositories
 		4. Creates the RBAC service
 
@@ -112,45 +219,232 @@ class RBAC:
 
 	async def _init_sqlalchemy(self) -> None:
 		"""Initialize SQLAlchemy adapter."""
-		import os
-
 		from vexen_rbac.infraestructure.output.persistence.sqlalchemy.database import (
-			DatabaseConfig,
-			init_db,
+			EngineOptions,
+			engine_registry,
+			ensure_schema,
+		)
+		from vexen_rbac.infraestructure.output.persistence.sqlalchemy.replicas import (
+			ReplicaRouter,
 		)
 
-		# Set environment variables for DatabaseConfig
-		os.environ["DATABASE_URL"] = self._config.database_url
-		os.environ["DB_ECHO"] = str(self._config.echo)
-		os.environ["DB_POOL_SIZE"] = str(self._config.pool_size)
-		os.environ["DB_MAX_OVERFLOW"] = str(self._config.max_overflow)
+		# Each instance owns its engine; instances with the same URL and pool
+		# settings share one through the registry
+		options = EngineOptions(
+			echo=self._config.echo,
+			pool_size=self._config.pool_size,
+			max_overflow=self._config.max_overflow,
+			pool_recycle=self._config.pool_recycle,
+			pool_pre_ping=self._config.pool_pre_ping,
+			pool_timeout=self._config.pool_timeout,
+			statement_cache_size=self._config.statement_cache_size,
+		)
+		self._engine, self._session_factory = engine_registry.acquire(
+			self._config.database_url, options
+		)
 
-		# Initialize database (creates tables)
-		await init_db()
+		# Replicas share the primary's pool settings; their schema is replicated
+		replica_router = None
+		if self._config.replica_urls:
+			replica_factories = []
+			for replica_url in self._config.replica_urls:
+				replica_engine, replica_factory = engine_registry.acquire(replica_url, options)
+				self._replica_engines.append(replica_engine)
+				replica_factories.append(replica_factory)
+			replica_router = ReplicaRouter(
+				self._session_factory,
+				replica_factories,
+				retry_after=self._config.replica_retry_after,
+			)
 
-		# Store session factory for creating sessions per operation
-		self._session_factory = DatabaseConfig.get_session_factory()
+		# Create or upgrade the schema unless its recorded version is current
+		if self._config.create_schema:
+			try:
+				await ensure_schema(self._engine)
+			except Exception:
+				await self._release_engine()
+				raise
 
 		# Create repository wrappers that manage sessions
 		from vexen_rbac.infraestructure.output.persistence.sqlalchemy.adapters import (
 			PermissionGroupRepositoryAdapter,
 			PermissionRepositoryAdapter,
+			RevisionRepositoryAdapter,
 			RoleRepositoryAdapter,
+			UserRoleRepositoryAdapter,
 		)
 
-		self._repositories["role"] = RoleRepositoryAdapter(self._session_factory)
-		self._repositories["permission"] = PermissionRepositoryAdapter(self._session_factory)
+		adapter_options = {
+			"replica_router": replica_router,
+			"materialize_effective_permissions": self._config.materialize_effective_permissions,
+		}
+		# Changes to roles, permissions or groups can alter any user's permission set
+		graph_options = {**adapter_options, "on_write": self._on_local_write}
+		self._repositories["role"] = RoleRepositoryAdapter(self._session_factory, **graph_options)
+		self._repositories["permission"] = PermissionRepositoryAdapter(
+			self._session_factory, **graph_options
+		)
 		self._repositories["permission_group"] = PermissionGroupRepositoryAdapter(
-			self._session_factory
+			self._session_factory, **graph_options
+		)
+		self._repositories["user_role"] = UserRoleRepositoryAdapter(
+			self._session_factory, **adapter_options
 		)
+		# Always probed on the primary: a lagging replica would hide changes
+		self._repositories["revision"] = RevisionRepositoryAdapter(self._session_factory)
+
+		if self._config.cache_enabled:
+			self._init_cache()
+		if self._config.authorization_cache_size > 0:
+			self._init_user_permission_cache()
 
 		# Initialize service
 		self._service = RBACService(
 			_role_repository=self._repositories["role"],
 			_permission_repository=self._repositories["permission"],
 			_permission_group_repository=self._repositories["permission_group"],
+			_user_role_repository=self._repositories["user_role"],
+			_consistent_read=self._consistent_read,
+		)
+
+		if self._config.instrumentation_enabled:
+			self._init_instrumentation()
+
+		try:
+			await self._init_revision_watcher()
+		except Exception:
+			# e.g. notifications requested on a driver other than asyncpg
+			if self._instrumentation_detach is not None:
+				self._instrumentation_detach()
+				self._instrumentation_detach = None
+			self._instrumentation = None
+			await self._release_engine()
+			raise
+
+	async def _init_revision_watcher(self) -> None:
+		"""Create the revision watcher and start it if background watching is enabled."""
+		from vexen_rbac.infraestructure.output.persistence.revision_watcher import (
+			RevisionWatcher,
 		)
 
+		notifier = None
+		if self._config.revision_notifications:
+			from vexen_rbac.infraestructure.output.persistence.sqlalchemy.revision_notifier import (
+				PostgresRevisionNotifier,
+			)
+
+			notifier = PostgresRevisionNotifier(self._engine)
+
+		self._revision_watcher = RevisionWatcher(
+			self._repositories["revision"],
+			interval=self._config.revision_poll_interval or 5.0,
+			notifier=notifier,
+		)
+		self._revision_watcher.add_listener(self._on_revision_change)
+		if self._config.revision_poll_interval is not None:
+			await self._revision_watcher.start()
+
+	async def _on_revision_change(self, revision: int) -> None:
+		"""Drop data cached in this process after another process wrote."""
+		self.clear_cache()
+		if self._service is not None and self._service.authorization.is_loaded:
+			await self._service.authorization.load()
+		if self._service is not None and self._service.bulk_authorization.is_loaded:
+			await self._service.bulk_authorization.load()
+
+	def _init_cache(self) -> None:
+		"""Wrap the repositories with caching decorators sharing one cache."""
+		from vexen_rbac.infraestructure.output.persistence.cache import (
+			CachedPermissionGroupRepository,
+			CachedPermissionRepository,
+			CachedRoleRepository,
+			CachedUserRoleRepository,
+			LRUTTLCache,
+		)
+
+		self._cache = LRUTTLCache(max_size=self._config.cache_max_size, ttl=self._config.cache_ttl)
+		self._repositories["role"] = CachedRoleRepository(self._repositories["role"], self._cache)
+		self._repositories["permission"] = CachedPermissionRepository(
+			self._repositories["permission"], self._cache
+		)
+		self._repositories["permission_group"] = CachedPermissionGroupRepository(
+			self._repositories["permission_group"], self._cache
+		)
+		self._repositories["user_role"] = CachedUserRoleRepository(
+			self._repositories["user_role"], self._cache
+		)
+
+	def _init_user_permission_cache(self) -> None:
+		"""Put the per-user permission set cache in front of the user role repository."""
+		from vexen_rbac.infraestructure.output.persistence.cache import (
+			LRUTTLCache,
+			UserPermissionCache,
+		)
+
+		# Without a background watcher, writes of other processes are only seen
+		# by revalidating each entry against the global revision
+		revisions = None
+		if self._config.revision_poll_interval is None:
+			revisions = self._repositories["revision"]
+
+		self._user_permissions = UserPermissionCache(
+			self._repositories["user_role"],
+			LRUTTLCache(
+				max_size=self._config.authorization_cache_size,
+				ttl=self._config.authorization_cache_ttl,
+			),
+			revisions,
+			self._consistent_read,
+		)
+		self._repositories["user_role"] = self._user_permissions
+
+	def _consistent_read(self) -> "SQLAlchemyUnitOfWork":
+		"""
+		Create a unit of work whose reads all see one state of the primary.
+
+		Reads inside it skip the replicas and the repository cache and share
+		one transaction, started at REPEATABLE READ on PostgreSQL (whose
+		default level takes a new snapshot per statement); SQLite and MySQL
+		transactions already read from one snapshot.
+		"""
+		from vexen_rbac.infraestructure.output.persistence.sqlalchemy.unit_of_work import (
+			SQLAlchemyUnitOfWork,
+		)
+
+		isolation_level = None
+		if self._engine.dialect.name == "postgresql":
+			isolation_level = "REPEATABLE READ"
+		return SQLAlchemyUnitOfWork(self._session_factory, isolation_level)
+
+	def _on_local_write(self) -> None:
+		"""Drop the cached user permission sets after a role, permission or group write."""
+		if self._user_permissions is not None:
+			self._user_permissions.clear()
+
+	def _init_instrumentation(self) -> None:
+		"""Wrap the use cases with timing wrappers and listen to the engines."""
+		from vexen_rbac.infraestructure.output.instrumentation import (
+			Instrumentation,
+			instrument_factory,
+		)
+		from vexen_rbac.infraestructure.output.persistence.sqlalchemy.instrumentation import (
+			EngineInstrumentation,
+		)
+
+		self._instrumentation = Instrumentation()
+		instrument_factory(self._service.roles, "roles", self._instrumentation)
+		instrument_factory(self._service.permissions, "permissions", self._instrumentation)
+		instrument_factory(
+			self._service.permission_groups, "permission_groups", self._instrumentation
+		)
+		instrument_factory(self._service.user_roles, "user_roles", self._instrumentation)
+
+		listeners = EngineInstrumentation(
+			self._instrumentation, [self._engine, *self._replica_engines]
+		)
+		listeners.attach()
+		self._instrumentation_detach = listeners.detach
+
 	async def close(self) -> None:
 		"""
 		Close all database connections and cleanup resources.
@@ -160,14 +454,36 @@ class RBAC:
 		if not self._initialized:
 			return
 
-		if self._config.adapter == "sqlalchemy":
-			from vexen_rbac.infraestructure.output.persistence.sqlalchemy.database import close_db
+		if self._revision_watcher is not None:
+			await self._revision_watcher.stop()
+			self._revision_watcher = None
+
+		if self._instrumentation_detach is not None:
+			self._instrumentation_detach()
+			self._instrumentation_detach = None
 
-			await close_db()
+		if self._config.adapter == "sqlalchemy":
+			await self._release_engine()
 
 		self._initialized = False
 		self._service = None
 		self._repositories = {}
+		self._cache = None
+		self._user_permissions = None
+		self._instrumentation = None
+
+	async def _release_engine(self) -> None:
+		"""Give this instance's engines back to the registry."""
+		from vexen_rbac.infraestructure.output.persistence.sqlalchemy.database import (
+			engine_registry,
+		)
+
+		for engine in [self._engine, *self._replica_engines]:
+			if engine is not None:
+				await engine_registry.release(engine)
+		self._engine = None
+		self._replica_engines = []
+		self._session_factory = None
 
 	@property
 	def roles(self):
@@ -211,6 +527,126 @@ class RBAC:
 		self._ensure_initialized()
 		return self._service.permission_groups
 
+	@property
+	def user_roles(self):
+		"""
+		Access to user role assignment use cases.
+
+		Returns:
+			User role use case factory with methods like assign_roles, list_user_roles, etc.
+
+		Raises:
+			RuntimeError: If RBAC is not initialized
+		"""
+		self._ensure_initialized()
+		return self._service.user_roles
+
+	@property
+	def authorization(self) -> AuthorizationEngine:
+		"""
+		Access to the in-memory authorization engine.
+
+		Call `await rbac.authorization.load()` to compile the RBAC graph
+		before checking permissions, and again after changing it.
+
+		Returns:
+			AuthorizationEngine: Engine answering role permission checks
+
+		Raises:
+			RuntimeError: If RBAC is not initialized
+		"""
+		self._ensure_initialized()
+		return self._service.authorization
+
+	async def authorize(self, user_id: str, permission_name: str) -> bool:
+		"""
+		Check whether a user holds a permission through any of their roles.
+
+		The user's effective permission set is resolved in one query and then
+		served from memory (see `authorization_cache_size`).
+
+		Args:
+			user_id: Identifier of the user (as given to `user_roles.assign_roles`)
+			permission_name: Permission name (e.g. "tickets.write")
+
+		Returns:
+			True if one of the user's roles grants the permission, directly or
+			through a group
+
+		Raises:
+			RuntimeError: If RBAC is not initialized
+		"""
+		self._ensure_initialized()
+		return await self._service.user_authorization.authorize(user_id, permission_name)
+
+	async def check_many(self, user_id: str, permission_names: list[str]) -> dict[str, bool]:
+		"""
+		Check many permissions of a user at once (one permission set lookup).
+
+		Args:
+			user_id: Identifier of the user
+			permission_names: Permission names to check
+
+		Returns:
+			Decision for each requested name
+
+		Raises:
+			RuntimeError: If RBAC is not initialized
+		"""
+		self._ensure_initialized()
+		return await self._service.user_authorization.check_many(user_id, permission_names)
+
+	def check(self, role_id: int, permission_name: str) -> bool:
+		"""
+		Check whether a role holds a permission, without touching the database.
+
+		Args:
+			role_id: ID of the role
+			permission_name: Permission name (e.g. "tickets.write")
+
+		Returns:
+			True if the role has the permission directly or through a group
+
+		Raises:
+			RuntimeError: If RBAC is not initialized or the engine is not loaded
+		"""
+		return self.authorization.check(role_id, permission_name)
+
+	@property
+	def bulk_authorization(self) -> BulkAuthorizer:
+		"""
+		Access to the role × permission matrix for batch checks.
+
+		Call `await rbac.bulk_authorization.load()` to compile the matrix
+		before checking, and again after changing the graph. NumPy is used
+		when installed (`pip install vexen-rbac[numpy]`).
+
+		Returns:
+			BulkAuthorizer: Authorizer answering batches of role permission checks
+
+		Raises:
+			RuntimeError: If RBAC is not initialized
+		"""
+		self._ensure_initialized()
+		return self._service.bulk_authorization
+
+	def check_batch(self, role_ids: Sequence[int], permission_ids: Sequence[int]):
+		"""
+		Check many (role, permission) pairs at once, without touching the database.
+
+		Args:
+			role_ids: Role ID of each pair
+			permission_ids: Permission ID of each pair (same length)
+
+		Returns:
+			ndarray[bool] when NumPy is installed, otherwise list[bool]
+
+		Raises:
+			RuntimeError: If RBAC is not initialized or the matrix is not loaded
+			ValueError: If the sequences have different lengths
+		"""
+		return self.bulk_authorization.check_batch(role_ids, permission_ids)
+
 	@property
 	def service(self) -> RBACService:
 		"""
@@ -227,6 +663,194 @@ class RBAC:
 		self._ensure_initialized()
 		return self._service
 
+	def unit_of_work(self) -> "SQLAlchemyUnitOfWork":
+		"""
+		Create a unit of work sharing one session and transaction across calls.
+
+		Every use case called inside ``async with rbac.unit_of_work():`` (in the
+		same task) reuses one session; the transaction is committed once when
+		the block exits, or rolled back if it raises. Nested blocks join the
+		outer one.
+
+		Example:
+			>>> async with rbac.unit_of_work():
+			...     roles = await rbac.roles.get_roles_by_ids([1, 2])
+			...     await rbac.roles.add_permissions(1, [4, 5])
+
+		Returns:
+			SQLAlchemyUnitOfWork: Async context manager
+
+		Raises:
+			RuntimeError: If RBAC is not initialized
+		"""
+		self._ensure_initialized()
+
+		from vexen_rbac.infraestructure.output.persistence.sqlalchemy.unit_of_work import (
+			SQLAlchemyUnitOfWork,
+		)
+
+		return SQLAlchemyUnitOfWork(self._session_factory)
+
+	async def rebuild_effective_permissions(self) -> int:
+		"""
+		Recompute the materialized role_effective_permissions table in full.
+
+		Run it once after enabling `materialize_effective_permissions` on an
+		existing database, or after changing the association tables by hand.
+		The table is replaced in one transaction.
+
+		Returns:
+			Number of (role, permission, source) rows in the rebuilt table
+
+		Raises:
+			RuntimeError: If RBAC is not initialized
+		"""
+		self._ensure_initialized()
+
+		from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories import (
+			effective_permissions,
+		)
+
+		async with self._session_factory() as session:
+			rows = await effective_permissions.rebuild(session)
+			await session.commit()
+
+		self.clear_cache()
+		return rows
+
+	@property
+	def revisions(self) -> "RevisionWatcher":
+		"""
+		Watcher of the global RBAC revision.
+
+		Every write bumps the revision in its own transaction. Call
+		`await rbac.revisions.check()` (e.g. once per request) to revalidate
+		in-process data with one primary-key lookup, or set
+		`revision_poll_interval` to do it in the background. Extra callbacks
+		can be registered with `add_listener`.
+
+		Returns:
+			RevisionWatcher: Detects changes made by any process
+
+		Raises:
+			RuntimeError: If RBAC is not initialized
+		"""
+		self._ensure_initialized()
+		return self._revision_watcher
+
+	async def current_revision(self) -> int:
+		"""
+		Read the global RBAC revision (one primary-key lookup on the primary).
+
+		Returns:
+			Revision bumped by every write, or 0 if nothing was ever written
+
+		Raises:
+			RuntimeError: If RBAC is not initialized
+		"""
+		self._ensure_initialized()
+		return await self._repositories["revision"].current_revision()
+
+	async def export_snapshot(self, path: str | os.PathLike) -> int:
+		"""
+		Write the whole RBAC graph to a memory-mappable binary snapshot.
+
+		Workers can then answer permission checks from the file with
+		`RBAC.load_snapshot(path)`, without a database connection. The file is
+		replaced atomically.
+
+		Args:
+			path: Destination file
+
+		Returns:
+			Size of the snapshot in bytes
+
+		Raises:
+			RuntimeError: If RBAC is not initialized
+		"""
+		self._ensure_initialized()
+
+		from vexen_rbac.infraestructure.output.snapshot import write_snapshot
+
+		# One snapshot of the database, so no grant refers to a row read before it existed
+		async with self._consistent_read():
+			roles = await self._repositories["role"].list()
+			permission_groups = await self._repositories["permission_group"].list()
+			permissions = await self._repositories["permission"].list()
+		return write_snapshot(path, roles, permission_groups, permissions)
+
+	@staticmethod
+	def load_snapshot(path: str | os.PathLike) -> "SnapshotAuthorizer":
+		"""
+		Open a snapshot written by `export_snapshot` for database-free checks.
+
+		The file is memory-mapped, so opening it is fast and its pages are
+		shared between processes. No `RBAC` instance or `init()` is needed.
+
+		Example:
+			>>> authorizer = RBAC.load_snapshot("/var/lib/app/rbac.snapshot")
+			>>> authorizer.check(role_id, "tickets.write")
+			True
+
+		Args:
+			path: Snapshot file
+
+		Returns:
+			SnapshotAuthorizer: Implements IPermissionCheckerPort; call
+				`close()` (or use it as a context manager) to unmap the file
+
+		Raises:
+			SnapshotFormatError: If the file is not a supported snapshot
+		"""
+		from vexen_rbac.infraestructure.output.snapshot import SnapshotAuthorizer
+
+		return SnapshotAuthorizer.open(path)
+
+	def cache_stats(self) -> "CacheStats | None":
+		"""
+		Get repository cache statistics.
+
+		Returns:
+			CacheStats with hits, misses, evictions, etc., or None if caching is disabled
+		"""
+		return self._cache.stats() if self._cache is not None else None
+
+	def clear_cache(self) -> None:
+		"""Drop every cached repository entry and user permission set."""
+		if self._cache is not None:
+			self._cache.clear()
+		if self._user_permissions is not None:
+			self._user_permissions.clear()
+
+	def stats(self) -> "InstrumentationStats | None":
+		"""
+		Get the metrics collected since initialization or the last reset.
+
+		Returns:
+			InstrumentationStats with per-operation calls, errors, latency
+			histogram, statements and rows, or None if instrumentation is disabled
+		"""
+		return self._instrumentation.stats() if self._instrumentation is not None else None
+
+	def reset_stats(self) -> None:
+		"""Reset the collected metrics (no-op if instrumentation is disabled)."""
+		if self._instrumentation is not None:
+			self._instrumentation.reset()
+
+	def prometheus_metrics(self) -> str:
+		"""
+		Render the collected metrics in the Prometheus text exposition format.
+
+		Example:
+			>>> @app.get("/metrics")
+			... async def metrics():
+			...     return PlainTextResponse(rbac.prometheus_metrics())
+
+		Returns:
+			The exposition text, or an empty string if instrumentation is disabled
+		"""
+		return self._instrumentation.prometheus() if self._instrumentation is not None else ""
+
 	def _ensure_initialized(self) -> None:
 		"""
 		Ensure RBAC is initialized.
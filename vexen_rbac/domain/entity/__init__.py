@@ -1,9 +1,11 @@
 from .permission import Permission
 from .permission_group import PermissionGroup
 from .role import Role
+from .user_role import UserRole
 
 __all__ = [
 	"Permission",
 	"PermissionGroup",
 	"Role",
+	"UserRole",
 ]
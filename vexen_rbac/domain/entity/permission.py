@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from vexen_rbac.domain.vo.permission_set import SEPARATOR, WILDCARD
+
 
 @dataclass
 class Permission:
@@ -9,6 +11,9 @@ class Permission:
 
 	Representa una acción específica que puede ser otorgada a un rol.
 	Ejemplos: 'users.read', 'tickets.write', 'roles.delete'
+
+	Un segmento '*' es un comodín: 'tickets.*' otorga cualquier acción sobre
+	tickets y '*.read' la lectura de cualquier recurso.
 	"""
 
 	id: int | None
@@ -20,5 +25,13 @@ class Permission:
 
 	def __post_init__(self):
 		"""Validación básica"""
-		if not self.name or "." not in self.name:
+		if not self.name or SEPARATOR not in self.name:
 			raise ValueError("Permission name must follow format 'resource.action'")
+		for segment in self.name.split(SEPARATOR):
+			if WILDCARD in segment and segment != WILDCARD:
+				raise ValueError("Permission wildcard '*' must be a whole segment")
+
+	@property
+	def is_wildcard(self) -> bool:
+		"""Indica si el permiso es un patrón con comodines"""
+		return WILDCARD in self.name.split(SEPARATOR)
@@ -1,5 +1,9 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from vexen_rbac.domain.ports.permission_checker_port import IPermissionCheckerPort
 
 
 @dataclass
@@ -17,12 +21,15 @@ class Role:
 	description: str | None = None
 	permissions: list[int] = field(default_factory=list)  # IDs de Permission
 	permission_groups: list[int] = field(default_factory=list)  # IDs de PermissionGroup
-	user_count: int = 0  # Calculado, no persistido
+	user_count: int = 0  # Calculado (usuarios asignados) al listar, no persistido
 	created_at: datetime = field(default_factory=datetime.now)
 	updated_at: datetime | None = None
 
-	def has_permission(self, permission_name: str) -> bool:
-		"""Verifica si este rol tiene un permiso específico"""
-		# En implementación real, se haría JOIN con tabla permissions
-		# Aquí es solo la interfaz del dominio
-		raise NotImplementedError("Debe implementarse en el repositorio")
+	def has_permission(self, permission_name: str, checker: "IPermissionCheckerPort") -> bool:
+		"""
+		Verifica si este rol tiene un permiso específico.
+
+		La entidad solo conoce IDs, por lo que la resolución por nombre
+		(incluyendo permisos heredados vía grupos) se delega al checker.
+		"""
+		return checker.check(self.id, permission_name)
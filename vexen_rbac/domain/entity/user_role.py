@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass
+class UserRole:
+	"""
+	Asignación de un rol a un usuario.
+
+	Los usuarios viven fuera de la librería: `user_id` es un identificador
+	opaco (UUID, clave primaria de la tabla de usuarios de la aplicación, etc.)
+	"""
+
+	user_id: str
+	role_id: int  # ID de Role
+	assigned_at: datetime = field(default_factory=datetime.now)
@@ -1,9 +1,15 @@
+from .permission_checker_port import IPermissionCheckerPort
 from .permission_group_repository_port import IPermissionGroupRepositoryPort
 from .permission_repository_port import IPermissionRepositoryPort
+from .revision_repository_port import IRevisionRepositoryPort
 from .role_repository_port import IRoleRepositoryPort
+from .user_role_repository_port import IUserRoleRepositoryPort
 
 __all__ = [
 	"IRoleRepositoryPort",
 	"IPermissionRepositoryPort",
 	"IPermissionGroupRepositoryPort",
+	"IPermissionCheckerPort",
+	"IRevisionRepositoryPort",
+	"IUserRoleRepositoryPort",
 ]
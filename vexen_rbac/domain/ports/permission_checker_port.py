@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class IPermissionCheckerPort(ABC):
+	"""Interfaz para resolver decisiones de autorización de un rol"""
+
+	@abstractmethod
+	def check(self, role_id: int, permission_name: str) -> bool:
+		"""Indica si el rol tiene el permiso efectivo (directo o vía grupos)"""
+		pass
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 
 from vexen_rbac.domain.entity.permission_group import PermissionGroup
 
@@ -11,27 +13,84 @@ class IPermissionGroupRepositoryPort(ABC):
 		"""Obtiene un grupo de permisos por su ID"""
 		pass
 
+	@abstractmethod
+	async def get_many(self, permission_group_ids: list[int]) -> list[PermissionGroup]:
+		"""
+		Obtiene varios grupos de permisos por sus IDs en una sola consulta.
+
+		Retorna los encontrados en el orden pedido; los IDs inexistentes se omiten.
+		"""
+		pass
+
 	@abstractmethod
 	async def save(self, permission_group: PermissionGroup) -> PermissionGroup:
 		"""Guarda un grupo de permisos en el repositorio"""
 		pass
 
+	@abstractmethod
+	async def create_many(
+		self, permission_groups: list[PermissionGroup]
+	) -> list[PermissionGroup | None]:
+		"""
+		Crea varios grupos de permisos (con sus permisos) en lote.
+
+		Retorna una lista alineada con la entrada: None en las posiciones cuyo
+		nombre ya existía (esas filas no se insertan).
+		"""
+		pass
+
 	@abstractmethod
 	async def delete(self, permission_group_id: int) -> None:
 		pass
 
 	@abstractmethod
-	async def add_permissions(self, group_id: int, permission_ids: list[int]) -> PermissionGroup:
+	async def add_permissions(self, group_id: int, permission_ids: list[int]) -> list[int]:
+		"""Asigna permisos a un grupo y retorna los IDs que se asignaron realmente"""
 		pass
 
 	@abstractmethod
-	async def remove_permissions(self, group_id: int, permission_ids: list[int]) -> PermissionGroup:
+	async def remove_permissions(self, group_id: int, permission_ids: list[int]) -> list[int]:
+		"""Quita permisos de un grupo y retorna los IDs que se quitaron realmente"""
 		pass
 
 	@abstractmethod
 	async def count_permissions(self, group_id: int) -> int:
 		pass
 
+	@abstractmethod
+	async def list_with_counts(self) -> list[tuple[PermissionGroup, int]]:
+		"""
+		Obtiene todos los grupos con su cantidad de permisos.
+
+		Los grupos se retornan sin los IDs de sus permisos.
+		"""
+		pass
+
+	@abstractmethod
+	async def list_paginated(self, page: int, page_size: int) -> tuple[list[PermissionGroup], int]:
+		pass
+
+	@abstractmethod
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[PermissionGroup], int | None]:
+		"""
+		Paginación por keyset: grupos más recientes primero, posteriores a (created_at, id).
+
+		Retorna hasta `limit` grupos y el total solo si `include_total` es True.
+		"""
+		pass
+
+	@abstractmethod
+	def stream(self, chunk_size: int) -> AsyncIterator[list[PermissionGroup]]:
+		"""
+		Recorre todos los grupos de permisos, ordenados por nombre, en bloques de hasta chunk_size.
+
+		Los bloques se leen de un cursor del servidor a medida que se consumen,
+		así la memoria no depende del tamaño del catálogo.
+		"""
+		pass
+
 	@abstractmethod
 	async def list(self) -> list[PermissionGroup]:
 		"""Obtiene todos los grupos de permisos"""
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 
 from vexen_rbac.domain.entity.permission import Permission
 
@@ -11,11 +13,30 @@ class IPermissionRepositoryPort(ABC):
 		"""Obtiene un permiso por su ID"""
 		pass
 
+	@abstractmethod
+	async def get_many(self, permission_ids: list[int]) -> list[Permission]:
+		"""
+		Obtiene varios permisos por sus IDs en una sola consulta.
+
+		Retorna los encontrados en el orden pedido; los IDs inexistentes se omiten.
+		"""
+		pass
+
 	@abstractmethod
 	async def save(self, permission: Permission) -> Permission:
 		"""Guarda un permiso en el repositorio"""
 		pass
 
+	@abstractmethod
+	async def create_many(self, permissions: list[Permission]) -> list[Permission | None]:
+		"""
+		Crea varios permisos en lote.
+
+		Retorna una lista alineada con la entrada: None en las posiciones cuyo
+		nombre ya existía (esas filas no se insertan).
+		"""
+		pass
+
 	@abstractmethod
 	async def delete(self, permission_id: int) -> None:
 		pass
@@ -24,6 +45,31 @@ class IPermissionRepositoryPort(ABC):
 	async def group_by_category(self) -> dict[str, list[Permission]]:
 		pass
 
+	@abstractmethod
+	async def list_paginated(self, page: int, page_size: int) -> tuple[list[Permission], int]:
+		pass
+
+	@abstractmethod
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[Permission], int | None]:
+		"""
+		Paginación por keyset: permisos más recientes primero, posteriores a (created_at, id).
+
+		Retorna hasta `limit` permisos y el total solo si `include_total` es True.
+		"""
+		pass
+
+	@abstractmethod
+	def stream(self, chunk_size: int) -> AsyncIterator[list[Permission]]:
+		"""
+		Recorre todos los permisos, ordenados por nombre, en bloques de hasta chunk_size.
+
+		Los bloques se leen de un cursor del servidor a medida que se consumen,
+		así la memoria no depende del tamaño del catálogo.
+		"""
+		pass
+
 	@abstractmethod
 	async def list(self) -> list[Permission]:
 		"""Obtiene todos los permisos"""
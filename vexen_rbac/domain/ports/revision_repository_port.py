@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class IRevisionRepositoryPort(ABC):
+	"""Interfaz para consultar la revisión global de los datos RBAC"""
+
+	@abstractmethod
+	async def current_revision(self) -> int:
+		"""Obtiene la revisión actual (se incrementa con cada escritura)"""
+		pass
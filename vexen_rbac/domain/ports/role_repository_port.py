@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 
+from vexen_rbac.domain.entity.permission import Permission
 from vexen_rbac.domain.entity.role import Role
 
 
@@ -11,21 +14,42 @@ class IRoleRepositoryPort(ABC):
 		"""Obtiene un rol por su ID"""
 		pass
 
+	@abstractmethod
+	async def get_many(self, role_ids: list[int]) -> list[Role]:
+		"""
+		Obtiene varios roles por sus IDs en una sola consulta.
+
+		Retorna los encontrados en el orden pedido; los IDs inexistentes se omiten.
+		"""
+		pass
+
 	@abstractmethod
 	async def save(self, role: Role) -> Role:
 		"""Guarda un rol en el repositorio"""
 		pass
 
+	@abstractmethod
+	async def create_many(self, roles: list[Role]) -> list[Role | None]:
+		"""
+		Crea varios roles (con sus permisos y grupos) en lote.
+
+		Retorna una lista alineada con la entrada: None en las posiciones cuyo
+		nombre ya existía (esas filas no se insertan).
+		"""
+		pass
+
 	@abstractmethod
 	async def delete(self, role_id: int) -> None:
 		pass
 
 	@abstractmethod
-	async def add_permissions(self, role_id: int, permission_ids: list[int]) -> Role:
+	async def add_permissions(self, role_id: int, permission_ids: list[int]) -> list[int]:
+		"""Asigna permisos a un rol y retorna los IDs que se asignaron realmente"""
 		pass
 
 	@abstractmethod
-	async def remove_permissions(self, role_id: int, permission_ids: list[int]) -> Role:
+	async def remove_permissions(self, role_id: int, permission_ids: list[int]) -> list[int]:
+		"""Quita permisos de un rol y retorna los IDs que se quitaron realmente"""
 		pass
 
 	@abstractmethod
@@ -36,14 +60,54 @@ class IRoleRepositoryPort(ABC):
 	async def count_permissions(self, role_id: int) -> int:
 		pass
 
+	@abstractmethod
+	async def list_with_counts(self) -> list[tuple[Role, int]]:
+		"""
+		Obtiene todos los roles con su cantidad de permisos directos.
+
+		Los roles se retornan sin los IDs de sus relaciones.
+		"""
+		pass
+
 	@abstractmethod
 	async def list_paginated(self, page: int, page_size: int) -> tuple[list[Role], int]:
 		pass
 
+	@abstractmethod
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[Role], int | None]:
+		"""
+		Paginación por keyset: roles más recientes primero, posteriores a (created_at, id).
+
+		Retorna hasta `limit` roles y el total solo si `include_total` es True.
+		"""
+		pass
+
 	@abstractmethod
 	async def get_by_id_with_permissions(self, role_id: int) -> tuple[Role, list] | None:
 		pass
 
+	@abstractmethod
+	async def get_effective_permissions(self, role_ids: list[int]) -> list[Permission]:
+		"""
+		Obtiene los permisos efectivos (directos y vía grupos) de uno o varios roles.
+
+		Devuelve los permisos tal como están concedidos: un comodín ("tickets.*")
+		aparece como su propio permiso, sin expandir a los nombres que cubre.
+		"""
+		pass
+
+	@abstractmethod
+	def stream(self, chunk_size: int) -> AsyncIterator[list[Role]]:
+		"""
+		Recorre todos los roles, ordenados por nombre, en bloques de hasta chunk_size.
+
+		Los bloques se leen de un cursor del servidor a medida que se consumen,
+		así la memoria no depende del tamaño del catálogo.
+		"""
+		pass
+
 	@abstractmethod
 	async def list(self) -> list[Role]:
 		"""Obtiene todos los roles"""
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+
+from vexen_rbac.domain.entity.role import Role
+from vexen_rbac.domain.entity.user_role import UserRole
+from vexen_rbac.domain.vo.permission_set import PermissionSet
+
+
+class IUserRoleRepositoryPort(ABC):
+	"""Interfaz del repositorio de asignaciones de roles a usuarios"""
+
+	@abstractmethod
+	async def assign(self, user_id: str, role_ids: list[int]) -> list[int]:
+		"""
+		Asigna roles a un usuario.
+
+		Los roles inexistentes o ya asignados se omiten; retorna los IDs que se
+		asignaron realmente.
+		"""
+		pass
+
+	@abstractmethod
+	async def revoke(self, user_id: str, role_ids: list[int]) -> list[int]:
+		"""Quita roles de un usuario y retorna los IDs que se quitaron realmente"""
+		pass
+
+	@abstractmethod
+	async def list_user_roles(self, user_id: str) -> list[Role]:
+		"""Obtiene los roles asignados a un usuario, ordenados por nombre"""
+		pass
+
+	@abstractmethod
+	async def get_permission_set(self, user_id: str) -> PermissionSet:
+		"""
+		Obtiene los permisos efectivos de un usuario en una sola consulta.
+
+		Incluye los permisos directos de sus roles y los heredados vía grupos;
+		los permisos con comodines ("tickets.*") quedan compilados en el conjunto.
+		"""
+		pass
+
+	@abstractmethod
+	async def list_role_users(
+		self, role_id: int, page: int, page_size: int
+	) -> tuple[list[UserRole], int]:
+		"""Obtiene una página de los usuarios de un rol (por user_id) y el total"""
+		pass
@@ -0,0 +1,7 @@
+from .permission_set import PermissionSet, PermissionTrie, is_wildcard
+
+__all__ = [
+	"PermissionSet",
+	"PermissionTrie",
+	"is_wildcard",
+]
@@ -0,0 +1,92 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+SEPARATOR = "."
+WILDCARD = "*"
+
+# Claves de nodo que no pueden confundirse con un segmento
+_END = object()  # un patrón termina en este nodo
+_REST = object()  # un "*" final: coincide con uno o más segmentos restantes
+
+
+def is_wildcard(name: str) -> bool:
+	"""Indica si el nombre de permiso contiene un segmento comodín ("tickets.*")"""
+	return WILDCARD in name.split(SEPARATOR)
+
+
+class PermissionTrie:
+	"""
+	Trie de segmentos con patrones de permisos con comodines.
+
+	Un segmento "*" coincide con cualquier segmento; al final del patrón
+	coincide además con cualquier sufijo ("tickets.*" cubre "tickets.write" y
+	"tickets.comments.write"). `matches` recorre el nombre segmento a segmento,
+	sin comparar contra cada patrón.
+	"""
+
+	__slots__ = ("_root", "_size")
+
+	def __init__(self, patterns: Iterable[str] = ()):
+		self._root: dict = {}
+		self._size = 0
+		for pattern in patterns:
+			self.add(pattern)
+
+	def add(self, pattern: str) -> None:
+		"""Agrega un patrón (p. ej. "tickets.*" o "*.read")"""
+		segments = pattern.split(SEPARATOR)
+		node = self._root
+		for segment in segments[:-1]:
+			node = node.setdefault(segment, {})
+		if segments[-1] == WILDCARD:
+			node[_REST] = True
+		else:
+			node.setdefault(segments[-1], {})[_END] = True
+		self._size += 1
+
+	def matches(self, name: str) -> bool:
+		"""Indica si algún patrón cubre el nombre de permiso"""
+		segments = name.split(SEPARATOR)
+		nodes = [self._root]
+		for segment in segments:
+			next_nodes = []
+			for node in nodes:
+				if _REST in node:
+					return True
+				child = node.get(segment)
+				if child is not None:
+					next_nodes.append(child)
+				child = node.get(WILDCARD)
+				if child is not None:
+					next_nodes.append(child)
+			if not next_nodes:
+				return False
+			nodes = next_nodes
+		return any(_END in node for node in nodes)
+
+	def __len__(self) -> int:
+		return self._size
+
+
+@dataclass(frozen=True)
+class PermissionSet:
+	"""
+	Conjunto de permisos efectivos: nombres exactos y patrones con comodines.
+
+	Los nombres exactos se resuelven con una búsqueda en un frozenset y los
+	patrones con un PermissionTrie, así `in` cuesta O(segmentos).
+	"""
+
+	names: frozenset[str] = frozenset()
+	wildcards: PermissionTrie = field(default_factory=PermissionTrie)
+
+	@classmethod
+	def of(cls, names: Iterable[str]) -> "PermissionSet":
+		"""Separa los nombres exactos de los patrones y compila estos últimos"""
+		names = frozenset(names)
+		return cls(names, PermissionTrie(name for name in names if is_wildcard(name)))
+
+	def __contains__(self, name: object) -> bool:
+		if name in self.names:
+			return True
+		return isinstance(name, str) and len(self.wildcards) > 0 and self.wildcards.matches(name)
@@ -0,0 +1,25 @@
+"""
+Opt-in metrics of RBAC operations: latency histograms, SQL statements and rows.
+"""
+
+from vexen_rbac.infraestructure.output.instrumentation.metrics import (
+	LATENCY_BUCKETS,
+	Instrumentation,
+	InstrumentationStats,
+	OperationStats,
+)
+from vexen_rbac.infraestructure.output.instrumentation.use_cases import (
+	InstrumentedStreamUseCase,
+	InstrumentedUseCase,
+	instrument_factory,
+)
+
+__all__ = [
+	"LATENCY_BUCKETS",
+	"Instrumentation",
+	"InstrumentationStats",
+	"OperationStats",
+	"InstrumentedUseCase",
+	"InstrumentedStreamUseCase",
+	"instrument_factory",
+]
@@ -0,0 +1,317 @@
+"""
+Per-operation counters and latency histograms with Prometheus text exposition.
+"""
+
+import time
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS = (
+	0.0005,
+	0.001,
+	0.0025,
+	0.005,
+	0.01,
+	0.025,
+	0.05,
+	0.1,
+	0.25,
+	0.5,
+	1.0,
+	2.5,
+	5.0,
+	10.0,
+)
+
+METRIC_PREFIX = "vexen_rbac"
+
+T = TypeVar("T")
+
+
+@dataclass
+class OperationStats:
+	"""
+	Counters of one operation (e.g. "roles.get_role").
+
+	Attributes:
+		calls: Completed calls
+		errors: Calls that raised or returned an unsuccessful response
+		statements: SQL statements executed by the calls
+		rows_loaded: ORM objects loaded by the calls
+		rows_written: Rows changed by the calls' INSERT/UPDATE/DELETE statements
+		total_seconds: Sum of the call latencies
+		buckets: Calls per latency bucket (not cumulative); the last entry
+			counts calls slower than the largest bound
+	"""
+
+	calls: int = 0
+	errors: int = 0
+	statements: int = 0
+	rows_loaded: int = 0
+	rows_written: int = 0
+	total_seconds: float = 0.0
+	buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+	@property
+	def mean_seconds(self) -> float:
+		"""Average latency of the calls."""
+		return self.total_seconds / self.calls if self.calls else 0.0
+
+	def quantile(self, q: float) -> float:
+		"""
+		Estimate a latency quantile from the histogram.
+
+		Args:
+			q: Quantile between 0 and 1 (e.g. 0.95)
+
+		Returns:
+			Upper bound of the bucket holding the quantile, in seconds
+			(the largest bound if it falls in the overflow bucket)
+		"""
+		if not self.calls:
+			return 0.0
+		rank = q * self.calls
+		seen = 0
+		for bound, count in zip(LATENCY_BUCKETS, self.buckets, strict=False):
+			seen += count
+			if seen >= rank:
+				return bound
+		return LATENCY_BUCKETS[-1]
+
+	def copy(self) -> "OperationStats":
+		"""Return an independent copy."""
+		return OperationStats(
+			calls=self.calls,
+			errors=self.errors,
+			statements=self.statements,
+			rows_loaded=self.rows_loaded,
+			rows_written=self.rows_written,
+			total_seconds=self.total_seconds,
+			buckets=list(self.buckets),
+		)
+
+
+@dataclass
+class InstrumentationStats:
+	"""
+	Snapshot of the collected metrics.
+
+	Attributes:
+		operations: Counters per operation name
+		statements: Every statement run on the instrumented engines, including
+			those issued outside an operation (e.g. revision polling)
+		rows_loaded: Every ORM object loaded during an operation
+		rows_written: Every row changed by the instrumented engines
+	"""
+
+	operations: dict[str, OperationStats] = field(default_factory=dict)
+	statements: int = 0
+	rows_loaded: int = 0
+	rows_written: int = 0
+
+
+class _Scope:
+	"""Counters of the operation running in the current task."""
+
+	__slots__ = ("owner", "failed", "statements", "rows_loaded", "rows_written")
+
+	def __init__(self, owner: "Instrumentation"):
+		self.owner = owner
+		self.failed = False
+		self.statements = 0
+		self.rows_loaded = 0
+		self.rows_written = 0
+
+
+_current_scope: ContextVar[_Scope | None] = ContextVar("vexen_rbac_operation", default=None)
+
+
+class Instrumentation:
+	"""
+	Collect latency, statement and row counters per operation.
+
+	`operation()` measures a call; statement and row events reported while it
+	runs (in the same task) are attributed to it. Event sources (engine
+	listeners) call the `on_*` methods.
+
+	Example:
+		>>> instrumentation = Instrumentation()
+		>>> with instrumentation.operation("roles.get_role"):
+		...     await repository.get_by_id(1)
+		>>> print(instrumentation.prometheus())
+	"""
+
+	def __init__(self):
+		"""Initialize empty counters."""
+		self._stats = InstrumentationStats()
+
+	@contextmanager
+	def operation(self, name: str) -> Iterator[_Scope]:
+		"""
+		Measure one call of an operation.
+
+		Args:
+			name: Operation name used as metric label
+
+		Yields:
+			The scope of the call; set its `failed` flag when the call reports
+			an error without raising
+		"""
+		scope = _Scope(self)
+		token = _current_scope.set(scope)
+		start = time.perf_counter()
+		try:
+			yield scope
+		except BaseException:
+			scope.failed = True
+			raise
+		finally:
+			elapsed = time.perf_counter() - start
+			_current_scope.reset(token)
+			self._record(name, scope, elapsed)
+
+	async def iterate(self, name: str, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+		"""
+		Measure the full iteration of an async iterator as one operation.
+
+		The latency runs from the first step until the iterator is exhausted,
+		raises or is closed early (which is not an error), so it includes the
+		time the consumer spends between items. Statements and rows are only
+		attributed while the iterator itself runs, never to the consumer.
+
+		Args:
+			name: Operation name used as metric label
+			iterator: Async iterator to measure; it is closed with this one
+
+		Yields:
+			The items of the iterator
+		"""
+		scope = _Scope(self)
+		start = time.perf_counter()
+		try:
+			while True:
+				token = _current_scope.set(scope)
+				try:
+					item = await iterator.__anext__()
+				except StopAsyncIteration:
+					break
+				finally:
+					_current_scope.reset(token)
+				yield item
+		except GeneratorExit:
+			raise
+		except BaseException:
+			scope.failed = True
+			raise
+		finally:
+			aclose = getattr(iterator, "aclose", None)
+			if aclose is not None:
+				token = _current_scope.set(scope)
+				try:
+					await aclose()
+				finally:
+					_current_scope.reset(token)
+			self._record(name, scope, time.perf_counter() - start)
+
+	def on_statement(self) -> None:
+		"""Count a statement about to be executed."""
+		self._stats.statements += 1
+		scope = _current_scope.get()
+		if scope is not None and scope.owner is self:
+			scope.statements += 1
+
+	def on_rows_written(self, count: int) -> None:
+		"""Count rows changed by a DML statement."""
+		self._stats.rows_written += count
+		scope = _current_scope.get()
+		if scope is not None and scope.owner is self:
+			scope.rows_written += count
+
+	def on_row_loaded(self) -> None:
+		"""Count an ORM object loaded; ignored outside this instance's operations."""
+		scope = _current_scope.get()
+		if scope is not None and scope.owner is self:
+			scope.rows_loaded += 1
+			self._stats.rows_loaded += 1
+
+	def stats(self) -> InstrumentationStats:
+		"""Return a snapshot of the counters."""
+		return InstrumentationStats(
+			operations={name: stats.copy() for name, stats in self._stats.operations.items()},
+			statements=self._stats.statements,
+			rows_loaded=self._stats.rows_loaded,
+			rows_written=self._stats.rows_written,
+		)
+
+	def reset(self) -> None:
+		"""Reset every counter."""
+		self._stats = InstrumentationStats()
+
+	def prometheus(self, prefix: str = METRIC_PREFIX) -> str:
+		"""
+		Render the counters in the Prometheus text exposition format.
+
+		Args:
+			prefix: Prefix of every metric name
+
+		Returns:
+			The exposition text, ending with a newline
+		"""
+		stats = self._stats
+		operations = sorted(stats.operations.items())
+		lines: list[str] = []
+
+		def family(name: str, kind: str, help_text: str) -> str:
+			metric = f"{prefix}_{name}"
+			lines.append(f"# HELP {metric} {help_text}")
+			lines.append(f"# TYPE {metric} {kind}")
+			return metric
+
+		metric = family("operation_duration_seconds", "histogram", "Latency of RBAC operations.")
+		for name, op in operations:
+			label = _label(name)
+			cumulative = 0
+			for bound, count in zip(LATENCY_BUCKETS, op.buckets, strict=False):
+				cumulative += count
+				lines.append(f'{metric}_bucket{{operation="{label}",le="{bound:g}"}} {cumulative}')
+			lines.append(f'{metric}_bucket{{operation="{label}",le="+Inf"}} {op.calls}')
+			lines.append(f'{metric}_sum{{operation="{label}"}} {op.total_seconds!r}')
+			lines.append(f'{metric}_count{{operation="{label}"}} {op.calls}')
+
+		for attribute, help_text in (
+			("errors", "RBAC operations that failed."),
+			("statements", "SQL statements executed by RBAC operations."),
+			("rows_loaded", "ORM objects loaded by RBAC operations."),
+			("rows_written", "Rows changed by RBAC operations."),
+		):
+			metric = family(f"operation_{attribute}_total", "counter", help_text)
+			for name, op in operations:
+				lines.append(f'{metric}{{operation="{_label(name)}"}} {getattr(op, attribute)}')
+
+		metric = family("statements_total", "counter", "SQL statements executed.")
+		lines.append(f"{metric} {stats.statements}")
+		metric = family("rows_written_total", "counter", "Rows changed by DML statements.")
+		lines.append(f"{metric} {stats.rows_written}")
+		return "\n".join(lines) + "\n"
+
+	def _record(self, name: str, scope: _Scope, elapsed: float) -> None:
+		stats = self._stats.operations.get(name)
+		if stats is None:
+			stats = self._stats.operations[name] = OperationStats()
+		stats.calls += 1
+		stats.errors += scope.failed
+		stats.statements += scope.statements
+		stats.rows_loaded += scope.rows_loaded
+		stats.rows_written += scope.rows_written
+		stats.total_seconds += elapsed
+		stats.buckets[bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+
+def _label(value: str) -> str:
+	"""Escape a Prometheus label value."""
+	return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,99 @@
+"""
+Timing wrappers installed around the use cases of a factory.
+"""
+
+import inspect
+from collections.abc import AsyncIterator
+from functools import cached_property
+from typing import Any
+
+from vexen_rbac.infraestructure.output.instrumentation.metrics import Instrumentation
+
+
+class InstrumentedUseCase:
+	"""
+	Use case decorator measuring every call as one operation.
+
+	A call that raises, or returns a response with `success=False`, is
+	counted as an error. Other attributes are read from the wrapped use case.
+	"""
+
+	def __init__(self, name: str, use_case: Any, instrumentation: Instrumentation):
+		"""
+		Initialize the wrapper.
+
+		Args:
+			name: Operation name (e.g. "roles.get_role")
+			use_case: Use case instance with an async __call__
+			instrumentation: Collector receiving the measurements
+		"""
+		self._name = name
+		self._use_case = use_case
+		self._instrumentation = instrumentation
+
+	@property
+	def wrapped(self) -> Any:
+		"""The original use case."""
+		return self._use_case
+
+	async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+		with self._instrumentation.operation(self._name) as scope:
+			result = await self._use_case(*args, **kwargs)
+			if getattr(result, "success", True) is False:
+				scope.failed = True
+			return result
+
+	def __getattr__(self, name: str) -> Any:
+		return getattr(self._use_case, name)
+
+
+class InstrumentedStreamUseCase(InstrumentedUseCase):
+	"""
+	Use case decorator measuring every iteration of a streaming use case.
+
+	For use cases whose __call__ is an async generator (e.g. IterRoles): the
+	whole iteration, until exhausted, failed or closed, is one operation, and
+	an exception raised while iterating is counted as an error.
+	"""
+
+	def __call__(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+		return self._instrumentation.iterate(self._name, self._use_case(*args, **kwargs))
+
+
+def instrument_factory(factory: Any, prefix: str, instrumentation: Instrumentation) -> list[str]:
+	"""
+	Replace every use case of a factory with an InstrumentedUseCase.
+
+	Use cases are the factory attributes whose __call__ is a coroutine or an
+	async generator function (streaming use cases, wrapped with
+	InstrumentedStreamUseCase), including lazily built ones (which are built
+	here); they are named "<prefix>.<attribute>".
+
+	Args:
+		factory: Use case factory instance (e.g. RoleUseCaseFactory)
+		prefix: Operation name prefix (e.g. "roles")
+		instrumentation: Collector receiving the measurements
+
+	Returns:
+		Names of the instrumented operations
+	"""
+	lazy = [
+		name for name, value in vars(type(factory)).items() if isinstance(value, cached_property)
+	]
+	names = []
+	for attribute in dict.fromkeys([*vars(factory), *lazy]):
+		value = getattr(factory, attribute)
+		if isinstance(value, InstrumentedUseCase):
+			continue
+		if not callable(value):
+			continue
+		if inspect.iscoroutinefunction(type(value).__call__):
+			wrapper = InstrumentedUseCase
+		elif inspect.isasyncgenfunction(type(value).__call__):
+			wrapper = InstrumentedStreamUseCase
+		else:
+			continue
+		name = f"{prefix}.{attribute}"
+		setattr(factory, attribute, wrapper(name, value, instrumentation))
+		names.append(name)
+	return names
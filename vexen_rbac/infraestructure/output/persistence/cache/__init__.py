@@ -0,0 +1,33 @@
+"""
+Opt-in caching decorators for the repository ports.
+"""
+
+from vexen_rbac.infraestructure.output.persistence.cache.cached_permission_group_repository import (
+	CachedPermissionGroupRepository,
+)
+from vexen_rbac.infraestructure.output.persistence.cache.cached_permission_repository import (
+	CachedPermissionRepository,
+)
+from vexen_rbac.infraestructure.output.persistence.cache.cached_role_repository import (
+	CachedRoleRepository,
+)
+from vexen_rbac.infraestructure.output.persistence.cache.cached_user_role_repository import (
+	CachedUserRoleRepository,
+)
+from vexen_rbac.infraestructure.output.persistence.cache.lru_ttl_cache import (
+	CacheStats,
+	LRUTTLCache,
+)
+from vexen_rbac.infraestructure.output.persistence.cache.user_permission_cache import (
+	UserPermissionCache,
+)
+
+__all__ = [
+	"CacheStats",
+	"LRUTTLCache",
+	"CachedRoleRepository",
+	"CachedPermissionRepository",
+	"CachedPermissionGroupRepository",
+	"CachedUserRoleRepository",
+	"UserPermissionCache",
+]
@@ -0,0 +1,124 @@
+"""
+Caching decorator for IPermissionGroupRepositoryPort.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from vexen_rbac.domain.entity import PermissionGroup
+from vexen_rbac.domain.ports import IPermissionGroupRepositoryPort
+from vexen_rbac.infraestructure.output.persistence.cache.cached_repository import (
+	PERMISSION_GROUP_EMBEDDED,
+	CachedRepository,
+)
+from vexen_rbac.infraestructure.output.persistence.cache.lru_ttl_cache import LRUTTLCache
+
+NAMESPACE = "permission_group"
+LIST_TAG = "permission_group:list"
+
+
+def _key_tag(group_id: int) -> str:
+	return f"permission_group:{group_id}"
+
+
+class CachedPermissionGroupRepository(CachedRepository, IPermissionGroupRepositoryPort):
+	"""Read-through cache in front of a permission group repository with write invalidation."""
+
+	def __init__(self, repository: IPermissionGroupRepositoryPort, cache: LRUTTLCache):
+		"""
+		Initialize the decorator.
+
+		Args:
+			repository: Wrapped permission group repository
+			cache: Shared cache instance
+		"""
+		super().__init__(cache)
+		self._repository = repository
+
+	async def get_by_id(self, permission_group_id: int) -> PermissionGroup | None:
+		return await self._cached(
+			(NAMESPACE, "get_by_id", permission_group_id),
+			(NAMESPACE, _key_tag(permission_group_id)),
+			lambda: self._repository.get_by_id(permission_group_id),
+		)
+
+	async def get_many(self, permission_group_ids: list[int]) -> list[PermissionGroup]:
+		return await self._cached_many(
+			permission_group_ids,
+			lambda permission_group_id: (NAMESPACE, "get_by_id", permission_group_id),
+			lambda permission_group_id: (NAMESPACE, _key_tag(permission_group_id)),
+			self._repository.get_many,
+		)
+
+	async def save(self, permission_group: PermissionGroup) -> PermissionGroup:
+		result = await self._repository.save(permission_group)
+		self._invalidate(
+			_key_tag(permission_group.id),
+			_key_tag(result.id),
+			LIST_TAG,
+			PERMISSION_GROUP_EMBEDDED,
+		)
+		return result
+
+	async def create_many(
+		self, permission_groups: list[PermissionGroup]
+	) -> list[PermissionGroup | None]:
+		result = await self._repository.create_many(permission_groups)
+		# Misses are cached as None, and a new row may reuse the ID of a deleted one
+		created = [_key_tag(group.id) for group in result if group is not None]
+		self._invalidate(*created, LIST_TAG)
+		return result
+
+	async def delete(self, permission_group_id: int) -> None:
+		await self._repository.delete(permission_group_id)
+		# Roles embed permission group IDs, so their entries are stale too
+		self._invalidate(_key_tag(permission_group_id), LIST_TAG, PERMISSION_GROUP_EMBEDDED, "role")
+
+	async def add_permissions(self, group_id: int, permission_ids: list[int]) -> list[int]:
+		result = await self._repository.add_permissions(group_id, permission_ids)
+		if result:
+			self._invalidate(_key_tag(group_id), LIST_TAG, PERMISSION_GROUP_EMBEDDED)
+		return result
+
+	async def remove_permissions(self, group_id: int, permission_ids: list[int]) -> list[int]:
+		result = await self._repository.remove_permissions(group_id, permission_ids)
+		if result:
+			self._invalidate(_key_tag(group_id), LIST_TAG, PERMISSION_GROUP_EMBEDDED)
+		return result
+
+	async def count_permissions(self, group_id: int) -> int:
+		return await self._cached(
+			(NAMESPACE, "count_permissions", group_id),
+			(NAMESPACE, _key_tag(group_id)),
+			lambda: self._repository.count_permissions(group_id),
+		)
+
+	async def list_with_counts(self) -> list[tuple[PermissionGroup, int]]:
+		return await self._cached(
+			(NAMESPACE, "list_with_counts"),
+			(NAMESPACE, LIST_TAG),
+			self._repository.list_with_counts,
+		)
+
+	async def list_paginated(self, page: int, page_size: int) -> tuple[list[PermissionGroup], int]:
+		return await self._cached(
+			(NAMESPACE, "list_paginated", page, page_size),
+			(NAMESPACE, LIST_TAG),
+			lambda: self._repository.list_paginated(page, page_size),
+		)
+
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[PermissionGroup], int | None]:
+		return await self._cached(
+			(NAMESPACE, "list_after", after, limit, include_total),
+			(NAMESPACE, LIST_TAG),
+			lambda: self._repository.list_after(after, limit, include_total),
+		)
+
+	def stream(self, chunk_size: int) -> AsyncIterator[list[PermissionGroup]]:
+		# Not cached: streaming is for catalogs too large to keep in memory
+		return self._repository.stream(chunk_size)
+
+	async def list(self) -> list[PermissionGroup]:
+		return await self._cached((NAMESPACE, "list"), (NAMESPACE, LIST_TAG), self._repository.list)
@@ -0,0 +1,102 @@
+"""
+Caching decorator for IPermissionRepositoryPort.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from vexen_rbac.domain.entity import Permission
+from vexen_rbac.domain.ports import IPermissionRepositoryPort
+from vexen_rbac.infraestructure.output.persistence.cache.cached_repository import (
+	PERMISSION_EMBEDDED,
+	CachedRepository,
+)
+from vexen_rbac.infraestructure.output.persistence.cache.lru_ttl_cache import LRUTTLCache
+
+NAMESPACE = "permission"
+LIST_TAG = "permission:list"
+
+
+def _key_tag(permission_id: int | None) -> str:
+	return f"permission:{permission_id}"
+
+
+class CachedPermissionRepository(CachedRepository, IPermissionRepositoryPort):
+	"""Read-through cache in front of a permission repository with write invalidation."""
+
+	def __init__(self, repository: IPermissionRepositoryPort, cache: LRUTTLCache):
+		"""
+		Initialize the decorator.
+
+		Args:
+			repository: Wrapped permission repository
+			cache: Shared cache instance
+		"""
+		super().__init__(cache)
+		self._repository = repository
+
+	async def get_by_id(self, permission_id: int) -> Permission | None:
+		return await self._cached(
+			(NAMESPACE, "get_by_id", permission_id),
+			(NAMESPACE, _key_tag(permission_id)),
+			lambda: self._repository.get_by_id(permission_id),
+		)
+
+	async def get_many(self, permission_ids: list[int]) -> list[Permission]:
+		return await self._cached_many(
+			permission_ids,
+			lambda permission_id: (NAMESPACE, "get_by_id", permission_id),
+			lambda permission_id: (NAMESPACE, _key_tag(permission_id)),
+			self._repository.get_many,
+		)
+
+	async def save(self, permission: Permission) -> Permission:
+		result = await self._repository.save(permission)
+		self._invalidate(
+			_key_tag(permission.id), _key_tag(result.id), LIST_TAG, PERMISSION_EMBEDDED
+		)
+		return result
+
+	async def create_many(self, permissions: list[Permission]) -> list[Permission | None]:
+		result = await self._repository.create_many(permissions)
+		# Misses are cached as None, and a new row may reuse the ID of a deleted one
+		created = [_key_tag(permission.id) for permission in result if permission is not None]
+		self._invalidate(*created, LIST_TAG)
+		return result
+
+	async def delete(self, permission_id: int) -> None:
+		await self._repository.delete(permission_id)
+		# Roles and groups embed permission IDs, so their entries are stale too
+		self._invalidate(
+			_key_tag(permission_id), LIST_TAG, PERMISSION_EMBEDDED, "role", "permission_group"
+		)
+
+	async def group_by_category(self) -> dict[str, list[Permission]]:
+		return await self._cached(
+			(NAMESPACE, "group_by_category"),
+			(NAMESPACE, LIST_TAG),
+			self._repository.group_by_category,
+		)
+
+	async def list_paginated(self, page: int, page_size: int) -> tuple[list[Permission], int]:
+		return await self._cached(
+			(NAMESPACE, "list_paginated", page, page_size),
+			(NAMESPACE, LIST_TAG),
+			lambda: self._repository.list_paginated(page, page_size),
+		)
+
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[Permission], int | None]:
+		return await self._cached(
+			(NAMESPACE, "list_after", after, limit, include_total),
+			(NAMESPACE, LIST_TAG),
+			lambda: self._repository.list_after(after, limit, include_total),
+		)
+
+	def stream(self, chunk_size: int) -> AsyncIterator[list[Permission]]:
+		# Not cached: streaming is for catalogs too large to keep in memory
+		return self._repository.stream(chunk_size)
+
+	async def list(self) -> list[Permission]:
+		return await self._cached((NAMESPACE, "list"), (NAMESPACE, LIST_TAG), self._repository.list)
@@ -0,0 +1,118 @@
+"""
+Shared helpers for the caching repository decorators.
+"""
+
+import copy
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import TypeVar
+
+from vexen_rbac.infraestructure.output.persistence.cache.lru_ttl_cache import (
+	MISSING,
+	LRUTTLCache,
+)
+from vexen_rbac.infraestructure.output.persistence.unit_of_work import active_units_of_work
+
+T = TypeVar("T")
+
+# Tags for entries of other namespaces that embed permission / group / role data
+PERMISSION_EMBEDDED = "permission:embedded"
+PERMISSION_GROUP_EMBEDDED = "permission_group:embedded"
+ROLE_EMBEDDED = "role:embedded"
+
+
+class CachedRepository:
+	"""
+	Base class for repository decorators backed by an LRUTTLCache.
+
+	Cached values are deep-copied on the way out so callers can mutate the
+	returned entities (as the update use cases do) without corrupting the cache.
+
+	Inside a unit of work reads bypass the cache (they must see the
+	transaction's own uncommitted writes), and write invalidations are
+	repeated after the commit so entries reloaded in between are dropped.
+	"""
+
+	def __init__(self, cache: LRUTTLCache):
+		"""
+		Initialize the decorator.
+
+		Args:
+			cache: Cache shared by all decorators of one RBAC instance
+		"""
+		self._cache = cache
+
+	async def _cached(
+		self, key: Hashable, tags: Iterable[str], loader: Callable[[], Awaitable[T]]
+	) -> T:
+		"""
+		Return a cached value or load and cache it.
+
+		Args:
+			key: Cache key
+			tags: Tags used for invalidation
+			loader: Coroutine factory reading from the wrapped repository
+
+		Returns:
+			A private copy of the value
+		"""
+		if active_units_of_work():
+			return await loader()
+
+		value = self._cache.get(key)
+		if value is MISSING:
+			generation = self._cache.generation
+			value = await loader()
+			self._cache.set(key, value, tags, generation=generation)
+		return copy.deepcopy(value)
+
+	async def _cached_many(
+		self,
+		ids: list[int],
+		key: Callable[[int], Hashable],
+		tags: Callable[[int], Iterable[str]],
+		loader: Callable[[list[int]], Awaitable[list[T]]],
+	) -> list[T]:
+		"""
+		Batch counterpart of `_cached` sharing the per-ID entries of `get_by_id`.
+
+		Only the IDs not in the cache are loaded, with a single loader call;
+		IDs the loader does not return are cached as None, like `get_by_id`.
+
+		Args:
+			ids: Requested IDs
+			key: Cache key for one ID
+			tags: Tags for one ID
+			loader: Coroutine factory loading entities (with an `id`) for many IDs
+
+		Returns:
+			Private copies of the entities found, in request order
+		"""
+		if active_units_of_work():
+			return await loader(ids)
+
+		wanted = list(dict.fromkeys(ids))
+		found: dict[int, T] = {}
+		misses: list[int] = []
+		for entity_id in wanted:
+			value = self._cache.get(key(entity_id))
+			if value is MISSING:
+				misses.append(entity_id)
+			elif value is not None:
+				found[entity_id] = value
+
+		if misses:
+			generation = self._cache.generation
+			loaded = {entity.id: entity for entity in await loader(misses)}
+			for entity_id in misses:
+				value = loaded.get(entity_id)
+				self._cache.set(key(entity_id), value, tags(entity_id), generation=generation)
+				if value is not None:
+					found[entity_id] = value
+
+		return copy.deepcopy([found[entity_id] for entity_id in wanted if entity_id in found])
+
+	def _invalidate(self, *tags: str) -> None:
+		"""Drop every entry carrying any of the given tags."""
+		self._cache.invalidate_tags(*tags)
+		for unit_of_work in active_units_of_work():
+			unit_of_work.after_commit(lambda: self._cache.invalidate_tags(*tags))
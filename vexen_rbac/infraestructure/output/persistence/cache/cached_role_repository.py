@@ -0,0 +1,147 @@
+"""
+Caching decorator for IRoleRepositoryPort.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from vexen_rbac.domain.entity import Permission, Role
+from vexen_rbac.domain.ports import IRoleRepositoryPort
+from vexen_rbac.infraestructure.output.persistence.cache.cached_repository import (
+	PERMISSION_EMBEDDED,
+	PERMISSION_GROUP_EMBEDDED,
+	ROLE_EMBEDDED,
+	CachedRepository,
+)
+from vexen_rbac.infraestructure.output.persistence.cache.lru_ttl_cache import LRUTTLCache
+
+NAMESPACE = "role"
+LIST_TAG = "role:list"
+
+
+def _key_tag(role_id: int) -> str:
+	return f"role:{role_id}"
+
+
+def role_users_tag(role_id: int) -> str:
+	"""Tag of the cached user assignments of a role."""
+	return f"role:{role_id}:users"
+
+
+class CachedRoleRepository(CachedRepository, IRoleRepositoryPort):
+	"""Read-through cache in front of a role repository with write invalidation."""
+
+	def __init__(self, repository: IRoleRepositoryPort, cache: LRUTTLCache):
+		"""
+		Initialize the decorator.
+
+		Args:
+			repository: Wrapped role repository
+			cache: Shared cache instance
+		"""
+		super().__init__(cache)
+		self._repository = repository
+
+	async def get_by_id(self, role_id: int) -> Role | None:
+		return await self._cached(
+			(NAMESPACE, "get_by_id", role_id),
+			(NAMESPACE, _key_tag(role_id)),
+			lambda: self._repository.get_by_id(role_id),
+		)
+
+	async def get_many(self, role_ids: list[int]) -> list[Role]:
+		return await self._cached_many(
+			role_ids,
+			lambda role_id: (NAMESPACE, "get_by_id", role_id),
+			lambda role_id: (NAMESPACE, _key_tag(role_id)),
+			self._repository.get_many,
+		)
+
+	async def save(self, role: Role) -> Role:
+		result = await self._repository.save(role)
+		self._invalidate(_key_tag(role.id), _key_tag(result.id), LIST_TAG, ROLE_EMBEDDED)
+		return result
+
+	async def create_many(self, roles: list[Role]) -> list[Role | None]:
+		result = await self._repository.create_many(roles)
+		# Misses are cached as None, and a new row may reuse the ID of a deleted one
+		created = [_key_tag(role.id) for role in result if role is not None]
+		self._invalidate(*created, LIST_TAG)
+		return result
+
+	async def delete(self, role_id: int) -> None:
+		await self._repository.delete(role_id)
+		self._invalidate(_key_tag(role_id), LIST_TAG, ROLE_EMBEDDED, role_users_tag(role_id))
+
+	async def add_permissions(self, role_id: int, permission_ids: list[int]) -> list[int]:
+		result = await self._repository.add_permissions(role_id, permission_ids)
+		if result:
+			self._invalidate(_key_tag(role_id), LIST_TAG)
+		return result
+
+	async def remove_permissions(self, role_id: int, permission_ids: list[int]) -> list[int]:
+		result = await self._repository.remove_permissions(role_id, permission_ids)
+		if result:
+			self._invalidate(_key_tag(role_id), LIST_TAG)
+		return result
+
+	async def count(self) -> int:
+		return await self._cached(
+			(NAMESPACE, "count"), (NAMESPACE, LIST_TAG), self._repository.count
+		)
+
+	async def count_permissions(self, role_id: int) -> int:
+		return await self._cached(
+			(NAMESPACE, "count_permissions", role_id),
+			(NAMESPACE, _key_tag(role_id)),
+			lambda: self._repository.count_permissions(role_id),
+		)
+
+	async def list_with_counts(self) -> list[tuple[Role, int]]:
+		return await self._cached(
+			(NAMESPACE, "list_with_counts"),
+			(NAMESPACE, LIST_TAG),
+			self._repository.list_with_counts,
+		)
+
+	async def list_paginated(self, page: int, page_size: int) -> tuple[list[Role], int]:
+		return await self._cached(
+			(NAMESPACE, "list_paginated", page, page_size),
+			(NAMESPACE, LIST_TAG),
+			lambda: self._repository.list_paginated(page, page_size),
+		)
+
+	async def get_by_id_with_permissions(self, role_id: int) -> tuple[Role, list] | None:
+		return await self._cached(
+			(NAMESPACE, "get_by_id_with_permissions", role_id),
+			(NAMESPACE, _key_tag(role_id), PERMISSION_EMBEDDED),
+			lambda: self._repository.get_by_id_with_permissions(role_id),
+		)
+
+	async def get_effective_permissions(self, role_ids: list[int]) -> list[Permission]:
+		return await self._cached(
+			(NAMESPACE, "get_effective_permissions", tuple(role_ids)),
+			(
+				NAMESPACE,
+				PERMISSION_EMBEDDED,
+				PERMISSION_GROUP_EMBEDDED,
+				*(_key_tag(role_id) for role_id in role_ids),
+			),
+			lambda: self._repository.get_effective_permissions(role_ids),
+		)
+
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[Role], int | None]:
+		return await self._cached(
+			(NAMESPACE, "list_after", after, limit, include_total),
+			(NAMESPACE, LIST_TAG),
+			lambda: self._repository.list_after(after, limit, include_total),
+		)
+
+	def stream(self, chunk_size: int) -> AsyncIterator[list[Role]]:
+		# Not cached: streaming is for catalogs too large to keep in memory
+		return self._repository.stream(chunk_size)
+
+	async def list(self) -> list[Role]:
+		return await self._cached((NAMESPACE, "list"), (NAMESPACE, LIST_TAG), self._repository.list)
@@ -0,0 +1,79 @@
+"""
+Caching decorator for IUserRoleRepositoryPort.
+"""
+
+from vexen_rbac.domain.entity import Role, UserRole
+from vexen_rbac.domain.ports import IUserRoleRepositoryPort
+from vexen_rbac.domain.vo import PermissionSet
+from vexen_rbac.infraestructure.output.persistence.cache.cached_repository import (
+	ROLE_EMBEDDED,
+	CachedRepository,
+)
+from vexen_rbac.infraestructure.output.persistence.cache.cached_role_repository import (
+	LIST_TAG as ROLE_LIST_TAG,
+)
+from vexen_rbac.infraestructure.output.persistence.cache.cached_role_repository import (
+	role_users_tag,
+)
+from vexen_rbac.infraestructure.output.persistence.cache.lru_ttl_cache import LRUTTLCache
+
+NAMESPACE = "user_role"
+
+
+def _user_tag(user_id: str) -> str:
+	return f"user:{user_id}"
+
+
+class CachedUserRoleRepository(CachedRepository, IUserRoleRepositoryPort):
+	"""
+	Read-through cache in front of a user role repository with write invalidation.
+
+	Assignments also invalidate the role lists, whose entries carry user counts.
+	"""
+
+	def __init__(self, repository: IUserRoleRepositoryPort, cache: LRUTTLCache):
+		"""
+		Initialize the decorator.
+
+		Args:
+			repository: Wrapped user role repository
+			cache: Shared cache instance
+		"""
+		super().__init__(cache)
+		self._repository = repository
+
+	async def assign(self, user_id: str, role_ids: list[int]) -> list[int]:
+		result = await self._repository.assign(user_id, role_ids)
+		if result:
+			self._invalidate(
+				_user_tag(user_id), ROLE_LIST_TAG, *(role_users_tag(role_id) for role_id in result)
+			)
+		return result
+
+	async def revoke(self, user_id: str, role_ids: list[int]) -> list[int]:
+		result = await self._repository.revoke(user_id, role_ids)
+		if result:
+			self._invalidate(
+				_user_tag(user_id), ROLE_LIST_TAG, *(role_users_tag(role_id) for role_id in result)
+			)
+		return result
+
+	async def list_user_roles(self, user_id: str) -> list[Role]:
+		return await self._cached(
+			(NAMESPACE, "list_user_roles", user_id),
+			(NAMESPACE, _user_tag(user_id), ROLE_EMBEDDED),
+			lambda: self._repository.list_user_roles(user_id),
+		)
+
+	async def get_permission_set(self, user_id: str) -> PermissionSet:
+		# Cached per user by UserPermissionCache, which sits in front of this decorator
+		return await self._repository.get_permission_set(user_id)
+
+	async def list_role_users(
+		self, role_id: int, page: int, page_size: int
+	) -> tuple[list[UserRole], int]:
+		return await self._cached(
+			(NAMESPACE, "list_role_users", role_id, page, page_size),
+			(NAMESPACE, role_users_tag(role_id)),
+			lambda: self._repository.list_role_users(role_id, page, page_size),
+		)
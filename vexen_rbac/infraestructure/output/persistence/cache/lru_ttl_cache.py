@@ -0,0 +1,200 @@
+"""
+Bounded in-process cache with LRU eviction, TTL expiration and tag invalidation.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+MISSING = object()
+
+
+@dataclass
+class CacheStats:
+	"""
+	Counters describing cache effectiveness.
+
+	Attributes:
+		hits: Lookups answered from the cache
+		misses: Lookups that had to reach the wrapped repository
+		evictions: Entries dropped because the cache was full
+		expirations: Entries dropped because their TTL elapsed
+		invalidations: Entries dropped by writes
+		size: Current number of entries
+		max_size: Maximum number of entries
+	"""
+
+	hits: int = 0
+	misses: int = 0
+	evictions: int = 0
+	expirations: int = 0
+	invalidations: int = 0
+	size: int = 0
+	max_size: int = 0
+
+	@property
+	def hit_ratio(self) -> float:
+		"""Fraction of lookups answered from the cache."""
+		total = self.hits + self.misses
+		return self.hits / total if total else 0.0
+
+	def as_dict(self) -> dict[str, float]:
+		"""Return the counters (and hit ratio) as a plain dict."""
+		return {**asdict(self), "hit_ratio": self.hit_ratio}
+
+
+class LRUTTLCache:
+	"""
+	Least-recently-used cache whose entries also expire after a TTL.
+
+	Entries can carry tags so a write can drop every entry that depends on the
+	changed data (e.g. all list results of an entity) in one call.
+
+	Example:
+		>>> cache = LRUTTLCache(max_size=1024, ttl=60.0)
+		>>> cache.set(("role", 1), role, tags=("role:1", "role"))
+		>>> cache.invalidate_tag("role:1")
+	"""
+
+	def __init__(
+		self,
+		max_size: int = 1024,
+		ttl: float = 60.0,
+		clock: Callable[[], float] = time.monotonic,
+	):
+		"""
+		Initialize an empty cache.
+
+		Args:
+			max_size: Maximum number of entries before LRU eviction
+			ttl: Seconds an entry stays valid
+			clock: Monotonic time source (overridable for tests)
+
+		Raises:
+			ValueError: If max_size or ttl is not positive
+		"""
+		if max_size <= 0:
+			raise ValueError("max_size must be positive")
+		if ttl <= 0:
+			raise ValueError("ttl must be positive")
+
+		self.max_size = max_size
+		self.ttl = ttl
+		self._clock = clock
+		self._entries: OrderedDict[Hashable, tuple[float, Any, tuple[str, ...]]] = OrderedDict()
+		self._tags: dict[str, set[Hashable]] = {}
+		self._stats = CacheStats(max_size=max_size)
+		self._generation = 0
+
+	@property
+	def generation(self) -> int:
+		"""Counter bumped on every invalidation, used to discard racing loads."""
+		return self._generation
+
+	def get(self, key: Hashable) -> Any:
+		"""
+		Look up a key.
+
+		Args:
+			key: Cache key
+
+		Returns:
+			The cached value, or MISSING if absent or expired
+		"""
+		entry = self._entries.get(key)
+		if entry is None:
+			self._stats.misses += 1
+			return MISSING
+
+		expires_at, value, _ = entry
+		if expires_at <= self._clock():
+			self._remove(key)
+			self._stats.expirations += 1
+			self._stats.misses += 1
+			return MISSING
+
+		self._entries.move_to_end(key)
+		self._stats.hits += 1
+		return value
+
+	def set(
+		self,
+		key: Hashable,
+		value: Any,
+		tags: Iterable[str] = (),
+		generation: int | None = None,
+	) -> None:
+		"""
+		Store a value.
+
+		Args:
+			key: Cache key
+			value: Value to store
+			tags: Tags used for group invalidation
+			generation: If given, the value is only stored when no invalidation
+				happened since this generation was read (prevents caching data
+				loaded before a concurrent write)
+		"""
+		if generation is not None and generation != self._generation:
+			return
+
+		if key in self._entries:
+			self._remove(key)
+
+		tags = tuple(tags)
+		self._entries[key] = (self._clock() + self.ttl, value, tags)
+		for tag in tags:
+			self._tags.setdefault(tag, set()).add(key)
+
+		while len(self._entries) > self.max_size:
+			oldest = next(iter(self._entries))
+			self._remove(oldest)
+			self._stats.evictions += 1
+
+	def invalidate(self, key: Hashable) -> None:
+		"""Drop a single key."""
+		self._generation += 1
+		if key in self._entries:
+			self._remove(key)
+			self._stats.invalidations += 1
+
+	def invalidate_tags(self, *tags: str) -> None:
+		"""Drop every entry carrying any of the given tags."""
+		self._generation += 1
+		for tag in tags:
+			for key in list(self._tags.get(tag, ())):
+				self._remove(key)
+				self._stats.invalidations += 1
+
+	def invalidate_tag(self, tag: str) -> None:
+		"""Drop every entry carrying the given tag."""
+		self.invalidate_tags(tag)
+
+	def clear(self) -> None:
+		"""Drop every entry (statistics are kept)."""
+		self._generation += 1
+		self._stats.invalidations += len(self._entries)
+		self._entries.clear()
+		self._tags.clear()
+
+	def stats(self) -> CacheStats:
+		"""Return a snapshot of the cache statistics."""
+		return CacheStats(**{**asdict(self._stats), "size": len(self._entries)})
+
+	def reset_stats(self) -> None:
+		"""Reset hit/miss/eviction counters."""
+		self._stats = CacheStats(max_size=self.max_size)
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def _remove(self, key: Hashable) -> None:
+		_, _, tags = self._entries.pop(key)
+		for tag in tags:
+			keys = self._tags.get(tag)
+			if keys is not None:
+				keys.discard(key)
+				if not keys:
+					del self._tags[tag]
@@ -0,0 +1,115 @@
+"""
+Per-user cache of effective permission sets in front of IUserRoleRepositoryPort.
+"""
+
+from collections.abc import Callable, Hashable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any
+
+from vexen_rbac.domain.entity import Role, UserRole
+from vexen_rbac.domain.ports import IRevisionRepositoryPort, IUserRoleRepositoryPort
+from vexen_rbac.domain.vo import PermissionSet
+from vexen_rbac.infraestructure.output.persistence.cache.lru_ttl_cache import (
+	MISSING,
+	LRUTTLCache,
+)
+from vexen_rbac.infraestructure.output.persistence.unit_of_work import active_units_of_work
+
+
+class UserPermissionCache(IUserRoleRepositoryPort):
+	"""
+	Keep the effective permission sets of recently checked users in memory.
+
+	Sets are immutable and shared, not copied. Assigning or revoking roles
+	drops the user's entry; any other write made through this process
+	(roles, permissions, groups) must call `clear()`. As in the repository
+	cache, reads inside a unit of work bypass it and invalidations are
+	repeated after the commit.
+
+	With a revision repository, every entry records the global revision read
+	before it was loaded and is only served while the revision is unchanged,
+	so writes of other processes are seen on the next check at the cost of
+	one primary-key lookup. The revision read and the load then run inside
+	`consistent_read()`, which must keep both on the primary: a set loaded
+	from a lagging replica would be cached under the new revision. Without
+	a revision repository, entries are served until cleared or expired,
+	which is only safe when something else (the background revision
+	watcher) calls `clear()` on foreign writes.
+	"""
+
+	def __init__(
+		self,
+		repository: IUserRoleRepositoryPort,
+		cache: LRUTTLCache,
+		revisions: IRevisionRepositoryPort | None = None,
+		consistent_read: Callable[[], AbstractAsyncContextManager[Any]] = nullcontext,
+	):
+		"""
+		Initialize the decorator.
+
+		Args:
+			repository: Wrapped user role repository
+			cache: Cache dedicated to permission sets, keyed by user ID
+			revisions: Revision repository used to revalidate entries on every
+				read; None serves entries without revalidation
+			consistent_read: Creates the scope (e.g. a unit of work on the
+				primary) the revision read and the load share
+		"""
+		self._repository = repository
+		self._cache = cache
+		self._revisions = revisions
+		self._consistent_read = consistent_read
+
+	async def get_permission_set(self, user_id: str) -> PermissionSet:
+		if active_units_of_work():
+			return await self._repository.get_permission_set(user_id)
+
+		generation = self._cache.generation
+		if self._revisions is None:
+			entry = self._cache.get(user_id)
+			if entry is not MISSING:
+				return entry[1]
+			permissions = await self._repository.get_permission_set(user_id)
+			self._cache.set(user_id, (None, permissions), generation=generation)
+			return permissions
+
+		async with self._consistent_read():
+			# Read before loading: a set tagged with an older revision is only reloaded
+			revision = await self._revisions.current_revision()
+			entry = self._cache.get(user_id)
+			if entry is not MISSING and entry[0] == revision:
+				return entry[1]
+			permissions = await self._repository.get_permission_set(user_id)
+
+		self._cache.set(user_id, (revision, permissions), generation=generation)
+		return permissions
+
+	async def assign(self, user_id: str, role_ids: list[int]) -> list[int]:
+		result = await self._repository.assign(user_id, role_ids)
+		if result:
+			self._forget(user_id)
+		return result
+
+	async def revoke(self, user_id: str, role_ids: list[int]) -> list[int]:
+		result = await self._repository.revoke(user_id, role_ids)
+		if result:
+			self._forget(user_id)
+		return result
+
+	async def list_user_roles(self, user_id: str) -> list[Role]:
+		return await self._repository.list_user_roles(user_id)
+
+	async def list_role_users(
+		self, role_id: int, page: int, page_size: int
+	) -> tuple[list[UserRole], int]:
+		return await self._repository.list_role_users(role_id, page, page_size)
+
+	def clear(self) -> None:
+		"""Drop every cached permission set."""
+		self._cache.clear()
+
+	def _forget(self, user_id: Hashable) -> None:
+		"""Drop the permission set of one user."""
+		self._cache.invalidate(user_id)
+		for unit_of_work in active_units_of_work():
+			unit_of_work.after_commit(lambda: self._cache.invalidate(user_id))
@@ -0,0 +1,163 @@
+"""
+Cross-process change detection based on the global RBAC revision.
+
+Every write bumps the revision in its own transaction, so a process holding
+RBAC data in memory (repository cache, authorization engine) only needs one
+primary-key lookup to know whether another process changed anything.
+"""
+
+import asyncio
+import inspect
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+from vexen_rbac.domain.ports import IRevisionRepositoryPort
+
+logger = logging.getLogger(__name__)
+
+RevisionListener = Callable[[int], Awaitable[None] | None]
+
+
+class RevisionNotifier(ABC):
+	"""Push source that signals when the revision may have changed."""
+
+	@abstractmethod
+	async def start(self, on_notify: Callable[[], None]) -> None:
+		"""Start calling `on_notify` (from the event loop) on every notification."""
+
+	@abstractmethod
+	async def stop(self) -> None:
+		"""Stop listening and release resources."""
+
+
+class RevisionWatcher:
+	"""
+	Detect revision changes and run listeners when they happen.
+
+	`check()` probes the revision once and can be called at any time (e.g. at
+	the start of each request). `start()` also runs it in a background task
+	every `interval` seconds and, with a notifier, as soon as a notification
+	arrives; polling then only acts as a safety net.
+
+	Example:
+		>>> watcher = RevisionWatcher(revisions, interval=5.0)
+		>>> watcher.add_listener(lambda revision: cache.clear())
+		>>> await watcher.start()
+	"""
+
+	def __init__(
+		self,
+		revisions: IRevisionRepositoryPort,
+		interval: float = 5.0,
+		notifier: RevisionNotifier | None = None,
+	):
+		"""
+		Initialize the watcher.
+
+		Args:
+			revisions: Port answering the current revision
+			interval: Seconds between background probes
+			notifier: Optional push source (e.g. PostgreSQL LISTEN/NOTIFY)
+
+		Raises:
+			ValueError: If interval is not positive
+		"""
+		if interval <= 0:
+			raise ValueError("interval must be positive")
+
+		self._revisions = revisions
+		self._interval = interval
+		self._notifier = notifier
+		self._listeners: list[RevisionListener] = []
+		self._revision: int | None = None
+		self._wakeup = asyncio.Event()
+		self._task: asyncio.Task | None = None
+
+	@property
+	def revision(self) -> int | None:
+		"""Last revision seen, or None before the first check."""
+		return self._revision
+
+	@property
+	def running(self) -> bool:
+		"""Whether the background task is active."""
+		return self._task is not None
+
+	def add_listener(self, listener: RevisionListener) -> None:
+		"""
+		Register a callback run with the new revision after each change.
+
+		Args:
+			listener: Sync or async callable receiving the new revision
+		"""
+		self._listeners.append(listener)
+
+	async def check(self) -> bool:
+		"""
+		Probe the revision and run the listeners if it changed.
+
+		The first check only records the revision.
+
+		Returns:
+			True if the revision changed since the previous check
+		"""
+		revision = await self._revisions.current_revision()
+		previous, self._revision = self._revision, revision
+		if previous is None or revision == previous:
+			return False
+
+		for listener in list(self._listeners):
+			try:
+				result = listener(revision)
+				if inspect.isawaitable(result):
+					await result
+			except Exception:
+				logger.exception("RBAC revision listener failed")
+		return True
+
+	async def start(self) -> None:
+		"""
+		Record the current revision and start watching in the background.
+
+		A failed first probe is logged and retried by the background task
+		(e.g. until migrations create the revision table).
+		"""
+		if self._task is not None:
+			return
+
+		if self._revision is None:
+			try:
+				await self.check()
+			except Exception:
+				logger.exception("RBAC revision check failed")
+		if self._notifier is not None:
+			await self._notifier.start(self._wakeup.set)
+		self._task = asyncio.create_task(self._run())
+
+	async def stop(self) -> None:
+		"""Stop the background task and the notifier."""
+		if self._task is None:
+			return
+
+		self._task.cancel()
+		try:
+			await self._task
+		except asyncio.CancelledError:
+			pass
+		self._task = None
+		if self._notifier is not None:
+			await self._notifier.stop()
+
+	async def _run(self) -> None:
+		while True:
+			try:
+				await asyncio.wait_for(self._wakeup.wait(), self._interval)
+			except TimeoutError:
+				pass
+			self._wakeup.clear()
+			try:
+				await self.check()
+			except Exception:
+				# Keep watching: the next probe may succeed (e.g. after a failover)
+				logger.exception("RBAC revision check failed")
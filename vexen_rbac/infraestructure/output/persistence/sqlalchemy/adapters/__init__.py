@@ -4,12 +4,20 @@ from vexen_rbac.infraestructure.output.persistence.sqlalchemy.adapters.permissio
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.adapters.permission_repository_adapter import (
 	PermissionRepositoryAdapter,
 )
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.adapters.revision_repository_adapter import (  # noqa: E501
+	RevisionRepositoryAdapter,
+)
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.adapters.role_repository_adapter import (
 	RoleRepositoryAdapter,
 )
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.adapters.user_role_repository_adapter import (  # noqa: E501
+	UserRoleRepositoryAdapter,
+)
 
 __all__ = [
 	"RoleRepositoryAdapter",
 	"PermissionRepositoryAdapter",
 	"PermissionGroupRepositoryAdapter",
+	"RevisionRepositoryAdapter",
+	"UserRoleRepositoryAdapter",
 ]
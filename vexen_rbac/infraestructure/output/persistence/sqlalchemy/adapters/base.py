@@ -0,0 +1,76 @@
+"""
+Base class for the port adapters: one session per call, or the active unit of work.
+"""
+
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.replicas import ReplicaRouter
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.unit_of_work import (
+	SQLAlchemyUnitOfWork,
+)
+
+
+class SQLAlchemyRepositoryAdapter:
+	"""Provides the session each adapter method runs its repository call in."""
+
+	def __init__(
+		self,
+		session_factory: async_sessionmaker[AsyncSession],
+		replica_router: ReplicaRouter | None = None,
+		materialize_effective_permissions: bool = False,
+		on_write: Callable[[], None] | None = None,
+	):
+		"""
+		Initialize the adapter.
+
+		Args:
+			session_factory: Session factory of the primary database
+			replica_router: Routes read-only calls made outside a unit of work to
+				read replicas; without it every call uses the primary
+			materialize_effective_permissions: Maintain and read the
+				role_effective_permissions table
+			on_write: Called after every successful write (and again when the
+				enclosing unit of work commits), e.g. to drop derived data
+		"""
+		self._session_factory = session_factory
+		self._replica_router = replica_router
+		self._materialize_effective_permissions = materialize_effective_permissions
+		self._on_write = on_write
+
+	@asynccontextmanager
+	async def _session(self, write: bool = False) -> AsyncIterator[AsyncSession]:
+		"""
+		Yield the session for one repository call.
+
+		Outside a unit of work a new session is opened and committed after the
+		call; reads go to a replica when a replica router is configured. Inside
+		one (read-your-writes), its shared session is used and nothing is committed;
+		writes are wrapped in a SAVEPOINT so a failed call only undoes itself.
+
+		Args:
+			write: Whether the call modifies data
+		"""
+		unit_of_work = SQLAlchemyUnitOfWork.current(self._session_factory)
+
+		if unit_of_work is None and not write and self._replica_router is not None:
+			async with self._replica_router.session() as session:
+				yield session
+		elif unit_of_work is None:
+			async with self._session_factory() as session:
+				yield session
+				await session.commit()
+			if write and self._on_write is not None:
+				self._on_write()
+		elif write:
+			async with unit_of_work.session.begin_nested():
+				yield unit_of_work.session
+			# Set-based statements bypass the identity map; later reads must reload
+			unit_of_work.session.expire_all()
+			if self._on_write is not None:
+				self._on_write()
+				unit_of_work.after_commit(self._on_write)
+		else:
+			yield unit_of_work.session
@@ -1,59 +1,83 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 from vexen_rbac.domain.entity import PermissionGroup
 from vexen_rbac.domain.ports import IPermissionGroupRepositoryPort
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.adapters.base import (
+	SQLAlchemyRepositoryAdapter,
+)
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories import (
 	PermissionGroupRepository,
 )
 
 
-class PermissionGroupRepositoryAdapter(IPermissionGroupRepositoryPort):
-	def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
-		self._session_factory = session_factory
-
+class PermissionGroupRepositoryAdapter(SQLAlchemyRepositoryAdapter, IPermissionGroupRepositoryPort):
 	async def get_by_id(self, permission_group_id: int) -> PermissionGroup | None:
-		async with self._session_factory() as session:
-			repository = PermissionGroupRepository(session)
-			result = await repository.get_by_id(permission_group_id)
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			return await repository.get_by_id(permission_group_id)
+
+	async def get_many(self, permission_group_ids: list[int]) -> list[PermissionGroup]:
+		async with self._session() as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			return await repository.get_many(permission_group_ids)
 
 	async def save(self, permission_group: PermissionGroup) -> PermissionGroup:
-		async with self._session_factory() as session:
-			repository = PermissionGroupRepository(session)
-			result = await repository.save(permission_group)
-			await session.commit()
-			return result
+		async with self._session(write=True) as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			return await repository.save(permission_group)
+
+	async def create_many(
+		self, permission_groups: list[PermissionGroup]
+	) -> list[PermissionGroup | None]:
+		async with self._session(write=True) as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			return await repository.create_many(permission_groups)
 
 	async def delete(self, permission_group_id: int) -> None:
-		async with self._session_factory() as session:
-			repository = PermissionGroupRepository(session)
+		async with self._session(write=True) as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
 			await repository.delete(permission_group_id)
-			await session.commit()
-
-	async def add_permissions(self, group_id: int, permission_ids: list[int]) -> PermissionGroup:
-		async with self._session_factory() as session:
-			repository = PermissionGroupRepository(session)
-			result = await repository.add_permissions(group_id, permission_ids)
-			await session.commit()
-			return result
-
-	async def remove_permissions(self, group_id: int, permission_ids: list[int]) -> PermissionGroup:
-		async with self._session_factory() as session:
-			repository = PermissionGroupRepository(session)
-			result = await repository.remove_permissions(group_id, permission_ids)
-			await session.commit()
-			return result
+
+	async def add_permissions(self, group_id: int, permission_ids: list[int]) -> list[int]:
+		async with self._session(write=True) as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			return await repository.add_permissions(group_id, permission_ids)
+
+	async def remove_permissions(self, group_id: int, permission_ids: list[int]) -> list[int]:
+		async with self._session(write=True) as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			return await repository.remove_permissions(group_id, permission_ids)
 
 	async def count_permissions(self, group_id: int) -> int:
-		async with self._session_factory() as session:
-			repository = PermissionGroupRepository(session)
-			result = await repository.count_permissions(group_id)
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			return await repository.count_permissions(group_id)
+
+	async def list_with_counts(self) -> list[tuple[PermissionGroup, int]]:
+		async with self._session() as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			return await repository.list_with_counts()
+
+	async def list_paginated(self, page: int, page_size: int) -> tuple[list[PermissionGroup], int]:
+		async with self._session() as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			return await repository.list_paginated(page, page_size)
+
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[PermissionGroup], int | None]:
+		async with self._session() as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			return await repository.list_after(after, limit, include_total)
+
+	async def stream(self, chunk_size: int) -> AsyncIterator[list[PermissionGroup]]:
+		async with self._session() as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			async for chunk in repository.stream(chunk_size):
+				yield chunk
 
 	async def list(self) -> list[PermissionGroup]:
-		async with self._session_factory() as session:
-			repository = PermissionGroupRepository(session)
-			result = await repository.list()
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = PermissionGroupRepository(session, self._materialize_effective_permissions)
+			return await repository.list()
@@ -1,46 +1,66 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from collections.abc import AsyncIterator
+from datetime import datetime
 
 from vexen_rbac.domain.entity import Permission
 from vexen_rbac.domain.ports import IPermissionRepositoryPort
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.adapters.base import (
+	SQLAlchemyRepositoryAdapter,
+)
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories import (
 	PermissionRepository,
 )
 
 
-class PermissionRepositoryAdapter(IPermissionRepositoryPort):
-	def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
-		self._session_factory = session_factory
-
+class PermissionRepositoryAdapter(SQLAlchemyRepositoryAdapter, IPermissionRepositoryPort):
 	async def get_by_id(self, permission_id: int) -> Permission | None:
-		async with self._session_factory() as session:
-			repository = PermissionRepository(session)
-			result = await repository.get_by_id(permission_id)
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = PermissionRepository(session, self._materialize_effective_permissions)
+			return await repository.get_by_id(permission_id)
+
+	async def get_many(self, permission_ids: list[int]) -> list[Permission]:
+		async with self._session() as session:
+			repository = PermissionRepository(session, self._materialize_effective_permissions)
+			return await repository.get_many(permission_ids)
 
 	async def save(self, permission: Permission) -> Permission:
-		async with self._session_factory() as session:
-			repository = PermissionRepository(session)
-			result = await repository.save(permission)
-			await session.commit()
-			return result
+		async with self._session(write=True) as session:
+			repository = PermissionRepository(session, self._materialize_effective_permissions)
+			return await repository.save(permission)
+
+	async def create_many(self, permissions: list[Permission]) -> list[Permission | None]:
+		async with self._session(write=True) as session:
+			repository = PermissionRepository(session, self._materialize_effective_permissions)
+			return await repository.create_many(permissions)
 
 	async def delete(self, permission_id: int) -> None:
-		async with self._session_factory() as session:
-			repository = PermissionRepository(session)
+		async with self._session(write=True) as session:
+			repository = PermissionRepository(session, self._materialize_effective_permissions)
 			await repository.delete(permission_id)
-			await session.commit()
 
 	async def group_by_category(self) -> dict[str, list[Permission]]:
-		async with self._session_factory() as session:
-			repository = PermissionRepository(session)
-			result = await repository.group_by_category()
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = PermissionRepository(session, self._materialize_effective_permissions)
+			return await repository.group_by_category()
+
+	async def list_paginated(self, page: int, page_size: int) -> tuple[list[Permission], int]:
+		async with self._session() as session:
+			repository = PermissionRepository(session, self._materialize_effective_permissions)
+			return await repository.list_paginated(page, page_size)
+
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[Permission], int | None]:
+		async with self._session() as session:
+			repository = PermissionRepository(session, self._materialize_effective_permissions)
+			return await repository.list_after(after, limit, include_total)
+
+	async def stream(self, chunk_size: int) -> AsyncIterator[list[Permission]]:
+		async with self._session() as session:
+			repository = PermissionRepository(session, self._materialize_effective_permissions)
+			async for chunk in repository.stream(chunk_size):
+				yield chunk
 
 	async def list(self) -> list[Permission]:
-		async with self._session_factory() as session:
-			repository = PermissionRepository(session)
-			result = await repository.list()
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = PermissionRepository(session, self._materialize_effective_permissions)
+			return await repository.list()
@@ -0,0 +1,14 @@
+from vexen_rbac.domain.ports import IRevisionRepositoryPort
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.adapters.base import (
+	SQLAlchemyRepositoryAdapter,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories import (
+	RevisionRepository,
+)
+
+
+class RevisionRepositoryAdapter(SQLAlchemyRepositoryAdapter, IRevisionRepositoryPort):
+	async def current_revision(self) -> int:
+		async with self._session() as session:
+			repository = RevisionRepository(session)
+			return await repository.current_revision()
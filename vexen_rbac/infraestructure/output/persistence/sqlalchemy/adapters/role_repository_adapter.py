@@ -1,80 +1,96 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-from vexen_rbac.domain.entity import Role
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from vexen_rbac.domain.entity import Permission, Role
 from vexen_rbac.domain.ports import IRoleRepositoryPort
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.adapters.base import (
+	SQLAlchemyRepositoryAdapter,
+)
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories import (
 	RoleRepository,
 )
 
 
-class RoleRepositoryAdapter(IRoleRepositoryPort):
-	def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
-		self._session_factory = session_factory
-
+class RoleRepositoryAdapter(SQLAlchemyRepositoryAdapter, IRoleRepositoryPort):
 	async def get_by_id(self, role_id: int) -> Role | None:
-		async with self._session_factory() as session:
-			repository = RoleRepository(session)
-			result = await repository.get_by_id(role_id)
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.get_by_id(role_id)
+
+	async def get_many(self, role_ids: list[int]) -> list[Role]:
+		async with self._session() as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.get_many(role_ids)
 
 	async def save(self, role: Role) -> Role:
-		async with self._session_factory() as session:
-			repository = RoleRepository(session)
-			result = await repository.save(role)
-			await session.commit()
-			return result
+		async with self._session(write=True) as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.save(role)
+
+	async def create_many(self, roles: list[Role]) -> list[Role | None]:
+		async with self._session(write=True) as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.create_many(roles)
 
 	async def delete(self, role_id: int) -> None:
-		async with self._session_factory() as session:
-			repository = RoleRepository(session)
+		async with self._session(write=True) as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
 			await repository.delete(role_id)
-			await session.commit()
-
-	async def add_permissions(self, role_id: int, permission_ids: list[int]) -> Role:
-		async with self._session_factory() as session:
-			repository = RoleRepository(session)
-			result = await repository.add_permissions(role_id, permission_ids)
-			await session.commit()
-			return result
-
-	async def remove_permissions(self, role_id: int, permission_ids: list[int]) -> Role:
-		async with self._session_factory() as session:
-			repository = RoleRepository(session)
-			result = await repository.remove_permissions(role_id, permission_ids)
-			await session.commit()
-			return result
+
+	async def add_permissions(self, role_id: int, permission_ids: list[int]) -> list[int]:
+		async with self._session(write=True) as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.add_permissions(role_id, permission_ids)
+
+	async def remove_permissions(self, role_id: int, permission_ids: list[int]) -> list[int]:
+		async with self._session(write=True) as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.remove_permissions(role_id, permission_ids)
 
 	async def count(self) -> int:
-		async with self._session_factory() as session:
-			repository = RoleRepository(session)
-			result = await repository.count()
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.count()
 
 	async def count_permissions(self, role_id: int) -> int:
-		async with self._session_factory() as session:
-			repository = RoleRepository(session)
-			result = await repository.count_permissions(role_id)
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.count_permissions(role_id)
+
+	async def list_with_counts(self) -> list[tuple[Role, int]]:
+		async with self._session() as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.list_with_counts()
 
 	async def list_paginated(self, page: int, page_size: int) -> tuple[list[Role], int]:
-		async with self._session_factory() as session:
-			repository = RoleRepository(session)
-			result = await repository.list_paginated(page, page_size)
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.list_paginated(page, page_size)
+
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[Role], int | None]:
+		async with self._session() as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.list_after(after, limit, include_total)
 
 	async def get_by_id_with_permissions(self, role_id: int) -> tuple[Role, list] | None:
-		async with self._session_factory() as session:
-			repository = RoleRepository(session)
-			result = await repository.get_by_id_with_permissions(role_id)
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.get_by_id_with_permissions(role_id)
+
+	async def get_effective_permissions(self, role_ids: list[int]) -> list[Permission]:
+		async with self._session() as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.get_effective_permissions(role_ids)
+
+	async def stream(self, chunk_size: int) -> AsyncIterator[list[Role]]:
+		async with self._session() as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			async for chunk in repository.stream(chunk_size):
+				yield chunk
 
 	async def list(self) -> list[Role]:
-		async with self._session_factory() as session:
-			repository = RoleRepository(session)
-			result = await repository.list()
-			await session.commit()
-			return result
+		async with self._session() as session:
+			repository = RoleRepository(session, self._materialize_effective_permissions)
+			return await repository.list()
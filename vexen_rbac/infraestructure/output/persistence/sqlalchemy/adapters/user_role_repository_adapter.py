@@ -0,0 +1,38 @@
+from vexen_rbac.domain.entity import Role, UserRole
+from vexen_rbac.domain.ports import IUserRoleRepositoryPort
+from vexen_rbac.domain.vo import PermissionSet
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.adapters.base import (
+	SQLAlchemyRepositoryAdapter,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories import (
+	UserRoleRepository,
+)
+
+
+class UserRoleRepositoryAdapter(SQLAlchemyRepositoryAdapter, IUserRoleRepositoryPort):
+	async def assign(self, user_id: str, role_ids: list[int]) -> list[int]:
+		async with self._session(write=True) as session:
+			repository = UserRoleRepository(session)
+			return await repository.assign(user_id, role_ids)
+
+	async def revoke(self, user_id: str, role_ids: list[int]) -> list[int]:
+		async with self._session(write=True) as session:
+			repository = UserRoleRepository(session)
+			return await repository.revoke(user_id, role_ids)
+
+	async def list_user_roles(self, user_id: str) -> list[Role]:
+		async with self._session() as session:
+			repository = UserRoleRepository(session)
+			return await repository.list_user_roles(user_id)
+
+	async def list_role_users(
+		self, role_id: int, page: int, page_size: int
+	) -> tuple[list[UserRole], int]:
+		async with self._session() as session:
+			repository = UserRoleRepository(session)
+			return await repository.list_role_users(role_id, page, page_size)
+
+	async def get_permission_set(self, user_id: str) -> PermissionSet:
+		async with self._session() as session:
+			repository = UserRoleRepository(session, self._materialize_effective_permissions)
+			return await repository.get_permission_set(user_id)
@@ -2,12 +2,20 @@
 Database configuration for SQLAlchemy 2.0 with async sessions.
 """
 
+import hashlib
 import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cache
 from typing import Any
 
+from sqlalchemy import URL, Connection, MetaData, delete, event, insert, make_url, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
+	AsyncConnection,
 	AsyncEngine,
 	AsyncSession,
 	async_sessionmaker,
@@ -59,9 +67,8 @@ class DatabaseConfig:
 			AsyncEngine: SQLAlchemy async engine
 		"""
 		if cls._engine is None:
-			database_url = cls.get_database_url()
-			engine_config = cls.get_engine_config()
-			cls._engine = create_async_engine(database_url, **engine_config)
+			options = EngineOptions(**cls.get_engine_config())
+			cls._engine = build_engine(cls.get_database_url(), options)
 		return cls._engine
 
 	@classmethod
@@ -73,14 +80,7 @@ class DatabaseConfig:
 			async_sessionmaker: Factory for creating async sessions
 		"""
 		if cls._session_factory is None:
-			engine = cls.get_engine()
-			cls._session_factory = async_sessionmaker(
-				engine,
-				class_=AsyncSession,
-				expire_on_commit=False,
-				autocommit=False,
-				autoflush=False,
-			)
+			cls._session_factory = build_session_factory(cls.get_engine())
 		return cls._session_factory
 
 	@classmethod
@@ -92,6 +92,175 @@ class DatabaseConfig:
 			cls._session_factory = None
 
 
+@dataclass(frozen=True)
+class EngineOptions:
+	"""
+	Pool and driver settings of an engine.
+
+	Attributes:
+		echo: Log every SQL statement
+		pool_size: Connections kept open in the pool
+		max_overflow: Extra connections allowed above pool_size
+		pool_recycle: Seconds after which a pooled connection is replaced
+		pool_pre_ping: Test connections on checkout and replace stale ones
+		pool_timeout: Seconds to wait for a free connection before failing
+		statement_cache_size: Prepared statements cached per connection by
+			asyncpg (0 disables it, e.g. behind PgBouncer in transaction mode);
+			None keeps the driver default. Ignored by other drivers.
+	"""
+
+	echo: bool = False
+	pool_size: int = 5
+	max_overflow: int = 10
+	pool_recycle: int = 3600
+	pool_pre_ping: bool = True
+	pool_timeout: float = 30.0
+	statement_cache_size: int | None = None
+
+
+def build_engine(database_url: str | URL, options: EngineOptions) -> AsyncEngine:
+	"""
+	Create an async engine with the given pool settings.
+
+	Args:
+		database_url: Database connection URL
+		options: Pool and driver settings
+
+	Returns:
+		AsyncEngine: New engine (the caller owns it and must dispose it)
+	"""
+	url = make_url(database_url)
+	engine_config: dict[str, Any] = {
+		"echo": options.echo,
+		"pool_pre_ping": options.pool_pre_ping,
+		"pool_recycle": options.pool_recycle,
+	}
+	# In-memory SQLite uses a StaticPool (one shared connection) without sizing
+	if not (url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")):
+		engine_config["pool_size"] = options.pool_size
+		engine_config["max_overflow"] = options.max_overflow
+		engine_config["pool_timeout"] = options.pool_timeout
+	if options.statement_cache_size is not None and url.get_driver_name() == "asyncpg":
+		engine_config["connect_args"] = {
+			"prepared_statement_cache_size": options.statement_cache_size
+		}
+
+	engine = create_async_engine(url, **engine_config)
+	if engine.dialect.name == "sqlite":
+		_enable_sqlite_transactions(engine)
+	return engine
+
+
+def build_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+	"""
+	Create the session factory used by the repository adapters.
+
+	Args:
+		engine: Engine the sessions are bound to
+
+	Returns:
+		async_sessionmaker: Factory for creating async sessions
+	"""
+	return async_sessionmaker(
+		engine,
+		class_=AsyncSession,
+		expire_on_commit=False,
+		autocommit=False,
+		autoflush=False,
+	)
+
+
+@dataclass
+class _RegisteredEngine:
+	engine: AsyncEngine
+	session_factory: async_sessionmaker[AsyncSession]
+	references: int = 0
+
+
+class EngineRegistry:
+	"""
+	Engines keyed by database URL and pool settings, shared by reference count.
+
+	Each RBAC instance acquires its engine here instead of using the global
+	DatabaseConfig singleton, so one process can serve several databases (e.g.
+	one per tenant). Instances configured with the same URL and options share
+	one pool; the engine is disposed when the last of them releases it.
+
+	Example:
+		>>> engine, session_factory = engine_registry.acquire(url, EngineOptions())
+		>>> ...
+		>>> await engine_registry.release(engine)
+	"""
+
+	def __init__(self):
+		"""Initialize an empty registry."""
+		self._engines: dict[tuple[str, EngineOptions], _RegisteredEngine] = {}
+
+	def acquire(
+		self, database_url: str, options: EngineOptions
+	) -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
+		"""
+		Get the engine for a URL and options, creating it on first use.
+
+		Args:
+			database_url: Database connection URL
+			options: Pool and driver settings
+
+		Returns:
+			Tuple of (engine, session factory); call `release` when done
+		"""
+		key = (database_url, options)
+		registered = self._engines.get(key)
+		if registered is None:
+			engine = build_engine(database_url, options)
+			registered = _RegisteredEngine(engine, build_session_factory(engine))
+			self._engines[key] = registered
+		registered.references += 1
+		return registered.engine, registered.session_factory
+
+	async def release(self, engine: AsyncEngine) -> None:
+		"""
+		Give back an engine obtained from `acquire`.
+
+		The engine is disposed once every holder has released it. Unknown
+		engines are ignored.
+
+		Args:
+			engine: Engine returned by `acquire`
+		"""
+		for key, registered in self._engines.items():
+			if registered.engine is engine:
+				registered.references -= 1
+				if registered.references <= 0:
+					del self._engines[key]
+					await engine.dispose()
+				return
+
+	def __len__(self) -> int:
+		return len(self._engines)
+
+
+engine_registry = EngineRegistry()
+
+
+def _enable_sqlite_transactions(engine: AsyncEngine) -> None:
+	"""
+	Let SQLAlchemy emit BEGIN itself on SQLite.
+
+	The sqlite3 driver defers BEGIN until the first write, so a SAVEPOINT opened
+	before any write would start (and RELEASE would commit) its own transaction.
+	Units of work rely on savepoints nested in the outer transaction.
+	"""
+
+	@event.listens_for(engine.sync_engine, "connect")
+	def _disable_driver_transactions(dbapi_connection, connection_record):  # noqa: ANN001
+		dbapi_connection.isolation_level = None
+
+	@event.listens_for(engine.sync_engine, "begin")
+	def _begin(connection):  # noqa: ANN001
+		connection.exec_driver_sql("BEGIN")
+
+
 @asynccontextmanager
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
 	"""
@@ -122,13 +291,145 @@ async def init_db() -> None:
 
 	This should be called at application startup.
 	"""
+	await ensure_schema(DatabaseConfig.get_engine())
+
+
+async def ensure_schema(engine: AsyncEngine) -> bool:
+	"""
+	Create or upgrade the schema only if its recorded version is not current.
+
+	A database stamped with the current version (or a newer one, written by a
+	more recent release) costs a single query.
+
+	Args:
+		engine: Engine of the database to initialize
+
+	Returns:
+		True if the schema was created or upgraded
+	"""
+	if await schema_is_current(engine):
+		return False
+	await create_schema(engine)
+	return True
+
+
+async def schema_is_current(engine: AsyncEngine) -> bool:
+	"""
+	Check the schema version recorded on an engine's database.
+
+	Args:
+		engine: Engine of the database to check
+
+	Returns:
+		True if the recorded version is current or newer, False if it is
+		older, differs from the declared models, or was never recorded
+	"""
 	from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.base import Base
+	from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.schema_version import (
+		SCHEMA_VERSION,
+		SCHEMA_VERSION_ROW_ID,
+		SchemaVersionModel,
+	)
+
+	table = SchemaVersionModel
+	stmt = select(table.version, table.fingerprint).where(table.id == SCHEMA_VERSION_ROW_ID)
+	try:
+		async with engine.connect() as conn:
+			row = (await conn.execute(stmt)).first()
+	except DBAPIError:
+		# The version table does not exist yet
+		return False
 
-	engine = DatabaseConfig.get_engine()
+	if row is None:
+		return False
+	if row.version != SCHEMA_VERSION:
+		return row.version > SCHEMA_VERSION
+	return row.fingerprint == schema_fingerprint(Base.metadata)
+
+
+async def create_schema(engine: AsyncEngine) -> None:
+	"""
+	Create the missing tables and indexes on an engine's database.
+
+	Also records the current schema version, so later `ensure_schema` calls
+	take the single-query path.
+
+	Args:
+		engine: Engine of the database to initialize
+	"""
+	from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.base import Base
+	from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.schema_version import (
+		SCHEMA_VERSION,
+		SCHEMA_VERSION_ROW_ID,
+	)
 
 	async with engine.begin() as conn:
 		# Create all tables
 		await conn.run_sync(Base.metadata.create_all)
+		# create_all skips tables that already exist; add indexes introduced later
+		await conn.run_sync(_create_missing_indexes, Base.metadata)
+		await _record_schema_version(
+			conn,
+			id=SCHEMA_VERSION_ROW_ID,
+			version=SCHEMA_VERSION,
+			fingerprint=schema_fingerprint(Base.metadata),
+			updated_at=datetime.now(),
+		)
+
+
+async def _record_schema_version(conn: AsyncConnection, **values: Any) -> None:
+	"""
+	Write the single schema version row, replacing the one already recorded.
+
+	Workers starting at the same time may all find the schema outdated; an
+	upsert lets each of them write the row without a primary key conflict.
+	"""
+	from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.schema_version import (
+		SchemaVersionModel,
+	)
+
+	dialect = conn.dialect.name
+	if dialect in ("postgresql", "sqlite"):
+		module = postgresql if dialect == "postgresql" else sqlite
+		stmt = module.insert(SchemaVersionModel).values(**values)
+		stmt = stmt.on_conflict_do_update(
+			index_elements=[SchemaVersionModel.id],
+			set_={name: stmt.excluded[name] for name in values if name != "id"},
+		)
+		await conn.execute(stmt)
+		return
+
+	# Other backends have no portable upsert
+	await conn.execute(delete(SchemaVersionModel))
+	await conn.execute(insert(SchemaVersionModel).values(**values))
+
+
+@cache
+def schema_fingerprint(metadata: MetaData) -> str:
+	"""
+	Digest of the tables, columns and indexes declared in a MetaData.
+
+	Args:
+		metadata: Declared schema
+
+	Returns:
+		Hex SHA-256 digest
+	"""
+	lines = []
+	for table in sorted(metadata.tables.values(), key=lambda table: table.name):
+		for column in table.columns:
+			lines.append(f"{table.name}.{column.name} {column.type} {column.nullable}")
+		for index in sorted(table.indexes, key=lambda index: index.name or ""):
+			columns = ",".join(column.name for column in index.columns)
+			lines.append(f"{table.name} index {index.name} ({columns}) {index.unique}")
+	return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+
+def _create_missing_indexes(connection: Connection, metadata: MetaData) -> None:
+	"""Create the declared indexes that are missing from existing tables."""
+	for table in metadata.sorted_tables:
+		for index in table.indexes:
+			index.create(connection, checkfirst=True)
 
 
 async def close_db() -> None:
@@ -0,0 +1,79 @@
+"""
+SQLAlchemy event listeners feeding statement and row counts to an Instrumentation.
+"""
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from vexen_rbac.infraestructure.output.instrumentation import Instrumentation
+
+
+class EngineInstrumentation:
+	"""
+	Report the statements and rows of some engines to an Instrumentation.
+
+	Statements and DML row counts come from the engines' cursor events.
+	Loaded ORM objects are reported by a Session-wide listener; the
+	Instrumentation only counts those loaded inside its own operations.
+
+	Example:
+		>>> listeners = EngineInstrumentation(instrumentation, [engine])
+		>>> listeners.attach()
+		>>> ...
+		>>> listeners.detach()
+	"""
+
+	def __init__(self, instrumentation: Instrumentation, engines: list[AsyncEngine]):
+		"""
+		Initialize the listeners (not yet attached).
+
+		Args:
+			instrumentation: Collector receiving the counts
+			engines: Engines to observe (primary and replicas)
+		"""
+		self._instrumentation = instrumentation
+		self._engines = [engine.sync_engine for engine in engines]
+		self._attached = False
+
+	def attach(self) -> None:
+		"""Start listening."""
+		if self._attached:
+			return
+		for engine in self._engines:
+			event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+			event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+		event.listen(Session, "loaded_as_persistent", self._loaded_as_persistent)
+		self._attached = True
+
+	def detach(self) -> None:
+		"""Stop listening."""
+		if not self._attached:
+			return
+		for engine in self._engines:
+			event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+			event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+		event.remove(Session, "loaded_as_persistent", self._loaded_as_persistent)
+		self._attached = False
+
+	def _before_cursor_execute(self, *args: Any) -> None:
+		self._instrumentation.on_statement()
+
+	def _after_cursor_execute(
+		self,
+		conn: Any,
+		cursor: Any,
+		statement: str,
+		parameters: Any,
+		context: Any,
+		executemany: bool,
+	) -> None:
+		if context is None or not (context.isinsert or context.isupdate or context.isdelete):
+			return
+		if cursor.rowcount > 0:
+			self._instrumentation.on_rows_written(cursor.rowcount)
+
+	def _loaded_as_persistent(self, session: Session, instance: Any) -> None:
+		self._instrumentation.on_row_loaded()
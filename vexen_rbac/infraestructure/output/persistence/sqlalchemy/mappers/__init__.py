@@ -11,5 +11,8 @@ from vexen_rbac.infraestructure.output.persistence.sqlalchemy.mappers.permission
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.mappers.role_mapper import (
 	RoleMapper,
 )
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.mappers.user_role_mapper import (
+	UserRoleMapper,
+)
 
-__all__ = ["RoleMapper", "PermissionMapper", "PermissionGroupMapper"]
+__all__ = ["RoleMapper", "PermissionMapper", "PermissionGroupMapper", "UserRoleMapper"]
@@ -5,6 +5,8 @@ Mappers are pure functions that only convert between domain entities
 and ORM models. They should NOT contain any database logic.
 """
 
+from typing import Any
+
 from vexen_rbac.domain.entity.permission_group import PermissionGroup
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission_group import (
 	PermissionGroupModel,
@@ -20,7 +22,8 @@ class PermissionGroupMapper:
 		Convert PermissionGroupModel to PermissionGroup entity.
 
 		Args:
-			model: SQLAlchemy model instance (should be loaded with permissions)
+			model: SQLAlchemy model instance (permissions must be eager-loaded, at least
+				their IDs)
 
 		Returns:
 			PermissionGroup: Domain entity
@@ -61,6 +64,27 @@ class PermissionGroupMapper:
 			order=entity.order,
 		)
 
+	@staticmethod
+	def to_row(entity: PermissionGroup) -> dict[str, Any]:
+		"""
+		Convert PermissionGroup entity to column values for a bulk INSERT.
+
+		The ID is left to the database and created_at to the column default.
+
+		Args:
+			entity: Domain entity
+
+		Returns:
+			dict: Column values keyed by attribute name
+		"""
+		return {
+			"name": entity.name,
+			"display_name": entity.display_name,
+			"description": entity.description,
+			"icon": entity.icon,
+			"order": entity.order,
+		}
+
 	@staticmethod
 	def update_model_from_entity(
 		model: PermissionGroupModel, entity: PermissionGroup
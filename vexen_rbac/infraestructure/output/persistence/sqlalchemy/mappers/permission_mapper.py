@@ -5,6 +5,8 @@ Mappers are pure functions that only convert between domain entities
 and ORM models. They should NOT contain any database logic.
 """
 
+from typing import Any
+
 from vexen_rbac.domain.entity.permission import Permission
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission import (
 	PermissionModel,
@@ -53,6 +55,26 @@ class PermissionMapper:
 			category=entity.category,
 		)
 
+	@staticmethod
+	def to_row(entity: Permission) -> dict[str, Any]:
+		"""
+		Convert Permission entity to column values for a bulk INSERT.
+
+		The ID is left to the database and created_at to the column default.
+
+		Args:
+			entity: Domain entity
+
+		Returns:
+			dict: Column values keyed by attribute name
+		"""
+		return {
+			"name": entity.name,
+			"display_name": entity.display_name,
+			"description": entity.description,
+			"category": entity.category,
+		}
+
 	@staticmethod
 	def update_model_from_entity(model: PermissionModel, entity: Permission) -> PermissionModel:
 		"""
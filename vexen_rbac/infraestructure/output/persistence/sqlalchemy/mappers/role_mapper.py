@@ -5,6 +5,8 @@ Mappers are pure functions that only convert between domain entities
 and ORM models. They should NOT contain any database logic.
 """
 
+from typing import Any
+
 from vexen_rbac.domain.entity.role import Role
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.role import RoleModel
 
@@ -13,12 +15,15 @@ class RoleMapper:
 	"""Converts between Role entity and RoleModel."""
 
 	@staticmethod
-	def to_entity(model: RoleModel) -> Role:
+	def to_entity(model: RoleModel, user_count: int = 0) -> Role:
 		"""
 		Convert RoleModel to Role entity.
 
 		Args:
-			model: SQLAlchemy model instance (should be loaded with relationships)
+			model: SQLAlchemy model instance (permissions and permission_groups must be
+				eager-loaded, at least their IDs)
+			user_count: Number of users assigned to the role, when the caller
+				aggregated it (it is not a column of the model)
 
 		Returns:
 			Role: Domain entity
@@ -33,7 +38,7 @@ class RoleMapper:
 			description=model.description,
 			permissions=permission_ids,
 			permission_groups=permission_group_ids,
-			user_count=0,  # This is calculated, not persisted
+			user_count=user_count,
 			created_at=model.created_at,
 			updated_at=model.updated_at,
 		)
@@ -59,6 +64,25 @@ class RoleMapper:
 			description=entity.description,
 		)
 
+	@staticmethod
+	def to_row(entity: Role) -> dict[str, Any]:
+		"""
+		Convert Role entity to column values for a bulk INSERT.
+
+		The ID is left to the database and created_at to the column default.
+
+		Args:
+			entity: Domain entity
+
+		Returns:
+			dict: Column values keyed by attribute name
+		"""
+		return {
+			"name": entity.name,
+			"display_name": entity.display_name,
+			"description": entity.description,
+		}
+
 	@staticmethod
 	def update_model_from_entity(model: RoleModel, entity: Role) -> RoleModel:
 		"""
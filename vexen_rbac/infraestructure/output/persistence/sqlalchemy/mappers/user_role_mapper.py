@@ -0,0 +1,32 @@
+"""
+Mapper for UserRole entity and UserRoleAssociation.
+
+Mappers are pure functions that only convert between domain entities
+and ORM models. They should NOT contain any database logic.
+"""
+
+from vexen_rbac.domain.entity.user_role import UserRole
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.associations import (
+	UserRoleAssociation,
+)
+
+
+class UserRoleMapper:
+	"""Converts between UserRole entity and UserRoleAssociation."""
+
+	@staticmethod
+	def to_entity(model: UserRoleAssociation) -> UserRole:
+		"""
+		Convert UserRoleAssociation to UserRole entity.
+
+		Args:
+			model: SQLAlchemy model instance
+
+		Returns:
+			UserRole: Domain entity
+		"""
+		return UserRole(
+			user_id=model.user_id,
+			role_id=model.role_id,
+			assigned_at=model.assigned_at,
+		)
@@ -6,6 +6,7 @@ from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.association
 	PermissionGroupPermissionAssociation,
 	RolePermissionAssociation,
 	RolePermissionGroupAssociation,
+	UserRoleAssociation,
 )
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.base import Base
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission import (
@@ -14,7 +15,14 @@ from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission_group import (
 	PermissionGroupModel,
 )
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.revision import RevisionModel
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.role import RoleModel
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.role_effective_permission import (  # noqa: E501
+	RoleEffectivePermissionModel,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.schema_version import (
+	SchemaVersionModel,
+)
 
 __all__ = [
 	"Base",
@@ -24,4 +32,8 @@ __all__ = [
 	"RolePermissionAssociation",
 	"RolePermissionGroupAssociation",
 	"PermissionGroupPermissionAssociation",
+	"UserRoleAssociation",
+	"RoleEffectivePermissionModel",
+	"RevisionModel",
+	"SchemaVersionModel",
 ]
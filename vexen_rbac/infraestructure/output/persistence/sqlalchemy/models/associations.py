@@ -5,7 +5,9 @@ These are declarative models instead of Table objects for better
 type safety and potential future extension.
 """
 
-from sqlalchemy import ForeignKey
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.base import Base
 
@@ -18,6 +20,10 @@ class RolePermissionAssociation(Base):
 	"""
 
 	__tablename__ = "role_m2m_permissions"
+	# The primary key serves role → permissions; this covers permission → roles
+	__table_args__ = (
+		Index("ix_role_m2m_permissions_permission_id_role_id", "permission_id", "role_id"),
+	)
 
 	role_id: Mapped[int] = mapped_column(
 		ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True
@@ -38,6 +44,10 @@ class RolePermissionGroupAssociation(Base):
 	"""
 
 	__tablename__ = "role_m2m_permission_groups"
+	# The primary key serves role → groups; this covers group → roles
+	__table_args__ = (
+		Index("ix_role_m2m_permission_groups_group_id_role_id", "permission_group_id", "role_id"),
+	)
 
 	role_id: Mapped[int] = mapped_column(
 		ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True
@@ -62,6 +72,14 @@ class PermissionGroupPermissionAssociation(Base):
 	"""
 
 	__tablename__ = "permission_m2m_group_permissions"
+	# The primary key serves group → permissions; this covers permission → groups
+	__table_args__ = (
+		Index(
+			"ix_permission_m2m_group_permissions_permission_id_group_id",
+			"permission_id",
+			"permission_group_id",
+		),
+	)
 
 	permission_group_id: Mapped[int] = mapped_column(
 		ForeignKey("permission_groups.id", ondelete="CASCADE"), primary_key=True
@@ -76,3 +94,26 @@ class PermissionGroupPermissionAssociation(Base):
 			f"permission_group_id={self.permission_group_id}, "
 			f"permission_id={self.permission_id})>"
 		)
+
+
+class UserRoleAssociation(Base):
+	"""
+	Association model for user ↔ Role assignments.
+
+	Users live outside this library, so `user_id` is an opaque identifier
+	(e.g. a UUID or the primary key of the caller's users table).
+	"""
+
+	__tablename__ = "user_roles"
+	# The primary key serves user → roles; this covers role → users and the
+	# per-role user counts
+	__table_args__ = (Index("ix_user_roles_role_id_user_id", "role_id", "user_id"),)
+
+	user_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+	role_id: Mapped[int] = mapped_column(
+		ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True
+	)
+	assigned_at: Mapped[datetime] = mapped_column(default=datetime.now, nullable=False)
+
+	def __repr__(self) -> str:
+		return f"<UserRole(user_id={self.user_id}, role_id={self.role_id})>"
@@ -5,7 +5,7 @@ SQLAlchemy model for Permission entity.
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Text
+from sqlalchemy import Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.associations import (
 	PermissionGroupPermissionAssociation,
@@ -31,6 +31,12 @@ class PermissionModel(Base):
 	"""
 
 	__tablename__ = "permissions"
+	__table_args__ = (
+		# group_by_category: filter/order by category, then name
+		Index("ix_permissions_category_name", "category", "name"),
+		# Keyset pagination: newest first
+		Index("ix_permissions_created_at_id", "created_at", "id"),
+	)
 
 	id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 	name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
@@ -39,18 +45,19 @@ class PermissionModel(Base):
 	category: Mapped[str] = mapped_column(String(50), default="general", nullable=False)
 	created_at: Mapped[datetime] = mapped_column(default=datetime.now, nullable=False)
 
-	# Relationships using declarative association models
+	# Relationships using declarative association models.
+	# Never loaded implicitly: repositories opt in with explicit loader options.
 	roles: Mapped[list["RoleModel"]] = relationship(
 		"RoleModel",
 		secondary=RolePermissionAssociation.__table__,
 		back_populates="permissions",
-		lazy="selectin",
+		lazy="raise",
 	)
 	permission_groups: Mapped[list["PermissionGroupModel"]] = relationship(
 		"PermissionGroupModel",
 		secondary=PermissionGroupPermissionAssociation.__table__,
 		back_populates="permissions",
-		lazy="selectin",
+		lazy="raise",
 	)
 
 	def __repr__(self) -> str:
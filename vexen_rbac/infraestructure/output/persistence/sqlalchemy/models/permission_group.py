@@ -5,7 +5,7 @@ SQLAlchemy model for PermissionGroup entity.
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, String, Text
+from sqlalchemy import Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.associations import (
 	PermissionGroupPermissionAssociation,
@@ -31,6 +31,8 @@ class PermissionGroupModel(Base):
 	"""
 
 	__tablename__ = "permission_groups"
+	# Offset and keyset pagination: newest first
+	__table_args__ = (Index("ix_permission_groups_created_at_id", "created_at", "id"),)
 
 	id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 	name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
@@ -40,18 +42,19 @@ class PermissionGroupModel(Base):
 	order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 	created_at: Mapped[datetime] = mapped_column(default=datetime.now, nullable=False)
 
-	# Relationships using declarative association models
+	# Relationships using declarative association models.
+	# Never loaded implicitly: repositories opt in with explicit loader options.
 	permissions: Mapped[list["PermissionModel"]] = relationship(
 		"PermissionModel",
 		secondary=PermissionGroupPermissionAssociation.__table__,
 		back_populates="permission_groups",
-		lazy="selectin",
+		lazy="raise",
 	)
 	roles: Mapped[list["RoleModel"]] = relationship(
 		"RoleModel",
 		secondary=RolePermissionGroupAssociation.__table__,
 		back_populates="permission_groups",
-		lazy="selectin",
+		lazy="raise",
 	)
 
 	def __repr__(self) -> str:
@@ -0,0 +1,31 @@
+"""
+SQLAlchemy model for the global RBAC revision counter.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.base import Base
+
+# The table holds a single row with this ID
+REVISION_ROW_ID = 1
+
+
+class RevisionModel(Base):
+	"""
+	Counter bumped by every write to the RBAC tables, in the writing transaction.
+
+	Processes holding RBAC data in memory compare it with the revision they
+	loaded to know whether they must refresh.
+	"""
+
+	__tablename__ = "rbac_revision"
+
+	id: Mapped[int] = mapped_column(primary_key=True, default=REVISION_ROW_ID)
+	revision: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+	updated_at: Mapped[datetime] = mapped_column(default=datetime.now, nullable=False)
+
+	def __repr__(self) -> str:
+		return f"<Revision(revision={self.revision})>"
@@ -5,7 +5,7 @@ SQLAlchemy model for Role entity.
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Text
+from sqlalchemy import Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.associations import (
 	RolePermissionAssociation,
@@ -31,6 +31,8 @@ class RoleModel(Base):
 	"""
 
 	__tablename__ = "roles"
+	# Offset and keyset pagination: newest first
+	__table_args__ = (Index("ix_roles_created_at_id", "created_at", "id"),)
 
 	id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 	name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
@@ -41,18 +43,19 @@ class RoleModel(Base):
 		default=datetime.now, onupdate=datetime.now, nullable=True
 	)
 
-	# Relationships using declarative association models
+	# Relationships using declarative association models.
+	# Never loaded implicitly: repositories opt in with explicit loader options.
 	permissions: Mapped[list["PermissionModel"]] = relationship(
 		"PermissionModel",
 		secondary=RolePermissionAssociation.__table__,
 		back_populates="roles",
-		lazy="selectin",
+		lazy="raise",
 	)
 	permission_groups: Mapped[list["PermissionGroupModel"]] = relationship(
 		"PermissionGroupModel",
 		secondary=RolePermissionGroupAssociation.__table__,
 		back_populates="roles",
-		lazy="selectin",
+		lazy="raise",
 	)
 
 	def __repr__(self) -> str:
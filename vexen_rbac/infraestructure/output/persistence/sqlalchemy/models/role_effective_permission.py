@@ -0,0 +1,41 @@
+"""
+SQLAlchemy model for the materialized effective permissions of each role.
+"""
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.base import Base
+
+# `source` value of a permission granted directly to the role
+DIRECT_SOURCE = 0
+
+
+class RoleEffectivePermissionModel(Base):
+	"""
+	One row per (role, permission, source) grant.
+
+	Derived from the association tables and only maintained when
+	`materialize_effective_permissions` is enabled. `source` is DIRECT_SOURCE
+	for a direct grant, or the ID of the permission group the permission is
+	inherited from, so removing one path never drops a grant still held
+	through another.
+	"""
+
+	__tablename__ = "role_effective_permissions"
+	# The primary key serves role → permissions; this covers group maintenance
+	__table_args__ = (Index("ix_role_effective_permissions_source", "source"),)
+
+	role_id: Mapped[int] = mapped_column(
+		ForeignKey("roles.id", ondelete="CASCADE"), primary_key=True
+	)
+	permission_id: Mapped[int] = mapped_column(
+		ForeignKey("permissions.id", ondelete="CASCADE"), primary_key=True
+	)
+	source: Mapped[int] = mapped_column(primary_key=True)
+
+	def __repr__(self) -> str:
+		return (
+			f"<RoleEffectivePermission(role_id={self.role_id}, "
+			f"permission_id={self.permission_id}, source={self.source})>"
+		)
@@ -0,0 +1,35 @@
+"""
+SQLAlchemy model recording which version of the schema a database has.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.base import Base
+
+# Bump whenever a table, column or index is added to (or changed in) the models
+SCHEMA_VERSION = 2
+
+# The table holds a single row with this ID
+SCHEMA_VERSION_ROW_ID = 1
+
+
+class SchemaVersionModel(Base):
+	"""
+	Version of the schema last created or upgraded on this database.
+
+	`fingerprint` digests the declared tables, columns and indexes, so a model
+	change is detected even if SCHEMA_VERSION was not bumped.
+	"""
+
+	__tablename__ = "rbac_schema_version"
+
+	id: Mapped[int] = mapped_column(primary_key=True, default=SCHEMA_VERSION_ROW_ID)
+	version: Mapped[int] = mapped_column(nullable=False)
+	fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+	updated_at: Mapped[datetime] = mapped_column(default=datetime.now, nullable=False)
+
+	def __repr__(self) -> str:
+		return f"<SchemaVersion(version={self.version})>"
@@ -0,0 +1,117 @@
+"""
+Read replica routing: round-robin over healthy replicas, falling back to the primary.
+"""
+
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+# Errors raised when a replica cannot be reached
+CONNECTION_ERRORS = (DBAPIError, OSError)
+
+
+class ReplicaRouter:
+	"""
+	Choose the session factory serving each read-only repository call.
+
+	Replicas are used in round-robin order. A replica whose connection fails
+	is skipped for `retry_after` seconds and the next one (or the primary, if
+	none is left) serves the call instead. Writes and calls inside a unit of
+	work never reach the router: they stay on the primary.
+
+	Example:
+		>>> router = ReplicaRouter(primary_factory, [replica_a, replica_b])
+		>>> async with router.session() as session:
+		...     roles = await RoleRepository(session).list()
+	"""
+
+	def __init__(
+		self,
+		primary: async_sessionmaker[AsyncSession],
+		replicas: list[async_sessionmaker[AsyncSession]],
+		retry_after: float = 30.0,
+		clock: Callable[[], float] = time.monotonic,
+	):
+		"""
+		Initialize the router.
+
+		Args:
+			primary: Session factory of the primary database (fallback)
+			replicas: Session factories of the read replicas
+			retry_after: Seconds a failed replica is skipped before being retried
+			clock: Monotonic time source (overridable for tests)
+		"""
+		self._primary = primary
+		self._replicas = list(replicas)
+		self._retry_after = retry_after
+		self._clock = clock
+		self._down_until: dict[int, float] = {}
+		self._next = 0
+
+	@property
+	def healthy_replicas(self) -> int:
+		"""Number of replicas currently eligible for reads."""
+		now = self._clock()
+		return sum(1 for index in range(len(self._replicas)) if self._is_up(index, now))
+
+	def candidates(self) -> list[async_sessionmaker[AsyncSession]]:
+		"""
+		Return the session factories to try for the next read, in order.
+
+		Healthy replicas come first, starting after the one used last; the
+		primary is always last.
+		"""
+		now = self._clock()
+		count = len(self._replicas)
+		start = self._next
+		self._next = (self._next + 1) % count if count else 0
+
+		indexes = [(start + offset) % count for offset in range(count)]
+		healthy = [self._replicas[index] for index in indexes if self._is_up(index, now)]
+		return [*healthy, self._primary]
+
+	def mark_down(self, factory: async_sessionmaker[AsyncSession]) -> None:
+		"""Skip a replica until its retry delay has elapsed."""
+		if factory in self._replicas:
+			self._down_until[self._replicas.index(factory)] = self._clock() + self._retry_after
+
+	@asynccontextmanager
+	async def session(self) -> AsyncIterator[AsyncSession]:
+		"""
+		Yield a session connected to a healthy replica, or to the primary.
+
+		The connection is checked out before yielding, so an unreachable
+		replica is detected (and skipped) before the call runs. A replica that
+		drops the connection during the call is marked down and the error
+		propagates.
+		"""
+		for factory in self.candidates():
+			session = factory()
+			try:
+				if factory is not self._primary:
+					try:
+						await session.connection()
+					except CONNECTION_ERRORS:
+						self.mark_down(factory)
+						continue
+				try:
+					yield session
+				except DBAPIError as error:
+					if error.connection_invalidated:
+						self.mark_down(factory)
+					raise
+				return
+			finally:
+				await session.close()
+
+	def _is_up(self, index: int, now: float) -> bool:
+		down_until = self._down_until.get(index)
+		if down_until is None:
+			return True
+		if down_until <= now:
+			del self._down_until[index]
+			return True
+		return False
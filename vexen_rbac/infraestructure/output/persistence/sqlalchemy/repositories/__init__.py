@@ -8,8 +8,20 @@ from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.permi
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.permission_repository import (
 	PermissionRepository,
 )
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.revision_repository import (  # noqa: E501
+	RevisionRepository,
+)
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.role_repository import (
 	RoleRepository,
 )
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.user_role_repository import (  # noqa: E501
+	UserRoleRepository,
+)
 
-__all__ = ["RoleRepository", "PermissionRepository", "PermissionGroupRepository"]
+__all__ = [
+	"RoleRepository",
+	"PermissionRepository",
+	"PermissionGroupRepository",
+	"RevisionRepository",
+	"UserRoleRepository",
+]
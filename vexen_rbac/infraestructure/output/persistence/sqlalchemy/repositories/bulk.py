@@ -0,0 +1,166 @@
+"""
+Shared helpers for bulk (multi-row) repository operations.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from sqlalchemy import delete, exists, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.sql.dml import Insert
+
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission import (
+	PermissionModel,
+)
+
+# Bound parameters per IN (...) clause, well below SQLite and asyncpg limits
+IN_CHUNK_SIZE = 1_000
+
+
+async def existing_values(session: AsyncSession, column: Any, values: Iterable[Any]) -> set[Any]:
+	"""
+	Return which of the given values already exist in a column.
+
+	Args:
+		session: Active session
+		column: Mapped column to look in (e.g. PermissionModel.name)
+		values: Candidate values
+
+	Returns:
+		Subset of values present in the column
+	"""
+	candidates = list(dict.fromkeys(values))
+	found: set[Any] = set()
+	for start in range(0, len(candidates), IN_CHUNK_SIZE):
+		chunk = candidates[start : start + IN_CHUNK_SIZE]
+		result = await session.execute(select(column).where(column.in_(chunk)))
+		found.update(result.scalars().all())
+	return found
+
+
+async def models_by_ids(
+	session: AsyncSession,
+	model: Any,
+	ids: Iterable[int],
+	options: Sequence[LoaderOption] = (),
+) -> list[Any]:
+	"""
+	Load many rows by primary key with WHERE id IN (...) queries.
+
+	Args:
+		session: Active session
+		model: Mapped class to load (e.g. RoleModel)
+		ids: Primary keys to load
+		options: Loader options applied to every query
+
+	Returns:
+		Models found, in the order of the (deduplicated) IDs; missing IDs are skipped
+	"""
+	wanted = list(dict.fromkeys(ids))
+	found: dict[int, Any] = {}
+	for start in range(0, len(wanted), IN_CHUNK_SIZE):
+		chunk = wanted[start : start + IN_CHUNK_SIZE]
+		result = await session.execute(select(model).where(model.id.in_(chunk)).options(*options))
+		found.update((row.id, row) for row in result.scalars().all())
+	return [found[model_id] for model_id in wanted if model_id in found]
+
+
+async def link_permissions(
+	session: AsyncSession,
+	owner_model: Any,
+	owner_column: Any,
+	association_permission_column: Any,
+	owner_id: int,
+	permission_ids: Iterable[int],
+) -> list[int]:
+	"""
+	Link permissions to an owner row with set-based INSERT ... SELECT statements.
+
+	Only pairs whose owner and permission exist and are not linked yet are
+	inserted (ON CONFLICT DO NOTHING also covers concurrent grants), so the
+	whole batch costs one round trip per IN_CHUNK_SIZE IDs.
+
+	Args:
+		session: Active session
+		owner_model: Model owning the link (e.g. RoleModel)
+		owner_column: Owner foreign key of the association (e.g. RolePermissionAssociation.role_id)
+		association_permission_column: Permission foreign key of the association
+		owner_id: ID of the owner row
+		permission_ids: IDs of the permissions to link
+
+	Returns:
+		IDs of the permissions that were actually linked, in input order
+	"""
+	candidates = list(dict.fromkeys(permission_ids))
+	association = owner_column.class_
+	linked: set[int] = set()
+
+	for start in range(0, len(candidates), IN_CHUNK_SIZE):
+		chunk = candidates[start : start + IN_CHUNK_SIZE]
+		already_linked = exists().where(
+			owner_column == owner_id, association_permission_column == PermissionModel.id
+		)
+		rows = (
+			select(owner_model.id, PermissionModel.id)
+			.join(PermissionModel, PermissionModel.id.in_(chunk))
+			.where(owner_model.id == owner_id, ~already_linked)
+		)
+		stmt = (
+			insert_ignoring_conflicts(session, association)
+			.from_select([owner_column, association_permission_column], rows)
+			.returning(association_permission_column)
+		)
+		result = await session.execute(stmt)
+		linked.update(result.scalars().all())
+
+	return [permission_id for permission_id in candidates if permission_id in linked]
+
+
+async def unlink_permissions(
+	session: AsyncSession,
+	owner_column: Any,
+	association_permission_column: Any,
+	owner_id: int,
+	permission_ids: Iterable[int],
+) -> list[int]:
+	"""
+	Unlink permissions from an owner row with DELETE ... WHERE permission_id IN (...).
+
+	Args:
+		session: Active session
+		owner_column: Owner foreign key of the association (e.g. RolePermissionAssociation.role_id)
+		association_permission_column: Permission foreign key of the association
+		owner_id: ID of the owner row
+		permission_ids: IDs of the permissions to unlink
+
+	Returns:
+		IDs of the permissions that were actually unlinked, in input order
+	"""
+	candidates = list(dict.fromkeys(permission_ids))
+	association = owner_column.class_
+	unlinked: set[int] = set()
+
+	for start in range(0, len(candidates), IN_CHUNK_SIZE):
+		chunk = candidates[start : start + IN_CHUNK_SIZE]
+		stmt = (
+			delete(association)
+			.where(owner_column == owner_id, association_permission_column.in_(chunk))
+			.returning(association_permission_column)
+		)
+		result = await session.execute(stmt)
+		unlinked.update(result.scalars().all())
+
+	return [permission_id for permission_id in candidates if permission_id in unlinked]
+
+
+def insert_ignoring_conflicts(session: AsyncSession, model: Any) -> Insert:
+	"""Build an INSERT that skips rows violating the primary key of the table."""
+	dialect = session.get_bind().dialect.name
+	if dialect == "postgresql":
+		return postgresql.insert(model).on_conflict_do_nothing()
+	if dialect == "sqlite":
+		return sqlite.insert(model).on_conflict_do_nothing()
+	# Other backends rely on the caller filtering out existing rows
+	return insert(model)
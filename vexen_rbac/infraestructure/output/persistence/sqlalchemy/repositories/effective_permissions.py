@@ -0,0 +1,168 @@
+"""
+Maintenance of the materialized role_effective_permissions table.
+
+Every helper runs set-based statements in the caller's session, so the table
+changes in the same transaction as the association rows it is derived from.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import ColumnElement, Select, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.associations import (
+	PermissionGroupPermissionAssociation,
+	RolePermissionAssociation,
+	RolePermissionGroupAssociation,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.role_effective_permission import (  # noqa: E501
+	DIRECT_SOURCE,
+	RoleEffectivePermissionModel,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.bulk import (
+	IN_CHUNK_SIZE,
+)
+
+_COLUMNS = ("role_id", "permission_id", "source")
+
+
+def _direct_grants(*criteria: ColumnElement[bool]) -> Select:
+	return select(
+		RolePermissionAssociation.role_id,
+		RolePermissionAssociation.permission_id,
+		literal(DIRECT_SOURCE),
+	).where(*criteria)
+
+
+def _inherited_grants(*criteria: ColumnElement[bool]) -> Select:
+	return (
+		select(
+			RolePermissionGroupAssociation.role_id,
+			PermissionGroupPermissionAssociation.permission_id,
+			RolePermissionGroupAssociation.permission_group_id,
+		)
+		.join(
+			PermissionGroupPermissionAssociation,
+			PermissionGroupPermissionAssociation.permission_group_id
+			== RolePermissionGroupAssociation.permission_group_id,
+		)
+		.where(*criteria)
+	)
+
+
+async def _insert(session: AsyncSession, grants: Select) -> None:
+	await session.execute(insert(RoleEffectivePermissionModel).from_select(_COLUMNS, grants))
+
+
+def _chunks(ids: Iterable[int]) -> Iterable[list[int]]:
+	unique = list(dict.fromkeys(ids))
+	for start in range(0, len(unique), IN_CHUNK_SIZE):
+		yield unique[start : start + IN_CHUNK_SIZE]
+
+
+async def refresh_roles(session: AsyncSession, role_ids: Iterable[int]) -> None:
+	"""Recompute every row of the given roles (after saving or creating them)."""
+	table = RoleEffectivePermissionModel
+	for chunk in _chunks(role_ids):
+		await session.execute(delete(table).where(table.role_id.in_(chunk)))
+		await _insert(session, _direct_grants(RolePermissionAssociation.role_id.in_(chunk)))
+		await _insert(session, _inherited_grants(RolePermissionGroupAssociation.role_id.in_(chunk)))
+
+
+async def refresh_group(session: AsyncSession, group_id: int) -> None:
+	"""Recompute the rows inherited through a permission group (after saving it)."""
+	table = RoleEffectivePermissionModel
+	await session.execute(delete(table).where(table.source == group_id))
+	await _insert(
+		session, _inherited_grants(RolePermissionGroupAssociation.permission_group_id == group_id)
+	)
+
+
+async def grant_direct(session: AsyncSession, role_id: int, permission_ids: list[int]) -> None:
+	"""Add the rows of permissions just granted directly to a role."""
+	for chunk in _chunks(permission_ids):
+		await _insert(
+			session,
+			_direct_grants(
+				RolePermissionAssociation.role_id == role_id,
+				RolePermissionAssociation.permission_id.in_(chunk),
+			),
+		)
+
+
+async def revoke_direct(session: AsyncSession, role_id: int, permission_ids: list[int]) -> None:
+	"""Drop the rows of permissions just revoked from a role."""
+	table = RoleEffectivePermissionModel
+	for chunk in _chunks(permission_ids):
+		await session.execute(
+			delete(table).where(
+				table.role_id == role_id,
+				table.source == DIRECT_SOURCE,
+				table.permission_id.in_(chunk),
+			)
+		)
+
+
+async def grant_through_group(
+	session: AsyncSession, group_id: int, permission_ids: list[int]
+) -> None:
+	"""Add the rows of permissions just added to a group, for every role using it."""
+	for chunk in _chunks(permission_ids):
+		await _insert(
+			session,
+			_inherited_grants(
+				RolePermissionGroupAssociation.permission_group_id == group_id,
+				PermissionGroupPermissionAssociation.permission_id.in_(chunk),
+			),
+		)
+
+
+async def revoke_through_group(
+	session: AsyncSession, group_id: int, permission_ids: list[int]
+) -> None:
+	"""Drop the rows of permissions just removed from a group."""
+	table = RoleEffectivePermissionModel
+	for chunk in _chunks(permission_ids):
+		await session.execute(
+			delete(table).where(table.source == group_id, table.permission_id.in_(chunk))
+		)
+
+
+async def forget_role(session: AsyncSession, role_id: int) -> None:
+	"""Drop every row of a role that is being deleted."""
+	table = RoleEffectivePermissionModel
+	await session.execute(delete(table).where(table.role_id == role_id))
+
+
+async def forget_group(session: AsyncSession, group_id: int) -> None:
+	"""Drop every row inherited through a group that is being deleted."""
+	table = RoleEffectivePermissionModel
+	await session.execute(delete(table).where(table.source == group_id))
+
+
+async def forget_permission(session: AsyncSession, permission_id: int) -> None:
+	"""Drop every row of a permission that is being deleted."""
+	table = RoleEffectivePermissionModel
+	await session.execute(delete(table).where(table.permission_id == permission_id))
+
+
+async def rebuild(session: AsyncSession) -> int:
+	"""
+	Recompute the whole table from the association tables.
+
+	Args:
+		session: Active session (the caller commits)
+
+	Returns:
+		Number of rows in the rebuilt table
+	"""
+	await session.execute(delete(RoleEffectivePermissionModel))
+	await _insert(session, _direct_grants())
+	await _insert(session, _inherited_grants())
+	return await session.scalar(select(func.count()).select_from(RoleEffectivePermissionModel))
+
+
+def effective_permission_ids(role_ids: list[int] | Select) -> Select:
+	"""Statement selecting the permission IDs held by any of the roles (may repeat)."""
+	table = RoleEffectivePermissionModel
+	return select(table.permission_id).where(table.role_id.in_(role_ids))
@@ -0,0 +1,48 @@
+"""
+Shared query helpers for offset and keyset pagination.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def newest_first(stmt: Select, model: Any) -> Select:
+	"""
+	Order a statement by (created_at, id) descending.
+
+	The ID tie-breaker makes the order total, which keyset pagination needs.
+	"""
+	return stmt.order_by(model.created_at.desc(), model.id.desc())
+
+
+def after_keyset(stmt: Select, model: Any, after: tuple[datetime, int] | None) -> Select:
+	"""
+	Restrict a newest-first statement to rows strictly after a keyset position.
+
+	Args:
+		stmt: Statement ordered with `newest_first`
+		model: Mapped class with `created_at` and `id` columns
+		after: (created_at, id) of the last row of the previous page, or None
+
+	Returns:
+		Select: Filtered statement
+	"""
+	if after is None:
+		return stmt
+
+	created_at, last_id = after
+	return stmt.where(
+		or_(
+			model.created_at < created_at,
+			and_(model.created_at == created_at, model.id < last_id),
+		)
+	)
+
+
+async def count_rows(session: AsyncSession, model: Any) -> int:
+	"""Count every row of a mapped table."""
+	result = await session.execute(select(func.count()).select_from(model))
+	return result.scalar_one()
@@ -2,8 +2,12 @@
 SQLAlchemy 2.0 implementation of PermissionGroup repository with async sessions.
 """
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload, selectinload
 from vexen_rbac.domain.entity.permission_group import PermissionGroup
 from vexen_rbac.domain.ports.permission_group_repository_port import (
 	IPermissionGroupRepositoryPort,
@@ -11,25 +15,55 @@ from vexen_rbac.domain.ports.permission_group_repository_port import (
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.mappers.permission_group_mapper import (
 	PermissionGroupMapper,
 )
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.associations import (
+	PermissionGroupPermissionAssociation,
+)
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission import (
 	PermissionModel,
 )
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission_group import (
 	PermissionGroupModel,
 )
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.role import RoleModel
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.bulk import (
+	existing_values,
+	link_permissions,
+	models_by_ids,
+	unlink_permissions,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.effective_permissions import (  # noqa: E501
+	forget_group,
+	grant_through_group,
+	refresh_group,
+	revoke_through_group,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.revision_repository import (  # noqa: E501
+	bump_revision,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.pagination import (
+	after_keyset,
+	count_rows,
+	newest_first,
+)
+
+# PermissionGroupMapper only needs the IDs of the related permissions
+_RELATED_IDS = (selectinload(PermissionGroupModel.permissions).load_only(PermissionModel.id),)
 
 
 class PermissionGroupRepository(IPermissionGroupRepositoryPort):
 	"""SQLAlchemy 2.0 async implementation of permission group repository."""
 
-	def __init__(self, session: AsyncSession):
+	def __init__(self, session: AsyncSession, materialize_effective_permissions: bool = False):
 		"""
 		Initialize repository with async session.
 
 		Args:
 			session: SQLAlchemy async session
+			materialize_effective_permissions: Keep role_effective_permissions up
+				to date on writes
 		"""
 		self.session = session
+		self.materialize_effective_permissions = materialize_effective_permissions
 
 	async def get_by_id(self, permission_group_id: int) -> PermissionGroup | None:
 		"""
@@ -41,15 +75,28 @@ class PermissionGroupRepository(IPermissionGroupRepositoryPort):
 		Returns:
 			PermissionGroup entity if found, None otherwise
 		"""
-		stmt = select(PermissionGroupModel).where(PermissionGroupModel.id == permission_group_id)
-		result = await self.session.execute(stmt)
-		model = result.scalar_one_or_none()
+		model = await self._get_model(permission_group_id)
 
 		if model is None:
 			return None
 
 		return PermissionGroupMapper.to_entity(model)
 
+	async def get_many(self, permission_group_ids: list[int]) -> list[PermissionGroup]:
+		"""
+		Retrieve many permission groups by ID with one WHERE id IN (...) query per chunk.
+
+		Args:
+			permission_group_ids: IDs of the permission groups to retrieve
+
+		Returns:
+			PermissionGroup entities in request order; IDs that do not exist are skipped
+		"""
+		models = await models_by_ids(
+			self.session, PermissionGroupModel, permission_group_ids, _RELATED_IDS
+		)
+		return [PermissionGroupMapper.to_entity(model) for model in models]
+
 	async def save(self, permission_group: PermissionGroup) -> PermissionGroup:
 		"""
 		Save (create or update) a permission group.
@@ -61,29 +108,90 @@ class PermissionGroupRepository(IPermissionGroupRepositoryPort):
 			Saved permission group entity with updated data
 		"""
 		# Check if permission group exists
-		stmt = select(PermissionGroupModel).where(PermissionGroupModel.id == permission_group.id)
-		result = await self.session.execute(stmt)
-		existing_model = result.scalar_one_or_none()
+		existing_model = await self._get_model(permission_group.id)
 
 		if existing_model:
 			# Update existing permission group
 			model = PermissionGroupMapper.update_model_from_entity(existing_model, permission_group)
-			# Update M2M relationships
-			await self._update_permissions_relationship(model, permission_group)
 		else:
 			# Create new permission group
 			model = PermissionGroupMapper.to_model(permission_group)
 			self.session.add(model)
-			await self.session.flush()
-			await self.session.refresh(model)
-			# Set M2M relationships
-			await self._update_permissions_relationship(model, permission_group)
 
+		# Set M2M relationships (collection is fully loaded or brand new)
+		await self._update_permissions_relationship(model, permission_group)
 		await self.session.flush()
-		await self.session.refresh(model)
+		if self.materialize_effective_permissions:
+			await refresh_group(self.session, model.id)
+		await bump_revision(self.session)
 
 		return PermissionGroupMapper.to_entity(model)
 
+	async def create_many(
+		self, permission_groups: list[PermissionGroup]
+	) -> list[PermissionGroup | None]:
+		"""
+		Create many permission groups with a single multi-row INSERT ... RETURNING.
+
+		Association rows for all created groups are then written with one
+		executemany. Unknown permission IDs are ignored, as in `save`. Names that
+		already exist are skipped; names must be unique within the batch.
+
+		Args:
+			permission_groups: Permission group entities to create
+
+		Returns:
+			List aligned with the input: the created entity, or None if the name
+			already existed
+		"""
+		if not permission_groups:
+			return []
+
+		existing = await existing_values(
+			self.session, PermissionGroupModel.name, (g.name for g in permission_groups)
+		)
+		new_groups = [g for g in permission_groups if g.name not in existing]
+		if not new_groups:
+			return [None] * len(permission_groups)
+
+		stmt = insert(PermissionGroupModel).returning(
+			PermissionGroupModel.id, PermissionGroupModel.created_at, sort_by_parameter_order=True
+		)
+		result = await self.session.execute(
+			stmt, [PermissionGroupMapper.to_row(g) for g in new_groups]
+		)
+		inserted = result.all()
+
+		valid_permission_ids = await existing_values(
+			self.session, PermissionModel.id, (pid for g in new_groups for pid in g.permissions)
+		)
+
+		created: dict[str, PermissionGroup] = {}
+		links = []
+		for group, row in zip(new_groups, inserted, strict=True):
+			permission_ids = [
+				pid for pid in dict.fromkeys(group.permissions) if pid in valid_permission_ids
+			]
+			links += [
+				{"permission_group_id": row.id, "permission_id": pid} for pid in permission_ids
+			]
+			created[group.name] = PermissionGroup(
+				id=row.id,
+				name=group.name,
+				display_name=group.display_name,
+				description=group.description,
+				icon=group.icon,
+				order=group.order,
+				permissions=permission_ids,
+				created_at=row.created_at,
+			)
+
+		if links:
+			await self.session.execute(insert(PermissionGroupPermissionAssociation), links)
+		await bump_revision(self.session)
+
+		return [created.get(g.name) if g.name not in existing else None for g in permission_groups]
+
 	async def delete(self, permission_group_id: int) -> None:
 		"""
 		Delete a permission group by its ID.
@@ -91,13 +199,42 @@ class PermissionGroupRepository(IPermissionGroupRepositoryPort):
 		Args:
 			permission_group_id: ID of the permission group to delete
 		"""
-		stmt = select(PermissionGroupModel).where(PermissionGroupModel.id == permission_group_id)
+		# Collections are loaded so the ORM can clear the association rows
+		stmt = (
+			select(PermissionGroupModel)
+			.where(PermissionGroupModel.id == permission_group_id)
+			.options(
+				*_RELATED_IDS,
+				selectinload(PermissionGroupModel.roles).load_only(RoleModel.id),
+			)
+		)
 		result = await self.session.execute(stmt)
 		model = result.scalar_one_or_none()
 
 		if model:
+			if self.materialize_effective_permissions:
+				await forget_group(self.session, permission_group_id)
 			await self.session.delete(model)
 			await self.session.flush()
+			await bump_revision(self.session)
+
+	async def _get_model(self, permission_group_id: int | None) -> PermissionGroupModel | None:
+		"""
+		Load a permission group model with the permission IDs the mapper needs.
+
+		Args:
+			permission_group_id: ID of the permission group to load
+
+		Returns:
+			PermissionGroupModel if found, None otherwise
+		"""
+		stmt = (
+			select(PermissionGroupModel)
+			.where(PermissionGroupModel.id == permission_group_id)
+			.options(*_RELATED_IDS)
+		)
+		result = await self.session.execute(stmt)
+		return result.scalar_one_or_none()
 
 	async def _update_permissions_relationship(
 		self, model: PermissionGroupModel, entity: PermissionGroup
@@ -111,62 +248,201 @@ class PermissionGroupRepository(IPermissionGroupRepositoryPort):
 			model: Existing model instance (must be saved to DB)
 			entity: Source entity with relationship data
 		"""
-		# Clear existing relationships
-		model.permissions.clear()
-
-		# Add new relationships
+		permissions = []
 		if entity.permissions:
 			stmt = select(PermissionModel).where(PermissionModel.id.in_(entity.permissions))
 			result = await self.session.execute(stmt)
-			permissions = result.scalars().all()
-			model.permissions.extend(permissions)
+			permissions = list(result.scalars().all())
 
-	async def add_permissions(self, group_id: int, permission_ids: list[int]) -> PermissionGroup:
-		stmt = select(PermissionGroupModel).where(PermissionGroupModel.id == group_id)
-		result = await self.session.execute(stmt)
-		model = result.scalar_one_or_none()
+		# Replace existing relationships
+		model.permissions = permissions
+
+	async def add_permissions(self, group_id: int, permission_ids: list[int]) -> list[int]:
+		"""
+		Grant permissions to a permission group with a set-based INSERT.
+
+		The permission group graph is not loaded; unknown permission IDs and permissions
+		already granted are skipped.
+
+		Args:
+			group_id: ID of the permission group
+			permission_ids: IDs of the permissions to grant
+
+		Returns:
+			IDs of the permissions that were newly granted
+
+		Raises:
+			ValueError: If the permission group does not exist
+		"""
+		added = await link_permissions(
+			self.session,
+			PermissionGroupModel,
+			PermissionGroupPermissionAssociation.permission_group_id,
+			PermissionGroupPermissionAssociation.permission_id,
+			group_id,
+			permission_ids,
+		)
+
+		if not added:
+			await self._ensure_exists(group_id)
+		else:
+			if self.materialize_effective_permissions:
+				await grant_through_group(self.session, group_id, added)
+			await bump_revision(self.session)
+
+		return added
 
-		if not model:
+	async def remove_permissions(self, group_id: int, permission_ids: list[int]) -> list[int]:
+		"""
+		Revoke permissions from a permission group with a set-based DELETE.
+
+		Args:
+			group_id: ID of the permission group
+			permission_ids: IDs of the permissions to revoke
+
+		Returns:
+			IDs of the permissions that were actually revoked
+
+		Raises:
+			ValueError: If the permission group does not exist
+		"""
+		removed = await unlink_permissions(
+			self.session,
+			PermissionGroupPermissionAssociation.permission_group_id,
+			PermissionGroupPermissionAssociation.permission_id,
+			group_id,
+			permission_ids,
+		)
+
+		if not removed:
+			await self._ensure_exists(group_id)
+		else:
+			if self.materialize_effective_permissions:
+				await revoke_through_group(self.session, group_id, removed)
+			await bump_revision(self.session)
+
+		return removed
+
+	async def _ensure_exists(self, group_id: int) -> None:
+		"""Raise ValueError if the permission group does not exist."""
+		stmt = select(PermissionGroupModel.id).where(PermissionGroupModel.id == group_id)
+		if await self.session.scalar(stmt) is None:
 			raise ValueError(f"Permission group with id {group_id} not found")
 
-		perm_stmt = select(PermissionModel).where(PermissionModel.id.in_(permission_ids))
-		perm_result = await self.session.execute(perm_stmt)
-		permissions = perm_result.scalars().all()
+	async def count_permissions(self, group_id: int) -> int:
+		"""
+		Count the permissions of a permission group.
+
+		Args:
+			group_id: ID of the permission group
 
-		existing_ids = {p.id for p in model.permissions}
-		for permission in permissions:
-			if permission.id not in existing_ids:
-				model.permissions.append(permission)
+		Returns:
+			Number of permissions (0 if the group does not exist)
+		"""
+		stmt = select(func.count()).where(
+			PermissionGroupPermissionAssociation.permission_group_id == group_id
+		)
+		return await self.session.scalar(stmt) or 0
 
-		await self.session.flush()
-		await self.session.refresh(model)
+	async def list_with_counts(self) -> list[tuple[PermissionGroup, int]]:
+		"""
+		Retrieve all permission groups with their permission counts in one aggregate query.
 
-		return PermissionGroupMapper.to_entity(model)
+		Permission IDs are not loaded: the returned groups have empty
+		`permissions` lists.
 
-	async def remove_permissions(self, group_id: int, permission_ids: list[int]) -> PermissionGroup:
-		stmt = select(PermissionGroupModel).where(PermissionGroupModel.id == group_id)
+		Returns:
+			List of (permission group, permission count) tuples ordered by name
+		"""
+		counts = (
+			select(
+				PermissionGroupPermissionAssociation.permission_group_id,
+				func.count().label("permission_count"),
+			)
+			.group_by(PermissionGroupPermissionAssociation.permission_group_id)
+			.subquery()
+		)
+		stmt = (
+			select(PermissionGroupModel, func.coalesce(counts.c.permission_count, 0))
+			.outerjoin(counts, counts.c.permission_group_id == PermissionGroupModel.id)
+			.options(noload(PermissionGroupModel.permissions))
+			.order_by(PermissionGroupModel.name)
+		)
 		result = await self.session.execute(stmt)
-		model = result.scalar_one_or_none()
 
-		if not model:
-			raise ValueError(f"Permission group with id {group_id} not found")
+		return [(PermissionGroupMapper.to_entity(model), count) for model, count in result.all()]
+
+	async def list_paginated(self, page: int, page_size: int) -> tuple[list[PermissionGroup], int]:
+		"""
+		Retrieve an offset page of permission groups, newest first.
 
-		model.permissions = [p for p in model.permissions if p.id not in permission_ids]
+		Args:
+			page: 1-based page number
+			page_size: Number of permission groups per page
 
-		await self.session.flush()
-		await self.session.refresh(model)
+		Returns:
+			Tuple of (permission_groups, total)
+		"""
+		offset = (page - 1) * page_size
+		total = await count_rows(self.session, PermissionGroupModel)
 
-		return PermissionGroupMapper.to_entity(model)
+		stmt = newest_first(
+			select(PermissionGroupModel).options(*_RELATED_IDS), PermissionGroupModel
+		)
+		result = await self.session.execute(stmt.offset(offset).limit(page_size))
+		models = result.scalars().all()
 
-	async def count_permissions(self, group_id: int) -> int:
-		stmt = select(PermissionGroupModel).where(PermissionGroupModel.id == group_id)
+		return [PermissionGroupMapper.to_entity(model) for model in models], total
+
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[PermissionGroup], int | None]:
+		"""
+		Retrieve a keyset page of permission groups, newest first.
+
+		Args:
+			after: (created_at, id) of the last permission group of the previous page, or None
+			limit: Maximum number of permission groups to return
+			include_total: Also count every permission group (full scan)
+
+		Returns:
+			Tuple of (permission_groups, total or None)
+		"""
+		total = await count_rows(self.session, PermissionGroupModel) if include_total else None
+
+		stmt = newest_first(
+			select(PermissionGroupModel).options(*_RELATED_IDS), PermissionGroupModel
+		)
+		stmt = after_keyset(stmt, PermissionGroupModel, after).limit(limit)
 		result = await self.session.execute(stmt)
-		model = result.scalar_one_or_none()
+		models = result.scalars().all()
 
-		if not model:
-			return 0
+		return [PermissionGroupMapper.to_entity(model) for model in models], total
 
-		return len(model.permissions)
+	async def stream(self, chunk_size: int) -> AsyncIterator[list[PermissionGroup]]:
+		"""
+		Stream all permission groups by name, chunk by chunk, from a server-side cursor.
+
+		Each chunk loads its permission IDs with one SELECT ... IN.
+
+		Args:
+			chunk_size: Maximum number of groups per chunk
+
+		Yields:
+			Lists of permission group entities
+		"""
+		stmt = (
+			select(PermissionGroupModel)
+			.options(*_RELATED_IDS)
+			.order_by(PermissionGroupModel.name)
+			.execution_options(yield_per=chunk_size)
+		)
+		result = await self.session.stream_scalars(stmt)
+		try:
+			async for models in result.partitions():
+				yield [PermissionGroupMapper.to_entity(model) for model in models]
+		finally:
+			await result.close()
 
 	async def list(self) -> list[PermissionGroup]:
 		"""
@@ -175,7 +451,9 @@ class PermissionGroupRepository(IPermissionGroupRepositoryPort):
 		Returns:
 			List of all permission group entities
 		"""
-		stmt = select(PermissionGroupModel).order_by(PermissionGroupModel.name)
+		stmt = (
+			select(PermissionGroupModel).options(*_RELATED_IDS).order_by(PermissionGroupModel.name)
+		)
 		result = await self.session.execute(stmt)
 		models = result.scalars().all()
 
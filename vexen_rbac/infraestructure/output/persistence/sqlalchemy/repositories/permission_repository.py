@@ -2,8 +2,12 @@
 SQLAlchemy 2.0 implementation of Permission repository with async sessions.
 """
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from vexen_rbac.domain.entity.permission import Permission
 from vexen_rbac.domain.ports.permission_repository_port import IPermissionRepositoryPort
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.mappers.permission_mapper import (
@@ -12,19 +16,41 @@ from vexen_rbac.infraestructure.output.persistence.sqlalchemy.mappers.permission
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission import (
 	PermissionModel,
 )
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission_group import (
+	PermissionGroupModel,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.role import RoleModel
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.bulk import (
+	existing_values,
+	models_by_ids,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.effective_permissions import (  # noqa: E501
+	forget_permission,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.revision_repository import (  # noqa: E501
+	bump_revision,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.pagination import (
+	after_keyset,
+	count_rows,
+	newest_first,
+)
 
 
 class PermissionRepository(IPermissionRepositoryPort):
 	"""SQLAlchemy 2.0 async implementation of permission repository."""
 
-	def __init__(self, session: AsyncSession):
+	def __init__(self, session: AsyncSession, materialize_effective_permissions: bool = False):
 		"""
 		Initialize repository with async session.
 
 		Args:
 			session: SQLAlchemy async session
+			materialize_effective_permissions: Keep role_effective_permissions up
+				to date on writes
 		"""
 		self.session = session
+		self.materialize_effective_permissions = materialize_effective_permissions
 
 	async def get_by_id(self, permission_id: int) -> Permission | None:
 		"""
@@ -45,6 +71,19 @@ class PermissionRepository(IPermissionRepositoryPort):
 
 		return PermissionMapper.to_entity(model)
 
+	async def get_many(self, permission_ids: list[int]) -> list[Permission]:
+		"""
+		Retrieve many permissions by ID with one WHERE id IN (...) query per chunk.
+
+		Args:
+			permission_ids: IDs of the permissions to retrieve
+
+		Returns:
+			Permission entities in request order; IDs that do not exist are skipped
+		"""
+		models = await models_by_ids(self.session, PermissionModel, permission_ids)
+		return [PermissionMapper.to_entity(model) for model in models]
+
 	async def save(self, permission: Permission) -> Permission:
 		"""
 		Save (create or update) a permission.
@@ -69,10 +108,40 @@ class PermissionRepository(IPermissionRepositoryPort):
 			self.session.add(model)
 
 		await self.session.flush()
-		await self.session.refresh(model)
+		await bump_revision(self.session)
 
 		return PermissionMapper.to_entity(model)
 
+	async def create_many(self, permissions: list[Permission]) -> list[Permission | None]:
+		"""
+		Create many permissions with a single multi-row INSERT ... RETURNING.
+
+		Names that already exist are skipped. Names must be unique within the batch.
+
+		Args:
+			permissions: Permission entities to create
+
+		Returns:
+			List aligned with the input: the created entity, or None if the name
+			already existed
+		"""
+		if not permissions:
+			return []
+
+		existing = await existing_values(
+			self.session, PermissionModel.name, (p.name for p in permissions)
+		)
+		rows = [PermissionMapper.to_row(p) for p in permissions if p.name not in existing]
+
+		created: dict[str, Permission] = {}
+		if rows:
+			stmt = insert(PermissionModel).returning(PermissionModel, sort_by_parameter_order=True)
+			result = await self.session.scalars(stmt, rows)
+			created = {model.name: PermissionMapper.to_entity(model) for model in result}
+			await bump_revision(self.session)
+
+		return [created.get(p.name) if p.name not in existing else None for p in permissions]
+
 	async def delete(self, permission_id: int) -> None:
 		"""
 		Delete a permission by its ID.
@@ -80,13 +149,24 @@ class PermissionRepository(IPermissionRepositoryPort):
 		Args:
 			permission_id: ID of the permission to delete
 		"""
-		stmt = select(PermissionModel).where(PermissionModel.id == permission_id)
+		# Collections are loaded so the ORM can clear the association rows
+		stmt = (
+			select(PermissionModel)
+			.where(PermissionModel.id == permission_id)
+			.options(
+				selectinload(PermissionModel.roles).load_only(RoleModel.id),
+				selectinload(PermissionModel.permission_groups).load_only(PermissionGroupModel.id),
+			)
+		)
 		result = await self.session.execute(stmt)
 		model = result.scalar_one_or_none()
 
 		if model:
+			if self.materialize_effective_permissions:
+				await forget_permission(self.session, permission_id)
 			await self.session.delete(model)
 			await self.session.flush()
+			await bump_revision(self.session)
 
 	async def group_by_category(self) -> dict[str, list[Permission]]:
 		from vexen_rbac.infraestructure.output.persistence.sqlalchemy.mappers.permission_mapper import (
@@ -106,6 +186,71 @@ class PermissionRepository(IPermissionRepositoryPort):
 
 		return grouped
 
+	async def list_paginated(self, page: int, page_size: int) -> tuple[list[Permission], int]:
+		"""
+		Retrieve an offset page of permissions, newest first.
+
+		Args:
+			page: 1-based page number
+			page_size: Number of permissions per page
+
+		Returns:
+			Tuple of (permissions, total)
+		"""
+		offset = (page - 1) * page_size
+		total = await count_rows(self.session, PermissionModel)
+
+		stmt = newest_first(select(PermissionModel), PermissionModel)
+		result = await self.session.execute(stmt.offset(offset).limit(page_size))
+		models = result.scalars().all()
+
+		return [PermissionMapper.to_entity(model) for model in models], total
+
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[Permission], int | None]:
+		"""
+		Retrieve a keyset page of permissions, newest first.
+
+		Args:
+			after: (created_at, id) of the last permission of the previous page, or None
+			limit: Maximum number of permissions to return
+			include_total: Also count every permission (full scan)
+
+		Returns:
+			Tuple of (permissions, total or None)
+		"""
+		total = await count_rows(self.session, PermissionModel) if include_total else None
+
+		stmt = newest_first(select(PermissionModel), PermissionModel)
+		stmt = after_keyset(stmt, PermissionModel, after).limit(limit)
+		result = await self.session.execute(stmt)
+		models = result.scalars().all()
+
+		return [PermissionMapper.to_entity(model) for model in models], total
+
+	async def stream(self, chunk_size: int) -> AsyncIterator[list[Permission]]:
+		"""
+		Stream all permissions by name, chunk by chunk, from a server-side cursor.
+
+		Args:
+			chunk_size: Maximum number of permissions per chunk
+
+		Yields:
+			Lists of permission entities
+		"""
+		stmt = (
+			select(PermissionModel)
+			.order_by(PermissionModel.name)
+			.execution_options(yield_per=chunk_size)
+		)
+		result = await self.session.stream_scalars(stmt)
+		try:
+			async for models in result.partitions():
+				yield [PermissionMapper.to_entity(model) for model in models]
+		finally:
+			await result.close()
+
 	async def list(self) -> list[Permission]:
 		"""
 		Retrieve all permissions.
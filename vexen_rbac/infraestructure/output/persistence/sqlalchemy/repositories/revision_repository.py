@@ -0,0 +1,77 @@
+"""
+Global revision counter: bumped by every write, probed by other processes.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vexen_rbac.domain.ports.revision_repository_port import IRevisionRepositoryPort
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.revision import (
+	REVISION_ROW_ID,
+	RevisionModel,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.bulk import (
+	insert_ignoring_conflicts,
+)
+
+# PostgreSQL channel notified (on commit) with the new revision
+REVISION_CHANNEL = "vexen_rbac_revision"
+
+
+async def bump_revision(session: AsyncSession) -> int:
+	"""
+	Increment the revision in the caller's transaction.
+
+	On PostgreSQL a NOTIFY carrying the new revision is also queued; it is
+	delivered to listeners only if the transaction commits.
+
+	Args:
+		session: Session of the write being recorded
+
+	Returns:
+		The new revision
+	"""
+	stmt = (
+		update(RevisionModel)
+		.where(RevisionModel.id == REVISION_ROW_ID)
+		.values(revision=RevisionModel.revision + 1, updated_at=datetime.now())
+		.returning(RevisionModel.revision)
+	)
+	revision = await session.scalar(stmt)
+	if revision is None:
+		# First write on this database: create the row, then count the write
+		await session.execute(
+			insert_ignoring_conflicts(session, RevisionModel).values(
+				id=REVISION_ROW_ID, revision=0, updated_at=datetime.now()
+			)
+		)
+		revision = await session.scalar(stmt)
+
+	if session.get_bind().dialect.name == "postgresql":
+		await session.execute(select(func.pg_notify(REVISION_CHANNEL, str(revision))))
+	return revision
+
+
+class RevisionRepository(IRevisionRepositoryPort):
+	"""SQLAlchemy 2.0 async implementation of the revision probe."""
+
+	def __init__(self, session: AsyncSession):
+		"""
+		Initialize repository with async session.
+
+		Args:
+			session: SQLAlchemy async session
+		"""
+		self.session = session
+
+	async def current_revision(self) -> int:
+		"""
+		Read the current revision with a primary key lookup.
+
+		Returns:
+			The revision, or 0 if nothing was ever written
+		"""
+		stmt = select(RevisionModel.revision).where(RevisionModel.id == REVISION_ROW_ID)
+		return await self.session.scalar(stmt) or 0
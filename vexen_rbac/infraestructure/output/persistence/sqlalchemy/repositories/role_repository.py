@@ -2,13 +2,27 @@
 SQLAlchemy 2.0 implementation of Role repository with async sessions.
 """
 
-from sqlalchemy import func, select
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+
+from sqlalchemy import delete, func, insert, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload, selectinload
+from vexen_rbac.domain.entity.permission import Permission
 from vexen_rbac.domain.entity.role import Role
 from vexen_rbac.domain.ports.role_repository_port import IRoleRepositoryPort
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.mappers.permission_mapper import (
+	PermissionMapper,
+)
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.mappers.role_mapper import (
 	RoleMapper,
 )
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.associations import (
+	PermissionGroupPermissionAssociation,
+	RolePermissionAssociation,
+	RolePermissionGroupAssociation,
+	UserRoleAssociation,
+)
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission import (
 	PermissionModel,
 )
@@ -16,19 +30,52 @@ from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission_
 	PermissionGroupModel,
 )
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.role import RoleModel
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.bulk import (
+	existing_values,
+	link_permissions,
+	models_by_ids,
+	unlink_permissions,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.effective_permissions import (  # noqa: E501
+	effective_permission_ids,
+	forget_role,
+	grant_direct,
+	refresh_roles,
+	revoke_direct,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.revision_repository import (  # noqa: E501
+	bump_revision,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.pagination import (
+	after_keyset,
+	count_rows,
+	newest_first,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.user_role_repository import (  # noqa: E501
+	user_counts,
+)
+
+# RoleMapper only needs the IDs of the related permissions and groups
+_RELATED_IDS = (
+	selectinload(RoleModel.permissions).load_only(PermissionModel.id),
+	selectinload(RoleModel.permission_groups).load_only(PermissionGroupModel.id),
+)
 
 
 class RoleRepository(IRoleRepositoryPort):
 	"""SQLAlchemy 2.0 async implementation of role repository."""
 
-	def __init__(self, session: AsyncSession):
+	def __init__(self, session: AsyncSession, materialize_effective_permissions: bool = False):
 		"""
 		Initialize repository with async session.
 
 		Args:
 			session: SQLAlchemy async session
+			materialize_effective_permissions: Keep role_effective_permissions up
+				to date on writes and read effective permissions from it
 		"""
 		self.session = session
+		self.materialize_effective_permissions = materialize_effective_permissions
 
 	async def get_by_id(self, role_id: int) -> Role | None:
 		"""
@@ -40,15 +87,26 @@ class RoleRepository(IRoleRepositoryPort):
 		Returns:
 			Role entity if found, None otherwise
 		"""
-		stmt = select(RoleModel).where(RoleModel.id == role_id)
-		result = await self.session.execute(stmt)
-		model = result.scalar_one_or_none()
+		model = await self._get_model(role_id)
 
 		if model is None:
 			return None
 
 		return RoleMapper.to_entity(model)
 
+	async def get_many(self, role_ids: list[int]) -> list[Role]:
+		"""
+		Retrieve many roles by ID with one WHERE id IN (...) query per chunk.
+
+		Args:
+			role_ids: IDs of the roles to retrieve
+
+		Returns:
+			Role entities in request order; IDs that do not exist are skipped
+		"""
+		models = await models_by_ids(self.session, RoleModel, role_ids, _RELATED_IDS)
+		return [RoleMapper.to_entity(model) for model in models]
+
 	async def save(self, role: Role) -> Role:
 		"""
 		Save (create or update) a role.
@@ -60,29 +118,100 @@ class RoleRepository(IRoleRepositoryPort):
 			Saved role entity with updated data
 		"""
 		# Check if role exists
-		stmt = select(RoleModel).where(RoleModel.id == role.id)
-		result = await self.session.execute(stmt)
-		existing_model = result.scalar_one_or_none()
+		existing_model = await self._get_model(role.id)
 
 		if existing_model:
 			# Update existing role
 			model = RoleMapper.update_model_from_entity(existing_model, role)
-			# Update M2M relationships
-			await self._update_relationships(model, role)
 		else:
 			# Create new role
 			model = RoleMapper.to_model(role)
 			self.session.add(model)
-			await self.session.flush()
-			await self.session.refresh(model)
-			# Set M2M relationships
-			await self._update_relationships(model, role)
 
+		# Set M2M relationships (collections are fully loaded or brand new)
+		await self._update_relationships(model, role)
 		await self.session.flush()
-		await self.session.refresh(model)
+		if self.materialize_effective_permissions:
+			await refresh_roles(self.session, [model.id])
+		await bump_revision(self.session)
 
 		return RoleMapper.to_entity(model)
 
+	async def create_many(self, roles: list[Role]) -> list[Role | None]:
+		"""
+		Create many roles with a single multi-row INSERT ... RETURNING.
+
+		Association rows for all created roles are then written with one
+		executemany per association table. Unknown permission or group IDs are
+		ignored, as in `save`. Names that already exist are skipped; names must be
+		unique within the batch.
+
+		Args:
+			roles: Role entities to create
+
+		Returns:
+			List aligned with the input: the created entity, or None if the name
+			already existed
+		"""
+		if not roles:
+			return []
+
+		existing = await existing_values(self.session, RoleModel.name, (r.name for r in roles))
+		new_roles = [r for r in roles if r.name not in existing]
+		if not new_roles:
+			return [None] * len(roles)
+
+		stmt = insert(RoleModel).returning(
+			RoleModel.id, RoleModel.created_at, RoleModel.updated_at, sort_by_parameter_order=True
+		)
+		result = await self.session.execute(stmt, [RoleMapper.to_row(r) for r in new_roles])
+		inserted = result.all()
+
+		valid_permission_ids = await existing_values(
+			self.session, PermissionModel.id, (pid for r in new_roles for pid in r.permissions)
+		)
+		valid_group_ids = await existing_values(
+			self.session,
+			PermissionGroupModel.id,
+			(gid for r in new_roles for gid in r.permission_groups),
+		)
+
+		created: dict[str, Role] = {}
+		permission_links = []
+		group_links = []
+		for role, row in zip(new_roles, inserted, strict=True):
+			permission_ids = [
+				pid for pid in dict.fromkeys(role.permissions) if pid in valid_permission_ids
+			]
+			group_ids = [
+				gid for gid in dict.fromkeys(role.permission_groups) if gid in valid_group_ids
+			]
+			permission_links += [
+				{"role_id": row.id, "permission_id": pid} for pid in permission_ids
+			]
+			group_links += [{"role_id": row.id, "permission_group_id": gid} for gid in group_ids]
+			created[role.name] = Role(
+				id=row.id,
+				name=role.name,
+				display_name=role.display_name,
+				description=role.description,
+				permissions=permission_ids,
+				permission_groups=group_ids,
+				user_count=0,
+				created_at=row.created_at,
+				updated_at=row.updated_at,
+			)
+
+		if permission_links:
+			await self.session.execute(insert(RolePermissionAssociation), permission_links)
+		if group_links:
+			await self.session.execute(insert(RolePermissionGroupAssociation), group_links)
+		if self.materialize_effective_permissions and (permission_links or group_links):
+			await refresh_roles(self.session, (role.id for role in created.values()))
+		await bump_revision(self.session)
+
+		return [created.get(r.name) if r.name not in existing else None for r in roles]
+
 	async def delete(self, role_id: int) -> None:
 		"""
 		Delete a role by its ID.
@@ -90,13 +219,54 @@ class RoleRepository(IRoleRepositoryPort):
 		Args:
 			role_id: ID of the role to delete
 		"""
-		stmt = select(RoleModel).where(RoleModel.id == role_id)
-		result = await self.session.execute(stmt)
-		model = result.scalar_one_or_none()
+		# Collections are loaded so the ORM can clear the association rows
+		model = await self._get_model(role_id)
 
 		if model:
+			if self.materialize_effective_permissions:
+				await forget_role(self.session, role_id)
+			# Also covers backends that do not enforce ON DELETE CASCADE (SQLite)
+			await self.session.execute(
+				delete(UserRoleAssociation).where(UserRoleAssociation.role_id == role_id)
+			)
 			await self.session.delete(model)
 			await self.session.flush()
+			await bump_revision(self.session)
+
+	async def _with_user_counts(
+		self, models: Sequence[RoleModel], all_roles: bool = False
+	) -> list[Role]:
+		"""
+		Map role models to entities with their user counts from one GROUP BY.
+
+		Args:
+			models: Role models to map
+			all_roles: The models are every role, so the aggregate needs no
+				WHERE role_id IN (...) filter
+
+		Returns:
+			Role entities with `user_count` filled, in the order of the models
+		"""
+		if not models:
+			return []
+
+		role_ids = None if all_roles else [model.id for model in models]
+		counts = await user_counts(self.session, role_ids)
+		return [RoleMapper.to_entity(model, counts.get(model.id, 0)) for model in models]
+
+	async def _get_model(self, role_id: int | None) -> RoleModel | None:
+		"""
+		Load a role model with the relationship IDs the mapper needs.
+
+		Args:
+			role_id: ID of the role to load
+
+		Returns:
+			RoleModel if found, None otherwise
+		"""
+		stmt = select(RoleModel).where(RoleModel.id == role_id).options(*_RELATED_IDS)
+		result = await self.session.execute(stmt)
+		return result.scalar_one_or_none()
 
 	async def _update_relationships(self, model: RoleModel, entity: Role) -> None:
 		"""
@@ -108,96 +278,192 @@ class RoleRepository(IRoleRepositoryPort):
 			model: Existing model instance (must be saved to DB)
 			entity: Source entity with relationship data
 		"""
-		# Clear existing relationships
-		model.permissions.clear()
-		model.permission_groups.clear()
-
-		# Add new permission relationships
+		permissions = []
 		if entity.permissions:
 			stmt = select(PermissionModel).where(PermissionModel.id.in_(entity.permissions))
 			result = await self.session.execute(stmt)
-			permissions = result.scalars().all()
-			model.permissions.extend(permissions)
+			permissions = list(result.scalars().all())
 
-		# Add new permission group relationships
+		permission_groups = []
 		if entity.permission_groups:
 			stmt = select(PermissionGroupModel).where(
 				PermissionGroupModel.id.in_(entity.permission_groups)
 			)
 			result = await self.session.execute(stmt)
-			permission_groups = result.scalars().all()
-			model.permission_groups.extend(permission_groups)
+			permission_groups = list(result.scalars().all())
 
-	async def add_permissions(self, role_id: int, permission_ids: list[int]) -> Role:
-		stmt = select(RoleModel).where(RoleModel.id == role_id)
-		result = await self.session.execute(stmt)
-		model = result.scalar_one_or_none()
+		# Replace existing relationships
+		model.permissions = permissions
+		model.permission_groups = permission_groups
 
-		if not model:
-			raise ValueError(f"Role with id {role_id} not found")
+	async def add_permissions(self, role_id: int, permission_ids: list[int]) -> list[int]:
+		"""
+		Grant permissions to a role with a set-based INSERT.
 
-		perm_stmt = select(PermissionModel).where(PermissionModel.id.in_(permission_ids))
-		perm_result = await self.session.execute(perm_stmt)
-		permissions = perm_result.scalars().all()
+		The role graph is not loaded; unknown permission IDs and permissions
+		already granted are skipped.
 
-		existing_ids = {p.id for p in model.permissions}
-		for permission in permissions:
-			if permission.id not in existing_ids:
-				model.permissions.append(permission)
+		Args:
+			role_id: ID of the role
+			permission_ids: IDs of the permissions to grant
 
-		await self.session.flush()
-		await self.session.refresh(model)
+		Returns:
+			IDs of the permissions that were newly granted
 
-		return RoleMapper.to_entity(model)
+		Raises:
+			ValueError: If the role does not exist
+		"""
+		added = await link_permissions(
+			self.session,
+			RoleModel,
+			RolePermissionAssociation.role_id,
+			RolePermissionAssociation.permission_id,
+			role_id,
+			permission_ids,
+		)
 
-	async def remove_permissions(self, role_id: int, permission_ids: list[int]) -> Role:
-		stmt = select(RoleModel).where(RoleModel.id == role_id)
-		result = await self.session.execute(stmt)
-		model = result.scalar_one_or_none()
+		if not added:
+			await self._ensure_exists(role_id)
+		else:
+			if self.materialize_effective_permissions:
+				await grant_direct(self.session, role_id, added)
+			await bump_revision(self.session)
 
-		if not model:
-			raise ValueError(f"Role with id {role_id} not found")
+		return added
 
-		model.permissions = [p for p in model.permissions if p.id not in permission_ids]
+	async def remove_permissions(self, role_id: int, permission_ids: list[int]) -> list[int]:
+		"""
+		Revoke permissions from a role with a set-based DELETE.
 
-		await self.session.flush()
-		await self.session.refresh(model)
+		Args:
+			role_id: ID of the role
+			permission_ids: IDs of the permissions to revoke
 
-		return RoleMapper.to_entity(model)
+		Returns:
+			IDs of the permissions that were actually revoked
+
+		Raises:
+			ValueError: If the role does not exist
+		"""
+		removed = await unlink_permissions(
+			self.session,
+			RolePermissionAssociation.role_id,
+			RolePermissionAssociation.permission_id,
+			role_id,
+			permission_ids,
+		)
+
+		if not removed:
+			await self._ensure_exists(role_id)
+		else:
+			if self.materialize_effective_permissions:
+				await revoke_direct(self.session, role_id, removed)
+			await bump_revision(self.session)
+
+		return removed
+
+	async def _ensure_exists(self, role_id: int) -> None:
+		"""Raise ValueError if the role does not exist."""
+		stmt = select(RoleModel.id).where(RoleModel.id == role_id)
+		if await self.session.scalar(stmt) is None:
+			raise ValueError(f"Role with id {role_id} not found")
 
 	async def count(self) -> int:
-		stmt = select(func.count()).select_from(RoleModel)
-		result = await self.session.execute(stmt)
-		return result.scalar_one()
+		return await count_rows(self.session, RoleModel)
 
 	async def count_permissions(self, role_id: int) -> int:
-		stmt = select(RoleModel).where(RoleModel.id == role_id)
-		result = await self.session.execute(stmt)
-		model = result.scalar_one_or_none()
+		"""
+		Count the permissions granted directly to a role.
 
-		if not model:
-			return 0
+		Args:
+			role_id: ID of the role
 
-		return len(model.permissions)
+		Returns:
+			Number of direct permissions (0 if the role does not exist)
+		"""
+		stmt = select(func.count()).where(RolePermissionAssociation.role_id == role_id)
+		return await self.session.scalar(stmt) or 0
 
-	async def list_paginated(self, page: int, page_size: int) -> tuple[list[Role], int]:
-		offset = (page - 1) * page_size
+	async def list_with_counts(self) -> list[tuple[Role, int]]:
+		"""
+		Retrieve all roles with their direct permission counts in one aggregate query.
 
-		count_stmt = select(func.count()).select_from(RoleModel)
-		total_result = await self.session.execute(count_stmt)
-		total = total_result.scalar_one()
+		Relationship IDs are not loaded: the returned roles have empty
+		`permissions` and `permission_groups` lists.
 
+		Returns:
+			List of (role, permission count) tuples ordered by name
+		"""
+		counts = (
+			select(
+				RolePermissionAssociation.role_id,
+				func.count().label("permission_count"),
+			)
+			.group_by(RolePermissionAssociation.role_id)
+			.subquery()
+		)
 		stmt = (
-			select(RoleModel).offset(offset).limit(page_size).order_by(RoleModel.created_at.desc())
+			select(RoleModel, func.coalesce(counts.c.permission_count, 0))
+			.outerjoin(counts, counts.c.role_id == RoleModel.id)
+			.options(noload(RoleModel.permissions), noload(RoleModel.permission_groups))
+			.order_by(RoleModel.name)
 		)
 		result = await self.session.execute(stmt)
+
+		return [(RoleMapper.to_entity(model), count) for model, count in result.all()]
+
+	async def list_paginated(self, page: int, page_size: int) -> tuple[list[Role], int]:
+		"""
+		Retrieve an offset page of roles, newest first, with their user counts.
+
+		Args:
+			page: Page number (1-based)
+			page_size: Roles per page
+
+		Returns:
+			Tuple of (roles, total)
+		"""
+		offset = (page - 1) * page_size
+		total = await count_rows(self.session, RoleModel)
+
+		stmt = newest_first(select(RoleModel).options(*_RELATED_IDS), RoleModel)
+		result = await self.session.execute(stmt.offset(offset).limit(page_size))
+		models = result.scalars().all()
+
+		return await self._with_user_counts(models), total
+
+	async def list_after(
+		self, after: tuple[datetime, int] | None, limit: int, include_total: bool = False
+	) -> tuple[list[Role], int | None]:
+		"""
+		Retrieve a keyset page of roles, newest first.
+
+		Args:
+			after: (created_at, id) of the last role of the previous page, or None
+			limit: Maximum number of roles to return
+			include_total: Also count every role (full scan)
+
+		Returns:
+			Tuple of (roles with their user counts, total or None)
+		"""
+		total = await count_rows(self.session, RoleModel) if include_total else None
+
+		stmt = newest_first(select(RoleModel).options(*_RELATED_IDS), RoleModel)
+		stmt = after_keyset(stmt, RoleModel, after).limit(limit)
+		result = await self.session.execute(stmt)
 		models = result.scalars().all()
 
-		roles = [RoleMapper.to_entity(model) for model in models]
-		return roles, total
+		return await self._with_user_counts(models), total
 
 	async def get_by_id_with_permissions(self, role_id: int) -> tuple[Role, list] | None:
-		stmt = select(RoleModel).where(RoleModel.id == role_id)
+		stmt = (
+			select(RoleModel)
+			.where(RoleModel.id == role_id)
+			.options(
+				selectinload(RoleModel.permissions),
+				selectinload(RoleModel.permission_groups).load_only(PermissionGroupModel.id),
+			)
+		)
 		result = await self.session.execute(stmt)
 		model = result.scalar_one_or_none()
 
@@ -217,15 +483,97 @@ class RoleRepository(IRoleRepositoryPort):
 
 		return role, permissions
 
+	async def get_effective_permissions(self, role_ids: list[int]) -> list[Permission]:
+		"""
+		Resolve the deduplicated effective permissions of one or many roles.
+
+		Direct grants (role_m2m_permissions) and grants inherited through
+		permission groups (role_m2m_permission_groups → permission_m2m_group_permissions)
+		are combined with a UNION and resolved in a single statement. With
+		materialized effective permissions, the statement is one indexed lookup
+		in role_effective_permissions instead.
+
+		Permissions are returned as granted: a wildcard ("tickets.*") is one
+		entry of its own and is not expanded into the catalog names it covers.
+
+		Args:
+			role_ids: IDs of the roles to resolve
+
+		Returns:
+			List of permission entities ordered by name
+		"""
+		if not role_ids:
+			return []
+
+		if self.materialize_effective_permissions:
+			stmt = (
+				select(PermissionModel)
+				.where(PermissionModel.id.in_(effective_permission_ids(role_ids)))
+				.order_by(PermissionModel.name)
+			)
+			result = await self.session.execute(stmt)
+			return [PermissionMapper.to_entity(model) for model in result.scalars().all()]
+
+		direct = select(RolePermissionAssociation.permission_id).where(
+			RolePermissionAssociation.role_id.in_(role_ids)
+		)
+		inherited = (
+			select(PermissionGroupPermissionAssociation.permission_id)
+			.join(
+				RolePermissionGroupAssociation,
+				RolePermissionGroupAssociation.permission_group_id
+				== PermissionGroupPermissionAssociation.permission_group_id,
+			)
+			.where(RolePermissionGroupAssociation.role_id.in_(role_ids))
+		)
+		effective = union(direct, inherited).subquery()
+
+		stmt = (
+			select(PermissionModel)
+			.where(PermissionModel.id.in_(select(effective.c.permission_id)))
+			.order_by(PermissionModel.name)
+		)
+		result = await self.session.execute(stmt)
+		models = result.scalars().all()
+
+		return [PermissionMapper.to_entity(model) for model in models]
+
+	async def stream(self, chunk_size: int) -> AsyncIterator[list[Role]]:
+		"""
+		Stream all roles by name, chunk by chunk, from a server-side cursor.
+
+		Each chunk loads its relationship IDs with one SELECT ... IN per
+		relationship and its user counts with one GROUP BY, so memory is
+		bounded by the chunk size instead of the catalog size.
+
+		Args:
+			chunk_size: Maximum number of roles per chunk
+
+		Yields:
+			Lists of role entities with their user counts
+		"""
+		stmt = (
+			select(RoleModel)
+			.options(*_RELATED_IDS)
+			.order_by(RoleModel.name)
+			.execution_options(yield_per=chunk_size)
+		)
+		result = await self.session.stream_scalars(stmt)
+		try:
+			async for models in result.partitions():
+				yield await self._with_user_counts(models)
+		finally:
+			await result.close()
+
 	async def list(self) -> list[Role]:
 		"""
 		Retrieve all roles.
 
 		Returns:
-			List of all role entities
+			List of all role entities with their user counts
 		"""
-		stmt = select(RoleModel).order_by(RoleModel.name)
+		stmt = select(RoleModel).options(*_RELATED_IDS).order_by(RoleModel.name)
 		result = await self.session.execute(stmt)
 		models = result.scalars().all()
 
-		return [RoleMapper.to_entity(model) for model in models]
+		return await self._with_user_counts(models, all_roles=True)
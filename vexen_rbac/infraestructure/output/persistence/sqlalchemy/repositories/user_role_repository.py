@@ -0,0 +1,293 @@
+"""
+SQLAlchemy 2.0 implementation of the user ↔ role assignments with async sessions.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, delete, exists, func, literal, or_, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from vexen_rbac.domain.entity.role import Role
+from vexen_rbac.domain.entity.user_role import UserRole
+from vexen_rbac.domain.ports.user_role_repository_port import IUserRoleRepositoryPort
+from vexen_rbac.domain.vo.permission_set import (
+	SEPARATOR,
+	WILDCARD,
+	PermissionSet,
+	PermissionTrie,
+	is_wildcard,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.mappers.role_mapper import (
+	RoleMapper,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.mappers.user_role_mapper import (
+	UserRoleMapper,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.associations import (
+	PermissionGroupPermissionAssociation,
+	RolePermissionAssociation,
+	RolePermissionGroupAssociation,
+	UserRoleAssociation,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission import (
+	PermissionModel,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission_group import (
+	PermissionGroupModel,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.role import RoleModel
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.bulk import (
+	IN_CHUNK_SIZE,
+	insert_ignoring_conflicts,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.effective_permissions import (  # noqa: E501
+	effective_permission_ids,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.revision_repository import (  # noqa: E501
+	bump_revision,
+)
+
+
+async def user_counts(session: AsyncSession, role_ids: list[int] | None = None) -> dict[int, int]:
+	"""
+	Count the users assigned to roles with one GROUP BY aggregate.
+
+	Args:
+		session: Active session
+		role_ids: Roles to count (one query per IN_CHUNK_SIZE IDs), or None
+			for every role (a single query)
+
+	Returns:
+		Mapping of role ID to user count; roles without users are absent
+	"""
+	stmt = select(UserRoleAssociation.role_id, func.count()).group_by(UserRoleAssociation.role_id)
+	if role_ids is None:
+		result = await session.execute(stmt)
+		return dict(result.all())
+
+	counts: dict[int, int] = {}
+	wanted = list(dict.fromkeys(role_ids))
+	for start in range(0, len(wanted), IN_CHUNK_SIZE):
+		chunk = wanted[start : start + IN_CHUNK_SIZE]
+		result = await session.execute(stmt.where(UserRoleAssociation.role_id.in_(chunk)))
+		counts.update(result.all())
+	return counts
+
+
+class UserRoleRepository(IUserRoleRepositoryPort):
+	"""SQLAlchemy 2.0 async implementation of the user role assignments."""
+
+	def __init__(self, session: AsyncSession, materialize_effective_permissions: bool = False):
+		"""
+		Initialize repository with async session.
+
+		Args:
+			session: SQLAlchemy async session
+			materialize_effective_permissions: Read effective permissions from
+				role_effective_permissions
+		"""
+		self.session = session
+		self.materialize_effective_permissions = materialize_effective_permissions
+
+	async def assign(self, user_id: str, role_ids: list[int]) -> list[int]:
+		"""
+		Assign roles to a user with set-based INSERT ... SELECT statements.
+
+		Unknown role IDs and roles the user already has are skipped.
+
+		Args:
+			user_id: Identifier of the user
+			role_ids: IDs of the roles to assign
+
+		Returns:
+			IDs of the roles that were newly assigned, in input order
+		"""
+		candidates = list(dict.fromkeys(role_ids))
+		assigned: set[int] = set()
+		assigned_at = datetime.now()
+
+		for start in range(0, len(candidates), IN_CHUNK_SIZE):
+			chunk = candidates[start : start + IN_CHUNK_SIZE]
+			already_assigned = exists().where(
+				UserRoleAssociation.user_id == user_id,
+				UserRoleAssociation.role_id == RoleModel.id,
+			)
+			rows = select(
+				literal(user_id, String),
+				RoleModel.id,
+				literal(assigned_at, DateTime),
+			).where(RoleModel.id.in_(chunk), ~already_assigned)
+			stmt = (
+				insert_ignoring_conflicts(self.session, UserRoleAssociation)
+				.from_select(
+					[
+						UserRoleAssociation.user_id,
+						UserRoleAssociation.role_id,
+						UserRoleAssociation.assigned_at,
+					],
+					rows,
+				)
+				.returning(UserRoleAssociation.role_id)
+			)
+			result = await self.session.execute(stmt)
+			assigned.update(result.scalars().all())
+
+		if assigned:
+			await bump_revision(self.session)
+
+		return [role_id for role_id in candidates if role_id in assigned]
+
+	async def revoke(self, user_id: str, role_ids: list[int]) -> list[int]:
+		"""
+		Revoke roles from a user with DELETE ... WHERE role_id IN (...).
+
+		Args:
+			user_id: Identifier of the user
+			role_ids: IDs of the roles to revoke
+
+		Returns:
+			IDs of the roles that were actually revoked, in input order
+		"""
+		candidates = list(dict.fromkeys(role_ids))
+		revoked: set[int] = set()
+
+		for start in range(0, len(candidates), IN_CHUNK_SIZE):
+			chunk = candidates[start : start + IN_CHUNK_SIZE]
+			stmt = (
+				delete(UserRoleAssociation)
+				.where(
+					UserRoleAssociation.user_id == user_id,
+					UserRoleAssociation.role_id.in_(chunk),
+				)
+				.returning(UserRoleAssociation.role_id)
+			)
+			result = await self.session.execute(stmt)
+			revoked.update(result.scalars().all())
+
+		if revoked:
+			await bump_revision(self.session)
+
+		return [role_id for role_id in candidates if role_id in revoked]
+
+	async def list_user_roles(self, user_id: str) -> list[Role]:
+		"""
+		Retrieve the roles assigned to a user in one join.
+
+		Only the IDs of the related permissions and groups are loaded.
+
+		Args:
+			user_id: Identifier of the user
+
+		Returns:
+			List of role entities ordered by name
+		"""
+		stmt = (
+			select(RoleModel)
+			.join(UserRoleAssociation, UserRoleAssociation.role_id == RoleModel.id)
+			.where(UserRoleAssociation.user_id == user_id)
+			.options(
+				selectinload(RoleModel.permissions).load_only(PermissionModel.id),
+				selectinload(RoleModel.permission_groups).load_only(PermissionGroupModel.id),
+			)
+			.order_by(RoleModel.name)
+		)
+		result = await self.session.execute(stmt)
+
+		return [RoleMapper.to_entity(model) for model in result.scalars().all()]
+
+	async def get_permission_set(self, user_id: str) -> PermissionSet:
+		"""
+		Resolve the effective permissions of a user in a single statement.
+
+		The user's roles are joined to their direct grants and to the grants
+		inherited through permission groups, combined with a UNION. With
+		materialized effective permissions, the roles are joined to
+		role_effective_permissions instead. Wildcard grants ("tickets.*") are
+		expanded against the permission catalog with one more statement, so
+		they only match names of existing permissions, as in every other
+		engine.
+
+		Args:
+			user_id: Identifier of the user
+
+		Returns:
+			PermissionSet granted to the user (empty without roles)
+		"""
+		user_roles = select(UserRoleAssociation.role_id).where(
+			UserRoleAssociation.user_id == user_id
+		)
+
+		if self.materialize_effective_permissions:
+			effective = effective_permission_ids(user_roles)
+		else:
+			direct = select(RolePermissionAssociation.permission_id).where(
+				RolePermissionAssociation.role_id.in_(user_roles)
+			)
+			inherited = (
+				select(PermissionGroupPermissionAssociation.permission_id)
+				.join(
+					RolePermissionGroupAssociation,
+					RolePermissionGroupAssociation.permission_group_id
+					== PermissionGroupPermissionAssociation.permission_group_id,
+				)
+				.where(RolePermissionGroupAssociation.role_id.in_(user_roles))
+			)
+			effective = union(direct, inherited)
+
+		stmt = select(PermissionModel.name).where(PermissionModel.id.in_(effective))
+		result = await self.session.execute(stmt)
+		names = set(result.scalars().all())
+
+		patterns = [name for name in names if is_wildcard(name)]
+		if patterns:
+			# LIKE narrows the catalog to a superset; the trie keeps the exact matches
+			trie = PermissionTrie(patterns)
+			stmt = select(PermissionModel.name).where(
+				or_(*(PermissionModel.name.like(_like(p), escape="\\") for p in patterns))
+			)
+			result = await self.session.execute(stmt)
+			names.update(name for name in result.scalars() if trie.matches(name))
+
+		return PermissionSet(frozenset(names))
+
+	async def list_role_users(
+		self, role_id: int, page: int, page_size: int
+	) -> tuple[list[UserRole], int]:
+		"""
+		Retrieve an offset page of the users of a role, ordered by user ID.
+
+		Both queries are served by the (role_id, user_id) index.
+
+		Args:
+			role_id: ID of the role
+			page: Page number (1-based)
+			page_size: Users per page
+
+		Returns:
+			Tuple of (assignments, total assignments of the role)
+		"""
+		total = await self.session.scalar(
+			select(func.count()).where(UserRoleAssociation.role_id == role_id)
+		)
+
+		stmt = (
+			select(UserRoleAssociation)
+			.where(UserRoleAssociation.role_id == role_id)
+			.order_by(UserRoleAssociation.user_id)
+			.offset((page - 1) * page_size)
+			.limit(page_size)
+		)
+		result = await self.session.execute(stmt)
+
+		return [UserRoleMapper.to_entity(model) for model in result.scalars().all()], total or 0
+
+
+def _like(pattern: str) -> str:
+	"""Translate a wildcard permission into a LIKE pattern escaped with a backslash."""
+	return SEPARATOR.join(
+		"%"
+		if segment == WILDCARD
+		else segment.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+		for segment in pattern.split(SEPARATOR)
+	)
@@ -0,0 +1,69 @@
+"""
+PostgreSQL LISTEN/NOTIFY push source for revision changes.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from vexen_rbac.infraestructure.output.persistence.revision_watcher import RevisionNotifier
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.repositories.revision_repository import (  # noqa: E501
+	REVISION_CHANNEL,
+)
+
+
+class PostgresRevisionNotifier(RevisionNotifier):
+	"""
+	Listen for the NOTIFY that `bump_revision` queues on every committed write.
+
+	Holds one connection of the engine's pool for as long as it runs. If that
+	connection drops, notifications stop and the watcher falls back to polling.
+	Requires the asyncpg driver.
+	"""
+
+	def __init__(self, engine: AsyncEngine, channel: str = REVISION_CHANNEL):
+		"""
+		Initialize the notifier.
+
+		Args:
+			engine: Engine of the primary database
+			channel: Channel to LISTEN on
+
+		Raises:
+			ValueError: If the engine does not use the asyncpg driver
+		"""
+		if engine.dialect.driver != "asyncpg":
+			raise ValueError("Revision notifications require the postgresql+asyncpg driver")
+
+		self._engine = engine
+		self._channel = channel
+		self._connection: AsyncConnection | None = None
+		self._driver_connection: Any = None
+		self._callback: Callable[..., None] | None = None
+
+	async def start(self, on_notify: Callable[[], None]) -> None:
+		if self._connection is not None:
+			return
+
+		self._connection = await self._engine.connect()
+		raw_connection = await self._connection.get_raw_connection()
+		self._driver_connection = raw_connection.driver_connection
+
+		def callback(connection: Any, pid: int, channel: str, payload: str) -> None:
+			on_notify()
+
+		self._callback = callback
+		await self._driver_connection.add_listener(self._channel, callback)
+
+	async def stop(self) -> None:
+		if self._connection is None:
+			return
+
+		try:
+			await self._driver_connection.remove_listener(self._channel, self._callback)
+		finally:
+			await self._connection.close()
+			self._connection = None
+			self._driver_connection = None
+			self._callback = None
@@ -0,0 +1,78 @@
+"""
+SQLAlchemy unit of work: one AsyncSession and one transaction for many calls.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from vexen_rbac.infraestructure.output.persistence.unit_of_work import UnitOfWork
+
+
+class SQLAlchemyUnitOfWork(UnitOfWork):
+	"""
+	Share one session across every adapter call made inside the block.
+
+	The transaction is committed once when the block exits normally and rolled
+	back if it raises. Writes run inside a SAVEPOINT, so a use case that fails
+	(and reports it through BaseResponse) does not poison the transaction for
+	the calls that follow.
+
+	The session is not safe for concurrent use: do not run calls in parallel
+	(e.g. with asyncio.gather) inside a unit of work.
+
+	With an isolation level (e.g. "REPEATABLE READ"), the transaction is
+	started at that level, so every read in the block sees one snapshot.
+
+	Example:
+		>>> async with rbac.unit_of_work():
+		...     role = await rbac.roles.get_role(1)
+		...     await rbac.roles.add_permissions(1, [4, 5])
+	"""
+
+	def __init__(
+		self,
+		session_factory: async_sessionmaker[AsyncSession],
+		isolation_level: str | None = None,
+	):
+		"""
+		Initialize the unit of work.
+
+		Args:
+			session_factory: Factory of the adapters that should join it
+			isolation_level: Transaction isolation level; None keeps the
+				engine's default. Ignored when joining an outer unit of work
+		"""
+		super().__init__(key=session_factory)
+		self._session_factory = session_factory
+		self._isolation_level = isolation_level
+		self._session: AsyncSession | None = None
+
+	@property
+	def session(self) -> AsyncSession:
+		"""
+		Session shared by the calls inside the unit of work.
+
+		Raises:
+			RuntimeError: If the unit of work is not active
+		"""
+		if self._outer is not None:
+			return self._outer.session
+		if self._session is None:
+			raise RuntimeError("Unit of work is not active. Use 'async with rbac.unit_of_work():'.")
+		return self._session
+
+	async def _begin(self) -> None:
+		self._session = self._session_factory()
+		if self._isolation_level is not None:
+			await self._session.connection(
+				execution_options={"isolation_level": self._isolation_level}
+			)
+
+	async def _commit(self) -> None:
+		await self._session.commit()
+
+	async def _rollback(self) -> None:
+		await self._session.rollback()
+
+	async def _close(self) -> None:
+		await self._session.close()
+		self._session = None
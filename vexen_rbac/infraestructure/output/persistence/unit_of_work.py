@@ -0,0 +1,123 @@
+"""
+Request-scoped unit of work shared by the persistence adapters.
+
+While a unit of work is active (``async with uow:``), it is published through a
+context variable so adapters and cache decorators can join it without any
+change to the use case or port signatures.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+
+_active: ContextVar[tuple["UnitOfWork", ...]] = ContextVar("vexen_rbac_unit_of_work", default=())
+
+
+def active_units_of_work() -> tuple["UnitOfWork", ...]:
+	"""Return the units of work active in the current context, innermost last."""
+	return _active.get()
+
+
+class UnitOfWork(ABC):
+	"""
+	Base class for a transaction spanning many repository calls.
+
+	Subclasses implement `_begin`, `_commit`, `_rollback` and `_close`. Entering
+	a unit of work that is already active for the same key (e.g. the same
+	session factory) joins the outer one: only the outermost commits.
+
+	Callbacks registered with `after_commit` run once the outermost unit of
+	work has committed (they are dropped on rollback).
+	"""
+
+	def __init__(self, key: object):
+		"""
+		Initialize an inactive unit of work.
+
+		Args:
+			key: Identifies the resource the unit of work is bound to; adapters
+				only join units of work with their own key
+		"""
+		self.key = key
+		self._after_commit: list[Callable[[], None]] = []
+		self._token: Token | None = None
+		self._outer: UnitOfWork | None = None
+
+	@classmethod
+	def current(cls, key: object) -> "UnitOfWork | None":
+		"""
+		Find the active unit of work bound to a key.
+
+		Args:
+			key: Resource key (e.g. a session factory)
+
+		Returns:
+			The innermost active unit of work for the key, or None
+		"""
+		for unit_of_work in reversed(_active.get()):
+			if unit_of_work.key is key:
+				return unit_of_work
+		return None
+
+	def after_commit(self, callback: Callable[[], None]) -> None:
+		"""
+		Run a callback after the outermost unit of work commits.
+
+		Args:
+			callback: Synchronous callable without arguments
+		"""
+		if self._outer is not None:
+			self._outer.after_commit(callback)
+		else:
+			self._after_commit.append(callback)
+
+	async def __aenter__(self):
+		outer = type(self).current(self.key)
+		if outer is not None:
+			self._outer = outer
+			return outer
+
+		await self._begin()
+		self._token = _active.set((*_active.get(), self))
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):  # noqa: ANN001
+		if self._outer is not None:
+			self._outer = None
+			return False
+
+		_active.reset(self._token)
+		self._token = None
+		callbacks, self._after_commit = self._after_commit, []
+		try:
+			if exc_type is None:
+				await self._commit()
+			else:
+				await self._rollback()
+		finally:
+			await self._close()
+
+		if exc_type is None:
+			for callback in callbacks:
+				callback()
+		return False
+
+	@abstractmethod
+	async def _begin(self) -> None:
+		"""Start the transaction (e.g. open the shared session)."""
+		pass
+
+	@abstractmethod
+	async def _commit(self) -> None:
+		"""Commit the transaction."""
+		pass
+
+	@abstractmethod
+	async def _rollback(self) -> None:
+		"""Roll the transaction back."""
+		pass
+
+	@abstractmethod
+	async def _close(self) -> None:
+		"""Release the resources acquired by `_begin`."""
+		pass
@@ -0,0 +1,17 @@
+"""
+Memory-mappable binary snapshots of the RBAC graph for database-free checks.
+"""
+
+from vexen_rbac.infraestructure.output.snapshot.binary_snapshot import (
+	FORMAT_VERSION,
+	SnapshotAuthorizer,
+	SnapshotFormatError,
+	write_snapshot,
+)
+
+__all__ = [
+	"FORMAT_VERSION",
+	"SnapshotAuthorizer",
+	"SnapshotFormatError",
+	"write_snapshot",
+]
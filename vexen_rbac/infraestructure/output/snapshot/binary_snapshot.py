@@ -0,0 +1,400 @@
+"""
+Versioned, memory-mappable binary snapshot of the RBAC graph.
+
+Layout (little-endian; every section starts on an 8-byte boundary):
+
+	header    magic "VXRBACSN", format version (u32), section count (u32)
+	sections  (offset u64, length u64) for each entry of SECTIONS, in order
+
+Names live in one UTF-8 string table addressed by u32 offset arrays (N + 1
+entries, item i spans offsets[i]:offsets[i + 1]). Permissions are sorted by
+name, so a permission's index is its position in that order. Adjacency lists
+(permissions of a group, direct permissions and groups of a role, effective
+permissions of a role) use the same offsets + flat u32 array scheme. IDs are
+stored sorted as i64 arrays and looked up by binary search, so opening a
+snapshot does not build any per-entry Python object.
+
+Wildcard grants ("tickets.*") are expanded against the permission catalog when
+the snapshot is written: a role's effective list holds every catalog
+permission its patterns match, so names outside the catalog never match.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from pathlib import Path
+
+from vexen_rbac.domain.entity import Permission, PermissionGroup, Role
+from vexen_rbac.domain.ports import IPermissionCheckerPort
+from vexen_rbac.domain.vo import PermissionTrie
+
+MAGIC = b"VXRBACSN"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<8sII")
+SECTION_ENTRY = struct.Struct("<QQ")
+
+SECTIONS = (
+	("strings", "B"),
+	("permission_ids", "q"),
+	("permission_names", "I"),
+	("group_ids", "q"),
+	("group_names", "I"),
+	("group_permission_offsets", "I"),
+	("group_permissions", "I"),
+	("role_ids", "q"),
+	("role_names", "I"),
+	("role_permission_offsets", "I"),
+	("role_permissions", "I"),
+	("role_group_offsets", "I"),
+	("role_groups", "I"),
+	("role_effective_offsets", "I"),
+	("role_effective", "I"),
+)
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class SnapshotFormatError(ValueError):
+	"""Raised when a file is not a snapshot or uses an unsupported version."""
+
+
+def write_snapshot(
+	path: str | os.PathLike,
+	roles: Sequence[Role],
+	permission_groups: Sequence[PermissionGroup],
+	permissions: Sequence[Permission],
+) -> int:
+	"""
+	Write the RBAC graph to a snapshot file.
+
+	The file is written next to its destination and moved into place
+	atomically, so processes that mapped the previous snapshot keep reading
+	a consistent file.
+
+	Args:
+		path: Destination file
+		roles: Roles with their direct permission and group IDs
+		permission_groups: Groups with their permission IDs
+		permissions: Full permission catalog
+
+	Returns:
+		Size of the snapshot in bytes
+	"""
+	strings = bytearray()
+
+	def add_names(names: list[str]) -> array:
+		offsets = array("I", [len(strings)])
+		for name in names:
+			strings.extend(name.encode())
+			offsets.append(len(strings))
+		return offsets
+
+	ordered_permissions = sorted(permissions, key=lambda p: p.name)
+	index_by_permission_id = {p.id: index for index, p in enumerate(ordered_permissions)}
+	ordered_groups = sorted(permission_groups, key=lambda g: g.id)
+	index_by_group_id = {g.id: index for index, g in enumerate(ordered_groups)}
+	ordered_roles = sorted(roles, key=lambda r: r.id)
+
+	group_permissions = [
+		sorted({index_by_permission_id[p] for p in g.permissions if p in index_by_permission_id})
+		for g in ordered_groups
+	]
+	role_permissions = [
+		sorted({index_by_permission_id[p] for p in r.permissions if p in index_by_permission_id})
+		for r in ordered_roles
+	]
+	role_groups = [
+		sorted({index_by_group_id[g] for g in r.permission_groups if g in index_by_group_id})
+		for r in ordered_roles
+	]
+	wildcard_indexes = {index for index, p in enumerate(ordered_permissions) if p.is_wildcard}
+	role_effective = []
+	for direct, groups in zip(role_permissions, role_groups, strict=True):
+		effective = set(direct)
+		for group_index in groups:
+			effective.update(group_permissions[group_index])
+		if not wildcard_indexes.isdisjoint(effective):
+			trie = PermissionTrie(
+				ordered_permissions[index].name for index in effective & wildcard_indexes
+			)
+			effective.update(
+				index for index, p in enumerate(ordered_permissions) if trie.matches(p.name)
+			)
+		role_effective.append(sorted(effective))
+
+	sections = {
+		"permission_ids": array("q", [p.id for p in ordered_permissions]),
+		"permission_names": add_names([p.name for p in ordered_permissions]),
+		"group_ids": array("q", [g.id for g in ordered_groups]),
+		"group_names": add_names([g.name for g in ordered_groups]),
+		"role_ids": array("q", [r.id for r in ordered_roles]),
+		"role_names": add_names([r.name for r in ordered_roles]),
+	}
+	for offsets_name, values_name, lists in (
+		("group_permission_offsets", "group_permissions", group_permissions),
+		("role_permission_offsets", "role_permissions", role_permissions),
+		("role_group_offsets", "role_groups", role_groups),
+		("role_effective_offsets", "role_effective", role_effective),
+	):
+		sections[offsets_name], sections[values_name] = _flatten(lists)
+	sections["strings"] = array("B", bytes(strings))
+
+	payloads = []
+	for name, _ in SECTIONS:
+		data = sections[name]
+		if not _LITTLE_ENDIAN:
+			data = array(data.typecode, data)
+			data.byteswap()
+		payloads.append(data.tobytes())
+
+	table_size = HEADER.size + SECTION_ENTRY.size * len(SECTIONS)
+	offset = _align(table_size)
+	entries = []
+	for payload in payloads:
+		entries.append((offset, len(payload)))
+		offset = _align(offset + len(payload))
+
+	destination = Path(path)
+	fd, temporary = tempfile.mkstemp(dir=destination.parent, prefix=f".{destination.name}.")
+	try:
+		with os.fdopen(fd, "wb") as f:
+			f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(SECTIONS)))
+			for entry in entries:
+				f.write(SECTION_ENTRY.pack(*entry))
+			for (section_offset, _), payload in zip(entries, payloads, strict=True):
+				f.write(b"\0" * (section_offset - f.tell()))
+				f.write(payload)
+			size = f.tell()
+		os.replace(temporary, destination)
+	except BaseException:
+		os.unlink(temporary)
+		raise
+	return size
+
+
+class SnapshotAuthorizer(IPermissionCheckerPort):
+	"""
+	Answers role permission checks straight from a memory-mapped snapshot.
+
+	Opening a snapshot maps the file read-only and validates its header; no
+	database access is needed. The mapping is shared by the OS page cache, so
+	many worker processes can open the same file cheaply.
+
+	Example:
+		>>> with SnapshotAuthorizer.open("rbac.snapshot") as authorizer:
+		...     authorizer.check(role_id, "tickets.write")
+		True
+	"""
+
+	def __init__(self, buffer: mmap.mmap | bytes):
+		"""
+		Wrap a snapshot buffer.
+
+		Args:
+			buffer: Snapshot contents (usually a read-only mmap)
+
+		Raises:
+			SnapshotFormatError: If the buffer is not a supported snapshot
+		"""
+		self._buffer = buffer
+		# Views must be released before the mmap can be closed
+		self._views: list[memoryview] = [memoryview(buffer)]
+		self._sections: dict[str, Sequence[int]] = {}
+		# Names found so far (bounded by the permission catalog)
+		self._permission_indexes: dict[str, int] = {}
+		try:
+			self._read_sections(self._views[0])
+		except SnapshotFormatError:
+			self._release_views()
+			raise
+
+	@classmethod
+	def open(cls, path: str | os.PathLike) -> "SnapshotAuthorizer":
+		"""
+		Memory-map a snapshot file.
+
+		Args:
+			path: Snapshot written by `write_snapshot`
+
+		Returns:
+			SnapshotAuthorizer: Authorizer backed by the mapped file
+
+		Raises:
+			SnapshotFormatError: If the file is not a supported snapshot
+		"""
+		with open(path, "rb") as f:
+			if os.fstat(f.fileno()).st_size == 0:
+				raise SnapshotFormatError("File is too small to be an RBAC snapshot")
+			buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			return cls(buffer)
+		except SnapshotFormatError:
+			buffer.close()
+			raise
+
+	@property
+	def permission_count(self) -> int:
+		"""Number of permissions in the snapshot."""
+		return len(self._sections["permission_ids"])
+
+	@property
+	def role_ids(self) -> Sequence[int]:
+		"""IDs of the roles in the snapshot, ascending."""
+		return self._sections["role_ids"]
+
+	def check(self, role_id: int, permission_name: str) -> bool:
+		"""
+		Check whether a role holds a permission.
+
+		Args:
+			role_id: ID of the role
+			permission_name: Permission name (e.g. "tickets.write")
+
+		Returns:
+			True if the role has the permission directly or through a group
+		"""
+		role = _find(self._sections["role_ids"], role_id)
+		if role is None:
+			return False
+		permission = self._permission_index(permission_name)
+		if permission is None:
+			return False
+		offsets = self._sections["role_effective_offsets"]
+		effective = self._sections["role_effective"]
+		start, end = offsets[role], offsets[role + 1]
+		position = bisect_left(effective, permission, start, end)
+		return position < end and effective[position] == permission
+
+	def permissions_of(self, role_id: int) -> set[str]:
+		"""
+		Get the effective permission names of a role.
+
+		Args:
+			role_id: ID of the role
+
+		Returns:
+			Set of permission names granted to the role
+		"""
+		role = _find(self._sections["role_ids"], role_id)
+		if role is None:
+			return set()
+		offsets = self._sections["role_effective_offsets"]
+		effective = self._sections["role_effective"]
+		return {
+			self._name("permission_names", effective[position])
+			for position in range(offsets[role], offsets[role + 1])
+		}
+
+	def close(self) -> None:
+		"""Release the mapping. The authorizer must not be used afterwards."""
+		self._release_views()
+		if isinstance(self._buffer, mmap.mmap):
+			self._buffer.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):  # noqa: ANN001
+		self.close()
+		return False
+
+	def _read_sections(self, view: memoryview) -> None:
+		if len(view) < HEADER.size:
+			raise SnapshotFormatError("File is too small to be an RBAC snapshot")
+
+		magic, version, section_count = HEADER.unpack_from(view)
+		if magic != MAGIC:
+			raise SnapshotFormatError("File is not an RBAC snapshot")
+		if version != FORMAT_VERSION:
+			raise SnapshotFormatError(
+				f"Unsupported snapshot version {version} (expected {FORMAT_VERSION})"
+			)
+		if section_count != len(SECTIONS):
+			raise SnapshotFormatError(f"Snapshot has {section_count} sections")
+		if len(view) < HEADER.size + section_count * SECTION_ENTRY.size:
+			raise SnapshotFormatError("Snapshot section table is truncated")
+
+		for position, (name, typecode) in enumerate(SECTIONS):
+			offset, length = SECTION_ENTRY.unpack_from(
+				view, HEADER.size + position * SECTION_ENTRY.size
+			)
+			if offset + length > len(view):
+				raise SnapshotFormatError(f"Snapshot section '{name}' is truncated")
+			section = view[offset : offset + length]
+			self._views.append(section)
+			values = _read_array(section, typecode)
+			if isinstance(values, memoryview):
+				self._views.append(values)
+			self._sections[name] = values
+
+	def _release_views(self) -> None:
+		self._sections = {}
+		self._permission_indexes = {}
+		for view in reversed(self._views):
+			view.release()
+		self._views = []
+
+	def _permission_index(self, permission_name: str) -> int | None:
+		index = self._permission_indexes.get(permission_name)
+		if index is None:
+			index = self._search_permission(permission_name)
+			if index is not None:
+				self._permission_indexes[permission_name] = index
+		return index
+
+	def _search_permission(self, permission_name: str) -> int | None:
+		encoded = permission_name.encode()
+		low, high = 0, self.permission_count
+		while low < high:
+			middle = (low + high) // 2
+			if self._name_bytes("permission_names", middle) < encoded:
+				low = middle + 1
+			else:
+				high = middle
+		if low < self.permission_count and self._name_bytes("permission_names", low) == encoded:
+			return low
+		return None
+
+	def _name_bytes(self, section: str, index: int) -> bytes:
+		offsets = self._sections[section]
+		return self._sections["strings"][offsets[index] : offsets[index + 1]].tobytes()
+
+	def _name(self, section: str, index: int) -> str:
+		return self._name_bytes(section, index).decode()
+
+
+def _flatten(lists: list[list[int]]) -> tuple[array, array]:
+	"""Encode adjacency lists as (offsets, flat values) arrays."""
+	offsets = array("I", [0])
+	flat = array("I")
+	for values in lists:
+		flat.extend(values)
+		offsets.append(len(flat))
+	return offsets, flat
+
+
+def _read_array(view: memoryview, typecode: str) -> Sequence[int]:
+	"""View a section as integers, without copying on little-endian hosts."""
+	if _LITTLE_ENDIAN:
+		return view.cast(typecode)
+	values = array(typecode, view.tobytes())
+	values.byteswap()
+	return values
+
+
+def _find(ids: Sequence[int], value: int) -> int | None:
+	"""Position of an ID in a sorted ID array, or None."""
+	position = bisect_left(ids, value)
+	if position < len(ids) and ids[position] == value:
+		return position
+	return None
+
+
+def _align(offset: int) -> int:
+	return (offset + 7) & ~7
@@ -14,6 +14,10 @@ Usage:
         RolePermissionAssociation,
         RolePermissionGroupAssociation,
         PermissionGroupPermissionAssociation,
+        UserRoleAssociation,
+        RoleEffectivePermissionModel,
+        RevisionModel,
+        SchemaVersionModel,
     )
 """
 
@@ -21,6 +25,7 @@ from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.association
 	PermissionGroupPermissionAssociation,
 	RolePermissionAssociation,
 	RolePermissionGroupAssociation,
+	UserRoleAssociation,
 )
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.base import Base
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission import (
@@ -29,7 +34,14 @@ from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.permission_group import (
 	PermissionGroupModel,
 )
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.revision import RevisionModel
 from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.role import RoleModel
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.role_effective_permission import (  # noqa: E501
+	RoleEffectivePermissionModel,
+)
+from vexen_rbac.infraestructure.output.persistence.sqlalchemy.models.schema_version import (
+	SchemaVersionModel,
+)
 
 __all__ = [
 	"Base",
@@ -39,4 +51,8 @@ __all__ = [
 	"RolePermissionAssociation",
 	"RolePermissionGroupAssociation",
 	"PermissionGroupPermissionAssociation",
+	"UserRoleAssociation",
+	"RoleEffectivePermissionModel",
+	"RevisionModel",
+	"SchemaVersionModel",
 ]